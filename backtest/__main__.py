@@ -10,9 +10,19 @@ def main():
     parser.add_argument("--symbol", required=True, help="Stock symbol (e.g. AAPL)")
     parser.add_argument("--period", default="2y", help="Data period (default: 2y)")
     parser.add_argument("--cash", type=float, default=100000, help="Initial cash")
+    parser.add_argument("--db", default=None, help="DuckDB path for the local price bar store")
     args = parser.parse_args()
 
-    result = run_backtest(symbol=args.symbol, period=args.period, initial_cash=args.cash)
+    bar_store = None
+    if args.db:
+        from storage.bar_store import BarStore
+
+        bar_store = BarStore(db_path=args.db)
+        bar_store.init_schema()
+
+    result = run_backtest(
+        symbol=args.symbol, period=args.period, initial_cash=args.cash, bar_store=bar_store,
+    )
     print(format_backtest_report(result))
 
 
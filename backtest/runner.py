@@ -13,16 +13,23 @@ def run_backtest(
     period: str = "2y",
     initial_cash: float = 100000,
     strategy_params: dict | None = None,
+    bar_store=None,
 ) -> dict:
     cerebro = bt.Cerebro()
 
-    # 데이터 가져오기
-    ticker = yf.Ticker(symbol)
-    df = ticker.history(period=period)
+    # 데이터 가져오기 (bar_store가 있으면 로컬 일봉 저장소에서 읽고 부족한 구간만 수집)
+    if bar_store is not None:
+        from providers.price.yfinance_provider import YFinancePriceProvider
+
+        df = YFinancePriceProvider(bar_store=bar_store).get_historical(symbol, period=period)
+    else:
+        ticker = yf.Ticker(symbol)
+        df = ticker.history(period=period)
     if df.empty:
         raise ValueError(f"No data for {symbol}")
 
-    df.index = df.index.tz_localize(None)
+    if df.index.tz is not None:
+        df.index = df.index.tz_localize(None)
     data = bt.feeds.PandasData(dataname=df)
     cerebro.adddata(data)
 
@@ -0,0 +1,103 @@
+"""get_category_sentiment_summary 벤치마크 — 카테고리별 N+1 쿼리 vs 단일 집계 쿼리.
+
+news_category_bench와 같은 합성 90일 데이터셋(기본 1M건)에서 기존 구현
+(집계 1회 + 카테고리마다 상위 헤드라인 조회)과 현재 NewsStore 구현을 비교하고
+두 결과가 같은지 확인한다.
+
+사용법:
+    python -m benchmarks.category_summary_bench [--rows 1000000] [--days 7 30 90] [--repeat 3]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.news_category_bench import populate
+from storage.news_store import NewsStore, _interval
+
+
+def _legacy_summary(store: NewsStore, days: int) -> list[dict]:
+    half = max(1, days // 2)
+    rows = store.conn.execute(f"""
+        SELECT c.name, AVG(n.sentiment_score), COUNT(*),
+               AVG(CASE WHEN n.collected_at >= CURRENT_TIMESTAMP - {_interval(half)}
+                        THEN n.sentiment_score END),
+               AVG(CASE WHEN n.collected_at <  CURRENT_TIMESTAMP - {_interval(half)}
+                             AND n.collected_at >= CURRENT_TIMESTAMP - {_interval(days)}
+                        THEN n.sentiment_score END)
+        FROM news n
+        JOIN news_categories nc ON n.id = nc.news_id
+        JOIN categories c ON nc.category_id = c.id
+        WHERE n.sentiment_score IS NOT NULL
+          AND n.collected_at >= CURRENT_TIMESTAMP - {_interval(days)}
+        GROUP BY c.name
+        ORDER BY 2 DESC
+    """).fetchall()
+
+    results = []
+    for category, avg_sent, count, recent_avg, older_avg in rows:
+        hl_rows = store.conn.execute(f"""
+            SELECT n.title_translated, n.sentiment_score
+            FROM news n
+            JOIN news_categories nc ON n.id = nc.news_id
+            JOIN categories c ON nc.category_id = c.id
+            WHERE c.name = ?
+              AND n.sentiment_score IS NOT NULL
+              AND n.collected_at >= CURRENT_TIMESTAMP - {_interval(days)}
+            ORDER BY n.sentiment_score DESC
+            LIMIT 5
+        """, [category]).fetchall()
+        results.append({
+            "category": category,
+            "avg_sentiment": float(avg_sent),
+            "news_count": int(count),
+            "recent_avg": float(recent_avg) if recent_avg is not None else None,
+            "older_avg": float(older_avg) if older_avg is not None else None,
+            "top_headlines": [(r[0], r[1]) for r in hl_rows],
+        })
+    return results
+
+
+def _comparable(summary: list[dict]) -> dict[str, list[float]]:
+    # 합성 데이터는 몇 초 간격으로 찍혀 있어 두 쿼리 사이에 기간 경계가 한두 건 움직일 수 있다.
+    # 건수/평균 대신 카테고리 구성과 상위 헤드라인 점수로 비교
+    return {s["category"]: [round(h[1], 6) for h in s["top_headlines"]] for s in summary}
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run(rows: int, days_list: list[int], repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = NewsStore(db_path=os.path.join(tmp, "bench.duckdb"))
+        store.init_schema()
+        populate(store, rows)
+
+        print(f"{'days':>5} {'legacy (ms)':>12} {'single (ms)':>12} {'speedup':>8}  categories")
+        for days in days_list:
+            expected = _legacy_summary(store, days)
+            assert _comparable(store.get_category_sentiment_summary(days)) == _comparable(expected)
+            legacy = _best_of(lambda: _legacy_summary(store, days), repeat)
+            current = _best_of(lambda: store.get_category_sentiment_summary(days), repeat)
+            print(f"{days:>5} {legacy * 1000:12.1f} {current * 1000:12.1f} {legacy / current:7.1f}x  {len(expected)}")
+        store.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, nargs="+", default=[7, 30, 90])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.rows, args.days, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
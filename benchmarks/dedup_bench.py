@@ -0,0 +1,81 @@
+"""deduplicate_similar 유사도 계산 벤치마크.
+
+기존 순수 파이썬 쌍별 코사인 비교와 정규화 행렬곱 기반 select_dissimilar를
+1536차원(text-embedding-3-small) 임베딩으로 비교한다. 순수 파이썬 구현은
+10k건에서 수 시간이 걸리므로 --max-legacy 이하 크기에서만 직접 측정하고,
+그보다 큰 크기는 O(n²) 비례로 추정한다.
+
+사용법:
+    python -m benchmarks.dedup_bench [--sizes 100 1000 10000] [--max-legacy 1000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from utils.dup_check import _cosine_similarity, select_dissimilar
+
+_DIM = 1536
+_THRESHOLD = 0.85
+
+
+def _legacy_keep(vectors: list[list[float]], threshold: float) -> list[int]:
+    removed: set[int] = set()
+    for i in range(len(vectors)):
+        if i in removed:
+            continue
+        for j in range(i + 1, len(vectors)):
+            if j not in removed and _cosine_similarity(vectors[i], vectors[j]) >= threshold:
+                removed.add(j)
+    return [i for i in range(len(vectors)) if i not in removed]
+
+
+def _make_embeddings(n: int, seed: int = 0) -> list[list[float]]:
+    """약 20%가 서로 비슷한 문장(재게시/바꿔 쓴 헤드라인)인 임베딩 생성."""
+    rng = np.random.default_rng(seed)
+    base = rng.normal(size=(n, _DIM))
+    dup_idx = rng.choice(n, size=n // 5, replace=False)
+    src_idx = rng.integers(0, n, size=len(dup_idx))
+    base[dup_idx] = base[src_idx] + rng.normal(scale=0.3, size=(len(dup_idx), _DIM))
+    return base.tolist()
+
+
+def run(sizes: list[int], max_legacy: int) -> None:
+    print(f"{'n':>7} {'numpy (s)':>11} {'legacy (s)':>12} {'speedup':>9}  kept")
+    legacy_ref: tuple[int, float] | None = None
+    for n in sizes:
+        vectors = _make_embeddings(n)
+
+        started = time.perf_counter()
+        kept = select_dissimilar(vectors, _THRESHOLD)
+        fast = time.perf_counter() - started
+
+        if n <= max_legacy:
+            started = time.perf_counter()
+            expected = _legacy_keep(vectors, _THRESHOLD)
+            legacy = time.perf_counter() - started
+            assert kept == expected, f"keep/drop mismatch at n={n}"
+            legacy_ref = (n, legacy)
+            legacy_label = f"{legacy:12.3f}"
+        elif legacy_ref is not None:
+            ref_n, ref_t = legacy_ref
+            legacy = ref_t * (n / ref_n) ** 2
+            legacy_label = f"{'~' + format(legacy, '.1f'):>12}"
+        else:
+            legacy = float("nan")
+            legacy_label = f"{'n/a':>12}"
+
+        print(f"{n:>7} {fast:11.3f} {legacy_label} {legacy / fast:8.0f}x  {len(kept)}/{n}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--max-legacy", type=int, default=1000, help="순수 파이썬 구현을 직접 측정할 최대 크기")
+    args = parser.parse_args()
+    run(args.sizes, args.max_legacy)
+
+
+if __name__ == "__main__":
+    main()
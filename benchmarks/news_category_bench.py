@@ -0,0 +1,158 @@
+"""NewsStore 카테고리 조회 벤치마크 — news_categories 조인 vs category_mask 단일 테이블 스캔.
+
+합성 뉴스 N건(기본 1M, 90일 분포, 건당 1~2개 카테고리)을 만든 뒤
+기존 3-테이블 LEFT JOIN + GROUP BY 쿼리와 현재 NewsStore 메서드의 실행 시간을 비교한다.
+
+사용법:
+    python -m benchmarks.news_category_bench [--rows 1000000] [--repeat 3]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from storage.news_store import NewsStore
+
+_LEGACY_SELECT = """
+    SELECT n.id, n.title_original, n.title_translated, n.source, n.link,
+           n.published_at, n.collected_at, n.sentiment_score, n.related_symbols,
+           list(c.name ORDER BY c.id) AS categories
+    FROM news n
+    LEFT JOIN news_categories nc ON n.id = nc.news_id
+    LEFT JOIN categories c ON nc.category_id = c.id
+"""
+_LEGACY_GROUP_BY = """
+    GROUP BY n.id, n.title_original, n.title_translated, n.source, n.link,
+             n.published_at, n.collected_at, n.sentiment_score, n.related_symbols
+"""
+
+LEGACY_QUERIES = {
+    "search_by_keyword": (
+        _LEGACY_SELECT
+        + """WHERE (n.title_original ILIKE ? OR n.title_translated ILIKE ?)
+               AND n.collected_at >= CURRENT_TIMESTAMP - INTERVAL '30' DAY"""
+        + _LEGACY_GROUP_BY
+        + "ORDER BY n.published_at DESC NULLS LAST LIMIT 50",
+        ["%Tesla%", "%Tesla%"],
+    ),
+    "search_by_symbol": (
+        _LEGACY_SELECT
+        + """WHERE list_contains(n.related_symbols, ?)
+               AND n.collected_at >= CURRENT_TIMESTAMP - INTERVAL '30' DAY"""
+        + _LEGACY_GROUP_BY
+        + "ORDER BY n.published_at DESC NULLS LAST LIMIT 50",
+        ["AAPL"],
+    ),
+    "get_recent_headlines": (
+        _LEGACY_SELECT
+        + "WHERE n.collected_at >= CURRENT_TIMESTAMP - INTERVAL '24' HOUR"
+        + _LEGACY_GROUP_BY
+        + "ORDER BY n.published_at DESC NULLS LAST LIMIT 100",
+        [],
+    ),
+    "get_negative_news": (
+        _LEGACY_SELECT
+        + """WHERE n.sentiment_score IS NOT NULL AND n.sentiment_score <= -0.3
+               AND n.collected_at >= CURRENT_TIMESTAMP - INTERVAL '7' DAY"""
+        + _LEGACY_GROUP_BY
+        + "ORDER BY n.sentiment_score ASC LIMIT 50",
+        [],
+    ),
+    "search_by_category": (
+        """
+        SELECT n.id, n.title_original, n.title_translated, n.source, n.link,
+               n.published_at, n.collected_at, n.sentiment_score, n.related_symbols,
+               list(c2.name ORDER BY c2.id) AS categories
+        FROM news n
+        JOIN news_categories nc ON n.id = nc.news_id
+        JOIN categories c ON nc.category_id = c.id
+        LEFT JOIN news_categories nc2 ON n.id = nc2.news_id
+        LEFT JOIN categories c2 ON nc2.category_id = c2.id
+        WHERE c.name = ?
+          AND n.collected_at >= CURRENT_TIMESTAMP - INTERVAL '30' DAY
+        """
+        + _LEGACY_GROUP_BY
+        + "ORDER BY n.published_at DESC NULLS LAST LIMIT 50",
+        ["반도체/AI"],
+    ),
+}
+
+CURRENT_CALLS = {
+    "search_by_keyword": lambda s: s.search_by_keyword("Tesla"),
+    "search_by_symbol": lambda s: s.search_by_symbol("AAPL"),
+    "get_recent_headlines": lambda s: s.get_recent_headlines(),
+    "get_negative_news": lambda s: s.get_negative_news(),
+    "search_by_category": lambda s: s.search_by_category("반도체/AI"),
+}
+
+
+def populate(store: NewsStore, rows: int) -> None:
+    """합성 데이터 생성. category_mask와 news_categories를 같은 분포로 채운다."""
+    store.conn.execute(
+        """
+        INSERT INTO news (id, title_original, title_translated, source, link, published_at,
+                          collected_at, sentiment_score, related_symbols, title_hash, category_mask)
+        SELECT i,
+               CASE WHEN i % 50 = 0 THEN 'Tesla headline ' ELSE 'Market headline ' END || i,
+               '번역 ' || i,
+               'financialjuice',
+               'https://example.com/' || i,
+               ts, ts,
+               (random() * 2 - 1)::REAL,
+               CASE WHEN i % 20 = 0 THEN ['AAPL'] ELSE ['MSFT'] END,
+               md5(i::VARCHAR),
+               (1 << (i % 16)) | (CASE WHEN i % 3 = 0 THEN 1 << ((i * 7) % 16) ELSE 0 END)
+        FROM (
+            SELECT range AS i,
+                   CURRENT_TIMESTAMP::TIMESTAMP - to_seconds((range * 7776000 // ?)::BIGINT) AS ts
+            FROM range(1, ? + 1)
+        )
+        """,
+        [rows, rows],
+    )
+    store.conn.execute(
+        """
+        INSERT INTO news_categories (news_id, category_id)
+        SELECT n.id, c.id
+        FROM news n
+        JOIN categories c ON (n.category_mask & (1 << (c.id - 1))) != 0
+        """
+    )
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run(rows: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = NewsStore(db_path=os.path.join(tmp, "bench.duckdb"))
+        store.init_schema()
+        started = time.perf_counter()
+        populate(store, rows)
+        print(f"populated {rows:,} rows in {time.perf_counter() - started:.1f}s\n")
+
+        print(f"{'query':<22} {'join (ms)':>10} {'mask (ms)':>10} {'speedup':>8}")
+        for name, (sql, params) in LEGACY_QUERIES.items():
+            legacy = _best_of(lambda: store.conn.execute(sql, params).fetchall(), repeat)
+            current = _best_of(lambda: CURRENT_CALLS[name](store), repeat)
+            print(f"{name:<22} {legacy * 1000:10.1f} {current * 1000:10.1f} {legacy / current:7.1f}x")
+        store.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""StockScreener 사전 필터 벤치마크 — 종목별 루프 vs (날짜 x 종목) 행렬 연산.
+
+yf.download(group_by="ticker") 형태의 합성 1개월 OHLCV(기본 3,000종목, 1%는 상장 전
+구간, 1%는 중간 결측)를 만든 뒤, 종목별로 raw[sym]을 잘라 평균 거래량/RSI를 계산하던
+기존 루프와 _prefilter()의 실행 시간을 비교하고 통과 목록이 같은지 확인한다.
+
+사용법:
+    python -m benchmarks.screener_prefilter_bench [--symbols 3000] [--repeat 3]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from indicators.technical import compute_rsi
+from screener.stock_screener import _prefilter
+
+_DAYS = 22
+_MIN_AVG_VOLUME = 500_000
+_MAX_RSI = 40
+
+
+def _legacy_prefilter(raw: pd.DataFrame, symbols: list[str]) -> list[str]:
+    passed = []
+    for sym in symbols:
+        if sym not in raw.columns.get_level_values(0):
+            continue
+        df = raw[sym].dropna(how="all")
+        if df.empty or df["Volume"].mean() < _MIN_AVG_VOLUME:
+            continue
+        rsi = compute_rsi(df["Close"], period=14).iloc[-1]
+        if pd.isna(rsi) or rsi > _MAX_RSI:
+            continue
+        passed.append(sym)
+    return passed
+
+
+def _make_download(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2025-01-02", periods=_DAYS, freq="B")
+    frames = {}
+    for i in range(n):
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, _DAYS)))
+        df = pd.DataFrame(
+            {"Open": close, "High": close, "Low": close, "Close": close,
+             "Volume": rng.integers(100_000, 3_000_000, _DAYS).astype(float)},
+            index=dates,
+        )
+        if i % 100 == 1:
+            df.iloc[:5] = np.nan
+        elif i % 100 == 2:
+            df.iloc[7] = np.nan
+        frames[f"S{i:04d}"] = df
+    return pd.concat(frames, axis=1)
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run(n: int, repeat: int) -> None:
+    raw = _make_download(n)
+    symbols = list(raw.columns.get_level_values(0).unique())
+
+    expected = _legacy_prefilter(raw, symbols)
+    passed = list(_prefilter(raw, symbols, _MIN_AVG_VOLUME, _MAX_RSI).index)
+    assert passed == expected, "pass list mismatch"
+
+    legacy = _best_of(lambda: _legacy_prefilter(raw, symbols), repeat)
+    current = _best_of(lambda: _prefilter(raw, symbols, _MIN_AVG_VOLUME, _MAX_RSI), repeat)
+    print(f"{n:,} symbols, {len(passed)} passed")
+    print(f"{'loop (ms)':>10} {'matrix (ms)':>12} {'speedup':>8}")
+    print(f"{legacy * 1000:10.1f} {current * 1000:12.1f} {legacy / current:7.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbols", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.symbols, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
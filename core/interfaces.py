@@ -8,6 +8,9 @@ from core.models import FundamentalData, ScreenerResult, StockQuote
 class PriceProvider(Protocol):
     def get_current_price(self, symbol: str) -> StockQuote: ...
     def get_historical(self, symbol: str, period: str) -> pd.DataFrame: ...
+    def get_historical_many(
+        self, symbols: list[str], period: str
+    ) -> tuple[dict[str, pd.DataFrame], dict[str, str]]: ...
 
 
 class FundamentalProvider(Protocol):
@@ -34,6 +34,7 @@ class FundamentalData:
     psr: Optional[float] = None
     roe: Optional[float] = None
     debt_to_equity: Optional[float] = None
+    name: Optional[str] = None
 
 
 @dataclass
@@ -47,8 +47,10 @@ class RSSFetcher:
         self.session.headers.update({'User-Agent': self.user_agent})
 
     def fetch(self, url: str, retries: int = 3) -> str:
-        """RSS 피드를 가져옵니다"""
+        """RSS 피드를 가져옵니다 (retries는 총 요청 횟수)"""
         _validate_url(url)
+        if retries < 1:
+            raise ValueError(f"retries는 1 이상이어야 합니다: {retries}")
         for attempt in range(retries):
             try:
                 response = self.session.get(url, timeout=self.timeout)
@@ -60,8 +62,10 @@ class RSSFetcher:
                 time.sleep(1)  # 재시도 전 대기
 
     def fetch_with_info(self, url: str, retries: int = 3) -> Dict[str, Any]:
-        """RSS 피드와 추가 정보를 함께 가져옵니다"""
+        """RSS 피드와 추가 정보를 함께 가져옵니다 (retries는 총 요청 횟수)"""
         _validate_url(url)
+        if retries < 1:
+            raise ValueError(f"retries는 1 이상이어야 합니다: {retries}")
         for attempt in range(retries):
             try:
                 response = self.session.get(url, timeout=self.timeout)
@@ -5,6 +5,8 @@ from typing import Optional
 
 from openai import OpenAI
 
+from storage.llm_cache import prompt_version
+
 logger = logging.getLogger(__name__)
 
 SENTIMENT_PROMPT = """Analyze the sentiment of the following financial news headlines.
@@ -24,23 +26,38 @@ Headlines:
 {headlines}
 """
 
+_SYSTEM_PROMPT = "You are a financial sentiment analyzer. Respond with only a number."
+_BATCH_SYSTEM_PROMPT = "You are a financial sentiment analyzer. Respond with only a JSON array of floats."
+
+# 캐시 키에 들어가는 프롬프트 버전
+_AVG_VERSION = prompt_version(_SYSTEM_PROMPT, SENTIMENT_PROMPT)
+_BATCH_VERSION = prompt_version(_BATCH_SYSTEM_PROMPT, SENTIMENT_BATCH_PROMPT)
+
 
 class SentimentAnalyzer:
-    def __init__(self, model: str = "gpt-4o-mini", api_key: Optional[str] = None):
+    def __init__(self, model: str = "gpt-4o-mini", api_key: Optional[str] = None, cache=None):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.client = OpenAI(api_key=self.api_key) if self.api_key else None
         self.model = model
+        # 선택: storage.llm_cache.LLMCache — 같은 헤드라인은 API 요청 없이 재사용
+        self.cache = cache
 
     def analyze(self, headlines: list[str]) -> float:
         if not headlines or not self.client:
             return 0.0
 
+        cache_text = "\n".join(headlines)
+        if self.cache is not None:
+            cached = self.cache.get("sentiment_avg", self.model, _AVG_VERSION, cache_text)
+            if cached is not None:
+                return cached
+
         try:
             prompt = SENTIMENT_PROMPT.format(headlines="\n".join(f"- {h}" for h in headlines))
             request_params = {
                 "model": self.model,
                 "messages": [
-                    {"role": "system", "content": "You are a financial sentiment analyzer. Respond with only a number."},
+                    {"role": "system", "content": _SYSTEM_PROMPT},
                     {"role": "user", "content": prompt},
                 ],
                 "temperature": 0.1,
@@ -50,17 +67,31 @@ class SentimentAnalyzer:
             response = self.client.chat.completions.create(**request_params)
             score_text = response.choices[0].message.content.strip()
             logger.debug("OpenAI response: %s", score_text)
-            score = float(score_text)
-            return max(-1.0, min(1.0, score))
+            score = max(-1.0, min(1.0, float(score_text)))
+            if self.cache is not None:
+                self.cache.put("sentiment_avg", self.model, _AVG_VERSION, cache_text, score)
+            return score
         except Exception as e:
             logger.error("Sentiment analysis failed: %s", e)
             return 0.0
 
     def analyze_batch(self, headlines: list[str]) -> list[float]:
-        """헤드라인 목록을 한 번의 API 호출로 개별 감성점수 리스트로 반환."""
+        """헤드라인 목록을 한 번의 API 호출로 개별 감성점수 리스트로 반환.
+
+        캐시가 있으면 캐시에 없는 헤드라인만 요청한다.
+        """
         if not headlines or not self.client:
             return [0.0] * len(headlines)
 
+        cached: dict[str, float] = {}
+        if self.cache is not None:
+            cached = self.cache.get_many("sentiment", self.model, _BATCH_VERSION, headlines)
+        pending = [h for h in dict.fromkeys(headlines) if h not in cached]
+        if pending:
+            cached.update(self._analyze_batch_uncached(pending))
+        return [cached.get(h, 0.0) for h in headlines]
+
+    def _analyze_batch_uncached(self, headlines: list[str]) -> dict[str, float]:
         try:
             prompt = SENTIMENT_BATCH_PROMPT.format(
                 headlines="\n".join(f"{i+1}. {h}" for i, h in enumerate(headlines))
@@ -68,7 +99,7 @@ class SentimentAnalyzer:
             request_params = {
                 "model": self.model,
                 "messages": [
-                    {"role": "system", "content": "You are a financial sentiment analyzer. Respond with only a JSON array of floats."},
+                    {"role": "system", "content": _BATCH_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt},
                 ],
                 "temperature": 0.1,
@@ -88,12 +119,17 @@ class SentimentAnalyzer:
             if not isinstance(scores, list):
                 raise ValueError(f"Expected list, got {type(scores)}")
 
-            result = [max(-1.0, min(1.0, float(s))) for s in scores]
-            # 개수 불일치 시 0.0으로 채움
-            if len(result) < len(headlines):
-                result.extend([0.0] * (len(headlines) - len(result)))
-            return result[:len(headlines)]
+            # 개수가 다르면 항목이 빠지거나 합쳐진 것이라 순서 대응을 믿을 수 없다 —
+            # 캐시하지 않고 빈 결과를 반환해 호출부에서 0.0으로 채운다 (다음 사이클에 다시 요청)
+            if len(scores) != len(headlines):
+                logger.warning("Batch sentiment returned %d/%d scores, discarding", len(scores), len(headlines))
+                return {}
+
+            result = dict(zip(headlines, (max(-1.0, min(1.0, float(s))) for s in scores)))
+            if self.cache is not None:
+                self.cache.put_many("sentiment", self.model, _BATCH_VERSION, result)
+            return result
 
         except Exception as e:
             logger.error("Batch sentiment analysis failed: %s", e)
-            return [0.0] * len(headlines)
+            return {}
@@ -0,0 +1,278 @@
+"""종목별 증분 지표 상태.
+
+RSI(Wilder EWM), MACD EMA, 이동평균, 볼린저 밴드를 새 봉 하나당 O(1)로 갱신한다.
+과거 데이터로 한 번 초기화한 뒤 update()로 확정 봉을 반영하고, 장중 시세는
+peek()으로 상태를 바꾸지 않고 평가한다. 결과는 indicators.technical의
+calculate_indicators()와 같은 값을 낸다 (EWM은 pandas와 같은 점화식 사용).
+"""
+
+import json
+import logging
+import math
+import os
+from collections import deque
+from typing import Iterable, Optional
+
+from core.models import IndicatorResult
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_STATE_FILE = "./data/indicator_states.json"
+
+
+class _Ewm:
+    """pandas ewm().mean()과 같은 점화식의 지수 가중 평균."""
+
+    def __init__(self, alpha: float, adjust: bool, min_periods: int = 0):
+        self.alpha = alpha
+        self.adjust = adjust
+        self.min_periods = max(min_periods, 1)
+        self.weighted = math.nan
+        self.old_wt = 1.0
+        self.nobs = 0
+
+    def _step(self, value: float) -> tuple[float, float, int]:
+        if value != value:  # NaN은 관측치로 세지 않음 (앞쪽 결측)
+            return self.weighted, self.old_wt, self.nobs
+        if self.nobs == 0:
+            return value, 1.0, 1
+
+        new_wt = 1.0 if self.adjust else self.alpha
+        old_wt = self.old_wt * (1 - self.alpha)
+        weighted = self.weighted
+        if weighted != value:
+            weighted = (old_wt * weighted + new_wt * value) / (old_wt + new_wt)
+        old_wt = old_wt + new_wt if self.adjust else 1.0
+        return weighted, old_wt, self.nobs + 1
+
+    def update(self, value: float) -> float:
+        self.weighted, self.old_wt, self.nobs = self._step(value)
+        return self.value
+
+    def peek(self, value: float) -> float:
+        weighted, _, nobs = self._step(value)
+        return weighted if nobs >= self.min_periods else math.nan
+
+    @property
+    def value(self) -> float:
+        return self.weighted if self.nobs >= self.min_periods else math.nan
+
+    def to_dict(self) -> dict:
+        return {"weighted": _encode(self.weighted), "old_wt": self.old_wt, "nobs": self.nobs}
+
+    def load(self, data: dict) -> None:
+        self.weighted = _decode(data["weighted"])
+        self.old_wt = data["old_wt"]
+        self.nobs = data["nobs"]
+
+
+class _RollingWindow:
+    """고정 길이 구간의 합/제곱합. 첫 값 기준으로 이동해 누적 오차를 줄인다."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.values: deque[float] = deque(maxlen=period)
+        self._shift = 0.0
+        self._sum = 0.0
+        self._sumsq = 0.0
+
+    def _reset(self, values: Iterable[float]) -> None:
+        self.values = deque(values, maxlen=self.period)
+        self._shift = self.values[0] if self.values else 0.0
+        self._sum = sum(v - self._shift for v in self.values)
+        self._sumsq = sum((v - self._shift) ** 2 for v in self.values)
+
+    def _next_sums(self, value: float) -> tuple[float, float, int]:
+        if not self.values:
+            self._shift = value
+        x = value - self._shift
+        total, total_sq, n = self._sum + x, self._sumsq + x * x, len(self.values) + 1
+        if n > self.period:
+            old = self.values[0] - self._shift
+            total, total_sq, n = total - old, total_sq - old * old, self.period
+        return total, total_sq, n
+
+    def update(self, value: float) -> None:
+        self._sum, self._sumsq, _ = self._next_sums(value)
+        self.values.append(value)
+
+    def stats(self, value: Optional[float] = None) -> tuple[float, float]:
+        """(평균, 표본표준편차). value를 주면 해당 값이 추가된 것으로 가정해 계산."""
+        if value is None:
+            total, total_sq, n = self._sum, self._sumsq, len(self.values)
+        else:
+            total, total_sq, n = self._next_sums(value)
+        if n < self.period:
+            return math.nan, math.nan
+        mean = total / n
+        var = max(total_sq - total * mean, 0.0) / (n - 1) if n > 1 else math.nan
+        return mean + self._shift, math.sqrt(var)
+
+
+class IndicatorState:
+    """종목 하나의 증분 지표 상태. 설정 키는 calculate_indicators()와 동일."""
+
+    def __init__(self, symbol: str, config: dict):
+        ind_cfg = config.get("indicators", {})
+        self.symbol = symbol
+        self.config = {"indicators": dict(ind_cfg)}
+        self.as_of: Optional[str] = None
+        self.last_close: Optional[float] = None
+
+        rsi_period = ind_cfg.get("rsi_period", 14)
+        self._gain = _Ewm(1 / rsi_period, adjust=True, min_periods=rsi_period)
+        self._loss = _Ewm(1 / rsi_period, adjust=True, min_periods=rsi_period)
+
+        self._ema_fast = _Ewm(2 / (ind_cfg.get("macd_fast", 12) + 1), adjust=False)
+        self._ema_slow = _Ewm(2 / (ind_cfg.get("macd_slow", 26) + 1), adjust=False)
+        self._ema_signal = _Ewm(2 / (ind_cfg.get("macd_signal", 9) + 1), adjust=False)
+
+        self._sma = {p: _RollingWindow(p) for p in ind_cfg.get("sma_periods", [20, 50, 200])}
+        self._bb = _RollingWindow(ind_cfg.get("bollinger_period", 20))
+        self._bb_std = ind_cfg.get("bollinger_std", 2)
+
+    @classmethod
+    def from_history(cls, symbol: str, closes: Iterable[float], config: dict) -> "IndicatorState":
+        """과거 종가(오래된 순)로 상태 초기화."""
+        state = cls(symbol, config)
+        for close in closes:
+            state.update(float(close))
+        return state
+
+    def _windows(self) -> list[_RollingWindow]:
+        return list(self._sma.values()) + [self._bb]
+
+    def update(self, close: float, as_of: Optional[str] = None) -> IndicatorResult:
+        """확정된 봉 하나를 반영하고 최신 지표 반환."""
+        gain, loss = self._gain_loss(close)
+        self._gain.update(gain)
+        self._loss.update(loss)
+
+        fast = self._ema_fast.update(close)
+        slow = self._ema_slow.update(close)
+        self._ema_signal.update(fast - slow)
+
+        for window in self._windows():
+            window.update(close)
+
+        self.last_close = close
+        if as_of is not None:
+            self.as_of = as_of
+        return self.result()
+
+    def peek(self, price: float) -> IndicatorResult:
+        """장중 시세로 평가 — 상태는 바꾸지 않고 현재 봉이 price로 마감된다고 가정."""
+        gain, loss = self._gain_loss(price)
+        fast = self._ema_fast.peek(price)
+        slow = self._ema_slow.peek(price)
+        macd = fast - slow
+        signal = self._ema_signal.peek(macd)
+        return self._build(
+            rsi=_rsi(self._gain.peek(gain), self._loss.peek(loss)),
+            macd=macd,
+            signal=signal,
+            sma={p: w.stats(price)[0] for p, w in self._sma.items()},
+            bb=self._bb.stats(price),
+        )
+
+    def result(self) -> IndicatorResult:
+        fast, slow = self._ema_fast.value, self._ema_slow.value
+        return self._build(
+            rsi=_rsi(self._gain.value, self._loss.value),
+            macd=fast - slow,
+            signal=self._ema_signal.value,
+            sma={p: w.stats()[0] for p, w in self._sma.items()},
+            bb=self._bb.stats(),
+        )
+
+    def _gain_loss(self, close: float) -> tuple[float, float]:
+        # 첫 봉은 diff가 NaN → compute_rsi와 같이 상승/하락폭 0으로 취급
+        delta = 0.0 if self.last_close is None else close - self.last_close
+        return max(delta, 0.0), max(-delta, 0.0)
+
+    def _build(self, rsi: float, macd: float, signal: float, sma: dict, bb: tuple[float, float]) -> IndicatorResult:
+        middle, std = bb
+        return IndicatorResult(
+            symbol=self.symbol,
+            rsi=_or_none(rsi),
+            macd=_or_none(macd),
+            macd_signal=_or_none(signal),
+            macd_histogram=_or_none(macd - signal),
+            sma={p: _or_none(v) for p, v in sma.items()},
+            bollinger_upper=_or_none(middle + self._bb_std * std),
+            bollinger_middle=_or_none(middle),
+            bollinger_lower=_or_none(middle - self._bb_std * std),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "symbol": self.symbol,
+            "config": self.config,
+            "as_of": self.as_of,
+            "last_close": self.last_close,
+            "gain": self._gain.to_dict(),
+            "loss": self._loss.to_dict(),
+            "ema_fast": self._ema_fast.to_dict(),
+            "ema_slow": self._ema_slow.to_dict(),
+            "ema_signal": self._ema_signal.to_dict(),
+            "sma": {str(p): list(w.values) for p, w in self._sma.items()},
+            "bollinger": list(self._bb.values),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "IndicatorState":
+        state = cls(data["symbol"], data["config"])
+        state.as_of = data.get("as_of")
+        state.last_close = data.get("last_close")
+        state._gain.load(data["gain"])
+        state._loss.load(data["loss"])
+        state._ema_fast.load(data["ema_fast"])
+        state._ema_slow.load(data["ema_slow"])
+        state._ema_signal.load(data["ema_signal"])
+        for p, values in data["sma"].items():
+            state._sma[int(p)]._reset(values)
+        state._bb._reset(data["bollinger"])
+        return state
+
+
+def _rsi(avg_gain: float, avg_loss: float) -> float:
+    if math.isnan(avg_gain) or math.isnan(avg_loss):
+        return math.nan
+    if avg_loss == 0:
+        # pandas: x/0 = inf → RSI 100, 0/0 = NaN
+        return 100.0 if avg_gain > 0 else math.nan
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+def _or_none(value: float) -> Optional[float]:
+    return None if value is None or math.isnan(value) else float(value)
+
+
+def _encode(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+def _decode(value: Optional[float]) -> float:
+    return math.nan if value is None else value
+
+
+def save_states(states: dict[str, IndicatorState], path: str = _DEFAULT_STATE_FILE) -> None:
+    """종목별 상태를 JSON 파일로 저장 (임시 파일에 쓴 뒤 교체)."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({symbol: state.to_dict() for symbol, state in states.items()}, f)
+    os.replace(tmp_path, path)
+
+
+def load_states(path: str = _DEFAULT_STATE_FILE) -> dict[str, IndicatorState]:
+    """저장된 상태 로드. 파일이 없거나 손상되었으면 빈 dict 반환."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r") as f:
+            raw = json.load(f)
+        return {symbol: IndicatorState.from_dict(data) for symbol, data in raw.items()}
+    except Exception as e:
+        logger.warning("Failed to load indicator states from %s: %s", path, e)
+        return {}
@@ -1,12 +1,18 @@
+from typing import Optional, Sequence
+
+import numpy as np
 import pandas as pd
 
 from core.models import IndicatorResult
 
 
 def compute_rsi(series: pd.Series, period: int = 14) -> pd.Series:
+    """RSI (Wilder EWM). 종목별 컬럼을 가진 DataFrame에도 그대로 적용된다."""
     delta = series.diff()
-    gain = delta.where(delta > 0, 0.0)
-    loss = (-delta).where(delta < 0, 0.0)
+    # 상장 전 등 앞쪽 NaN 구간은 0이 아닌 결측으로 두어야 EWM 시작점이 종목 단독 계산과 같아진다
+    listed = series.ffill().notna()
+    gain = delta.where(delta > 0, 0.0).where(listed)
+    loss = (-delta).where(delta < 0, 0.0).where(listed)
     avg_gain = gain.ewm(alpha=1 / period, min_periods=period).mean()
     avg_loss = loss.ewm(alpha=1 / period, min_periods=period).mean()
     rs = avg_gain / avg_loss
@@ -77,3 +83,87 @@ def calculate_indicators(
         bollinger_middle=float(bb_middle.iloc[-1]) if pd.notna(bb_middle.iloc[-1]) else None,
         bollinger_lower=float(bb_lower.iloc[-1]) if pd.notna(bb_lower.iloc[-1]) else None,
     )
+
+
+def _last_or_none(value) -> Optional[float]:
+    return float(value) if pd.notna(value) else None
+
+
+def _is_panel_aligned(column: pd.Series) -> bool:
+    """앞쪽 NaN 이후 마지막 행까지 빈 값이 없는지 (중간/끝 결측이 없는지)."""
+    valid = column.notna().to_numpy()
+    if not valid.any():
+        return False
+    return bool(valid[valid.argmax():].all())
+
+
+def calculate_indicators_panel(
+    close: pd.DataFrame | np.ndarray,
+    config: dict,
+    symbols: Optional[Sequence[str]] = None,
+) -> dict[str, IndicatorResult]:
+    """여러 종목의 종가 패널에서 지표를 한 번에 계산.
+
+    close는 (날짜 x 종목) 형태의 wide DataFrame 또는 2차원 배열이며, 배열이면
+    symbols로 컬럼 이름을 지정한다. 각 지표를 전 종목에 대해 한 번의 벡터 연산으로
+    계산하고, 결과는 종목별 calculate_indicators()와 동일하다.
+
+    상장 전 구간(앞쪽 NaN)은 패널에서 그대로 처리되고, 중간이나 끝에 결측이 있는
+    종목만 결측을 제거한 뒤 종목별 경로로 계산한다. 데이터가 없는 종목은 결과에서 빠진다.
+    """
+    if isinstance(close, np.ndarray):
+        if close.ndim != 2:
+            raise ValueError(f"close panel must be 2-D, got shape {close.shape}")
+        if symbols is None or len(symbols) != close.shape[1]:
+            raise ValueError("symbols must name every column of the close array")
+        close = pd.DataFrame(close, columns=list(symbols))
+    close = close.astype(float)
+
+    aligned = [sym for sym in close.columns if _is_panel_aligned(close[sym])]
+    aligned_set = set(aligned)
+    ragged = [sym for sym in close.columns if sym not in aligned_set and close[sym].notna().any()]
+
+    results: dict[str, IndicatorResult] = {}
+    if aligned:
+        results.update(_panel_last_values(close[aligned], config))
+    for sym in ragged:
+        results[sym] = calculate_indicators(close[[sym]].dropna().rename(columns={sym: "Close"}), sym, config)
+
+    return {sym: results[sym] for sym in close.columns if sym in results}
+
+
+def _panel_last_values(close: pd.DataFrame, config: dict) -> dict[str, IndicatorResult]:
+    ind_cfg = config.get("indicators", {})
+
+    rsi = compute_rsi(close, ind_cfg.get("rsi_period", 14)).iloc[-1]
+
+    macd_line, signal_line, histogram = compute_macd(
+        close,
+        ind_cfg.get("macd_fast", 12),
+        ind_cfg.get("macd_slow", 26),
+        ind_cfg.get("macd_signal", 9),
+    )
+    macd_last, signal_last, hist_last = macd_line.iloc[-1], signal_line.iloc[-1], histogram.iloc[-1]
+
+    sma_periods = ind_cfg.get("sma_periods", [20, 50, 200])
+    sma_last = {p: compute_sma(close, p).iloc[-1] for p in sma_periods}
+
+    bb_upper, bb_middle, bb_lower = compute_bollinger(
+        close, ind_cfg.get("bollinger_period", 20), ind_cfg.get("bollinger_std", 2),
+    )
+    upper_last, middle_last, lower_last = bb_upper.iloc[-1], bb_middle.iloc[-1], bb_lower.iloc[-1]
+
+    return {
+        sym: IndicatorResult(
+            symbol=sym,
+            rsi=_last_or_none(rsi[sym]),
+            macd=_last_or_none(macd_last[sym]),
+            macd_signal=_last_or_none(signal_last[sym]),
+            macd_histogram=_last_or_none(hist_last[sym]),
+            sma={p: _last_or_none(sma_last[p][sym]) for p in sma_periods},
+            bollinger_upper=_last_or_none(upper_last[sym]),
+            bollinger_middle=_last_or_none(middle_last[sym]),
+            bollinger_lower=_last_or_none(lower_last[sym]),
+        )
+        for sym in close.columns
+    }
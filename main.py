@@ -1,7 +1,7 @@
 import logging
 import os
-from datetime import datetime
-from time import sleep
+from datetime import datetime, timedelta
+from time import monotonic, sleep
 
 import yfinance as yf
 from dotenv import load_dotenv
@@ -18,28 +18,33 @@ from crawler.rss_parser import RSSParser
 from engine.news_evaluator import NewsEvaluator
 from engine.recommender import Recommender
 from engine.sentiment import SentimentAnalyzer
-from indicators.technical import calculate_indicators
+from indicators.streaming import load_states, save_states
 from providers.fundamental.yfinance_fundamental import YFinanceFundamentalProvider
+from providers.market_data import MarketDataContext
 from providers.news.rate_limiter import RateLimiter
-from providers.news.rss_provider import RSSNewsProvider
+from providers.news.rss_provider import fetch_all_feeds
 from providers.price.yfinance_provider import YFinancePriceProvider
 from screener.stock_screener import StockScreener
+from sender.delivery_queue import DeliveryQueue
 from sender.formatters import (
+    format_cycle_digest,
     format_discovery_message,
     format_news_alert_message,
     format_signal_message,
 )
-from sender.slack_sender import SlackSender
 from sender.translator import GPTTranslator
+from utils.concurrency import TokenBucket, map_ordered
 from utils.config_loader import (
+    get_database_config,
     get_discovery_config,
+    get_fundamentals_cache_config,
     get_sector_trend_config,
+    get_slack_delivery_config,
     get_watchlist,
     is_discovery_enabled,
     load_config,
 )
-from utils.dup_check import DuplicateChecker, deduplicate_similar
-from utils.file_ctrl import save_file
+from utils.dup_check import DuplicateChecker, EmbeddingWindow, deduplicate_similar
 
 # 소스별 타이틀 prefix 매핑
 _SOURCE_PREFIXES = {"financialjuice": "FinancialJuice:"}
@@ -53,6 +58,21 @@ for _noisy_logger in ("yfinance", "httpx", "urllib3", "requests", "peewee"):
 logger = logging.getLogger(__name__)
 
 
+def _configure_duckdb(config: dict) -> None:
+    """모든 DuckDB 저장소가 공유하는 연결의 memory_limit/threads 설정."""
+    db_cfg = get_database_config(config)
+    if not db_cfg.get("enabled", False):
+        return
+
+    from storage.duckdb_manager import DuckDBManager
+
+    DuckDBManager.configure(memory_limit=db_cfg.get("memory_limit"), threads=db_cfg.get("threads"))
+    logger.info(
+        "DuckDB settings: memory_limit=%s, threads=%s",
+        db_cfg.get("memory_limit", "default"), db_cfg.get("threads", "default"),
+    )
+
+
 def _init_news_store(config: dict, read_only: bool = False):
     """DB 설정이 있으면 NewsStore를 초기화, 없으면 None 반환"""
     db_cfg = config.get("database", {})
@@ -93,11 +113,146 @@ def _init_stock_store(config: dict, read_only: bool = False):
         return None
 
 
+def _init_bar_store(config: dict, read_only: bool = False):
+    """일봉 저장소 설정이 있으면 BarStore를 초기화, 없으면 None 반환"""
+    db_cfg = config.get("database", {})
+    if not db_cfg.get("enabled", False) or not db_cfg.get("price_bars", False):
+        return None
+
+    try:
+        from storage.bar_store import BarStore
+
+        db_path = db_cfg.get("path", "./data/news.duckdb")
+        store = BarStore(db_path=db_path, read_only=read_only)
+        if not read_only:
+            store.init_schema()
+        logger.info("DuckDB bar store initialized: %s (read_only=%s)", db_path, read_only)
+        return store
+    except Exception as e:
+        logger.warning("Bar store initialization failed, continuing without it: %s", e)
+        return None
+
+
+def _init_fundamental_provider(config: dict):
+    """펀더멘털 프로바이더 생성. fundamentals_cache가 켜져 있으면 TTL 캐시로 감싼다.
+
+    ticker.info 요청은 모두 discovery.info_fetch 속도의 토큰 버킷 하나를 거친다
+    (종목 탐색, 사이클 조회, 캐시 백그라운드 갱신 공통).
+    """
+    info_fetch = get_discovery_config(config).get("info_fetch", {})
+    provider = YFinanceFundamentalProvider(
+        rate_limiter=TokenBucket(info_fetch.get("requests_per_second", 2.0), burst=info_fetch.get("burst", 2))
+    )
+    cache_cfg = get_fundamentals_cache_config(config)
+    if not cache_cfg.get("enabled", False):
+        return provider
+
+    from providers.fundamental.cached_fundamental import CachedFundamentalProvider
+
+    store = None
+    db_cfg = config.get("database", {})
+    if db_cfg.get("enabled", False):
+        try:
+            from storage.fundamental_store import FundamentalStore
+
+            store = FundamentalStore(db_path=db_cfg.get("path", "./data/news.duckdb"))
+            store.init_schema()
+        except Exception as e:
+            logger.warning("Fundamentals store initialization failed, using memory cache only: %s", e)
+            store = None
+
+    return CachedFundamentalProvider(
+        provider,
+        store=store,
+        ttl=timedelta(hours=cache_cfg.get("ttl_hours", 24)),
+        stale_ttl=timedelta(hours=cache_cfg.get("stale_hours", 72)),
+    )
+
+
+def _init_llm_cache(config: dict):
+    """llm_cache가 켜져 있으면 LLMCache를 초기화하고 오래된 항목을 정리, 아니면 None 반환"""
+    cache_cfg = config.get("llm_cache", {})
+    db_cfg = config.get("database", {})
+    if not cache_cfg.get("enabled", False) or not db_cfg.get("enabled", False):
+        return None
+
+    try:
+        from storage.llm_cache import LLMCache
+
+        db_path = db_cfg.get("path", "./data/news.duckdb")
+        cache = LLMCache(
+            db_path=db_path,
+            max_entries=cache_cfg.get("max_entries", 50_000),
+            max_age_days=cache_cfg.get("max_age_days", 30),
+            evict_interval=timedelta(hours=cache_cfg.get("evict_interval_hours", 24)),
+        )
+        cache.init_schema()
+        cache.evict()
+        logger.info("LLM cache initialized: %s", db_path)
+        return cache
+    except Exception as e:
+        logger.warning("LLM cache initialization failed, continuing without it: %s", e)
+        return None
+
+
+def _init_delivery_queue(config: dict, process_name: str | None = None) -> DeliveryQueue | None:
+    """Slack 발송 큐를 만들고 워커를 시작. Slack 자격 증명이 없으면 None 반환.
+
+    데몬과 함께 실행되는 단발 명령(--sector-trend 등)은 process_name을 넘겨 별도 outbox
+    (slack_outbox.<process_name>.json)를 쓴다. 같은 파일을 공유하면 서로의 대기 메시지를
+    다시 보내거나 저장 시 덮어쓴다.
+    """
+    cfg = get_slack_delivery_config(config)
+    outbox_path = cfg.get("outbox_path", "./data/slack_outbox.json")
+    if process_name:
+        root, ext = os.path.splitext(outbox_path)
+        outbox_path = f"{root}.{process_name}{ext}"
+    try:
+        queue = DeliveryQueue(
+            outbox_path=outbox_path,
+            min_interval=cfg.get("min_interval_seconds", 1.0),
+            max_attempts=cfg.get("max_attempts", 5),
+            timeout=cfg.get("timeout_seconds", 10),
+        )
+    except ValueError as e:
+        logger.warning("Slack delivery disabled: %s", e)
+        return None
+    return queue.start()
+
+
+def _init_embedding_window(config: dict, news_store=None) -> EmbeddingWindow:
+    """사이클 간 의미적 중복 제거용 임베딩 window 생성. DB가 있으면 최근 임베딩을 로드."""
+    dedup_cfg = config.get("news_dedup", {})
+    window = EmbeddingWindow(
+        hours=dedup_cfg.get("window_hours", 24),
+        max_items=dedup_cfg.get("window_max_items", 5000),
+    )
+    if news_store is not None:
+        try:
+            window.load(news_store)
+        except Exception as e:
+            logger.warning("Embedding window load failed, starting empty: %s", e)
+    return window
+
+
+def _init_indicator_states(config: dict) -> dict | None:
+    """indicators.state_file이 설정되어 있으면 저장된 증분 지표 상태를 로드, 아니면 None (매 사이클 전체 재계산)."""
+    path = config.get("indicators", {}).get("state_file")
+    if not path:
+        return None
+    states = load_states(path)
+    logger.info("Indicator states loaded: %d symbols from %s", len(states), path)
+    return states
+
+
 def run_news_pipeline(
     config: dict,
     dup_checker: DuplicateChecker,
     news_store=None,
     watchlist: list[str] | None = None,
+    llm_cache=None,
+    embedding_window: EmbeddingWindow | None = None,
+    delivery: DeliveryQueue | None = None,
 ) -> tuple[list[str], dict[str, list[NewsAlertItem]]]:
     """RSS 뉴스 크롤링 → 번역 → 감성점수 계산 → DB 저장 + 파일 저장 파이프라인.
 
@@ -105,6 +260,9 @@ def run_news_pipeline(
       Phase 1 - 각 소스에서 수집 + 중복 제거
       Phase 2 - 전체 신규 건을 통합 배치로 번역/감성분석/저장
 
+    embedding_window를 넘기면 최근 저장된 뉴스와도 의미적 중복을 비교하고,
+    이번 사이클에 저장한 뉴스의 임베딩을 window에 추가한다.
+
     Returns:
         (all_headlines, symbol_news_map) 튜플
         symbol_news_map: {symbol: [NewsAlertItem, ...]} — 관련 종목별 뉴스+감성
@@ -116,22 +274,28 @@ def run_news_pipeline(
     sentiment_cfg = config.get("sentiment", {})
     sentiment_analyzer = None
     if sentiment_cfg.get("enabled"):
-        sentiment_analyzer = SentimentAnalyzer(model=sentiment_cfg.get("model", "gpt-4o-mini"))
+        sentiment_analyzer = SentimentAnalyzer(model=sentiment_cfg.get("model", "gpt-4o-mini"), cache=llm_cache)
 
     # ── Phase 1: 각 소스에서 수집 + 중복 제거 ──
     # 수집 결과를 중간 구조로 모은다
-    collected: list[dict] = []  # {source, news_item, cleaned_title, file_path}
+    collected: list[dict] = []  # {source, news_item, cleaned_title}
+
+    fetch_cfg = config.get("providers", {}).get("news_fetch", {})
+    feed_results = fetch_all_feeds(
+        news_configs,
+        timeout=fetch_cfg.get("timeout", 30),
+        retries=fetch_cfg.get("retries", 2),
+        deadline=fetch_cfg.get("deadline"),
+    )
 
-    for news_cfg in news_configs:
-        url = news_cfg.get("url")
-        source = news_cfg.get("source", "unknown")
-        if not url:
+    # 수집은 병렬, 중복 체크와 병합은 설정 순서대로 순차 처리
+    for feed in feed_results:
+        source = feed.source
+        if feed.error:
             continue
 
         try:
-            provider = RSSNewsProvider(url)
-            news_items = provider.fetch_news()
-            items_with_title = [item for item in news_items if item.get("title")]
+            items_with_title = [item for item in feed.items if item.get("title")]
 
             prefix = _SOURCE_PREFIXES.get(source, "")
             titles = [item["title"].removeprefix(prefix).strip() for item in items_with_title]
@@ -155,19 +319,18 @@ def run_news_pipeline(
                         "source": source,
                         "news_item": item,
                         "cleaned_title": title,
-                        "file_path": dup_result["new"].get(title),
                     })
 
         except Exception as e:
-            logger.error("[%s] News fetch error: %s", source, e)
+            logger.error("[%s] News processing error: %s", source, e)
 
     if not collected:
         return all_headlines, symbol_news_map
 
-    # ── Phase 1.5: 유사 뉴스 중복 제거 ──
+    # ── Phase 1.5: 유사 뉴스 중복 제거 (이번 사이클 + 최근 저장 뉴스, 번역 전에 수행) ──
     dedup_cfg = config.get("news_dedup", {})
     similarity_threshold = dedup_cfg.get("similarity_threshold", 0.65)
-    collected = deduplicate_similar(collected, threshold=similarity_threshold)
+    collected = deduplicate_similar(collected, threshold=similarity_threshold, window=embedding_window)
 
     if not collected:
         return all_headlines, symbol_news_map
@@ -182,9 +345,9 @@ def run_news_pipeline(
     logger.info("Phase 2: processing %d new items from %d sources",
                 len(all_new_titles), len({c["source"] for c in collected}))
 
-    # 2-1. 번역 + 카테고리 태깅 (GPT 배치 1회)
-    translator = GPTTranslator()
-    all_translated, all_categories = translator.translate_and_categorize_titles(all_new_titles)
+    # 2-1. 번역 + 카테고리 태깅 (여러 제목을 묶은 GPT 배치 요청)
+    translator = GPTTranslator(cache=llm_cache)
+    all_translated, all_categories, _ = translator.translate_and_categorize_batch(all_new_titles)
     trans_map = dict(zip(all_new_titles, all_translated))
     cat_map = dict(zip(all_new_titles, all_categories))
 
@@ -196,17 +359,13 @@ def run_news_pipeline(
         all_scores = [None] * len(all_new_titles)
     score_map = dict(zip(all_new_titles, all_scores))
 
-    # 2-3. 파일 저장
-    for c in collected:
-        if c["file_path"]:
-            title = c["cleaned_title"]
-            save_file(file_path=c["file_path"], title=trans_map.get(title, title))
+    # 2-3. 중복 체크 저장소에 기록
+    dup_checker.mark_seen(all_new_titles)
 
     # 2-4. Slack 발송
     news_channel = os.getenv("SLACK_CHANNEL_NEWS")
-    if news_channel:
+    if news_channel and delivery is not None:
         try:
-            slack = SlackSender()
             lines = []
             for title in all_new_titles:
                 translated = trans_map.get(title, title)
@@ -214,9 +373,9 @@ def run_news_pipeline(
                 tag = " ".join(f"[{c}]" for c in cats) if cats else ""
                 lines.append(f"• {tag} {translated}" if tag else f"• {translated}")
             msg = "\n".join(lines)
-            slack.send_bot_message(channel=news_channel, message=msg)
+            delivery.enqueue_bot(channel=news_channel, message=msg)
         except Exception as e:
-            logger.error("News channel Slack send failed: %s", e)
+            logger.error("News channel Slack enqueue failed: %s", e)
 
     # 2-5. DB 저장 (소스별로 묶어서 저장)
     if news_store is not None:
@@ -241,6 +400,10 @@ def run_news_pipeline(
         for title in all_new_titles:
             extract_symbols(title, watchlist)
 
+    # 저장한 뉴스 임베딩을 window에 추가 — 다음 사이클의 재게시/바꿔 쓴 기사 중복 제거용
+    if embedding_window is not None and embed_map:
+        embedding_window.add(list(embed_map.values()), list(embed_map.keys()))
+
     # 2-6. symbol_news_map 구축
     from storage.symbol_extractor import extract_symbols
 
@@ -325,75 +488,110 @@ def _get_historical_headlines(news_store, symbol: str, days: int = 7) -> list[st
         return []
 
 
+def _analyze_symbol(
+    symbol: str,
+    headlines: list[str],
+    market_data: MarketDataContext,
+    recommender: Recommender,
+    sentiment_analyzer: SentimentAnalyzer | None,
+    news_store=None,
+    snapshots: list | None = None,
+):
+    """단일 종목 분석. 워커 스레드에서 실행되며 실패 시 None 반환.
+
+    snapshots 리스트를 넘기면 저장할 스냅샷을 추가한다 (run_stock_pipeline이 일괄 저장).
+    """
+    limits = market_data.limits
+    try:
+        data = market_data.get(symbol)
+        quote, indicators, fundamentals = data.quote, data.indicators, data.fundamentals
+
+        # 감성 분석: 현재 헤드라인 + 과거 뉴스 결합
+        sentiment_score = 0.0
+        if sentiment_analyzer:
+            # 현재 수집된 헤드라인
+            current_headlines = headlines[:10] if headlines else []
+
+            # DB에서 종목별 과거 뉴스 조회 (워커마다 별도 커서로 동시 조회, 쓰기는 저장소가 직렬화)
+            historical = _get_historical_headlines(news_store, symbol, days=7)
+
+            # 현재 + 과거 결합 (현재 뉴스 우선)
+            combined = current_headlines + historical
+            if combined:
+                with limits.limit("llm"):
+                    sentiment_score = sentiment_analyzer.analyze(combined[:20])
+
+                # 감성 점수를 DB에 역으로 저장 (최근 뉴스에 대해)
+                if news_store and historical:
+                    for record in news_store.search_by_symbol(symbol, days=1, limit=5):
+                        if record.sentiment_score is None and record.id:
+                            news_store.update_sentiment(record.id, sentiment_score)
+
+        signal = recommender.recommend(quote, indicators, fundamentals, sentiment_score)
+        logger.info("%s: %s (confidence=%.0f%%)", symbol, signal.signal_type.value, signal.confidence * 100)
+
+        # 스냅샷은 사이클 끝에 한 번에 저장 (추가 API 호출 없이 컨텍스트 데이터 재활용)
+        if snapshots is not None:
+            snapshots.append({
+                "symbol": symbol,
+                "date": quote.timestamp,
+                "quote": quote,
+                "indicators": indicators,
+                "fundamentals": fundamentals,
+            })
+        return signal
+    except Exception as e:
+        logger.error("Analysis failed for %s: %s", symbol, e)
+        return None
+
+
 def run_stock_pipeline(
     config: dict,
     symbols: list[str],
     headlines: list[str],
     news_store=None,
     stock_store=None,
+    market_data: MarketDataContext | None = None,
+    llm_cache=None,
 ) -> list:
-    """주식 분석 + 추천 파이프라인 (과거 뉴스 데이터 활용)"""
-    price_provider = YFinancePriceProvider()
-    fundamental_provider = YFinanceFundamentalProvider()
+    """주식 분석 + 추천 파이프라인 (과거 뉴스 데이터 활용).
+
+    종목별 분석은 concurrency.max_workers 크기의 스레드 풀에서 병렬 실행되고,
+    외부 API별 동시 요청 수는 concurrency.provider_limits로 제한된다. DuckDB 조회는 워커마다
+    별도 커서로 동시에 실행되고 쓰기는 DuckDBManager가 직렬화하므로 따로 제한하지 않는다.
+    반환되는 시그널 순서는 실행 순서와 무관하게 symbols 순서를 따른다.
+    market_data를 넘기면 같은 사이클의 뉴스 평가에서 조회한 데이터를 재사용한다.
+    """
+    market_data = market_data or MarketDataContext(config)
     recommender = Recommender(config)
 
     sentiment_cfg = config.get("sentiment", {})
     sentiment_analyzer = None
     if sentiment_cfg.get("enabled"):
-        sentiment_analyzer = SentimentAnalyzer(model=sentiment_cfg.get("model", "gpt-4o-mini"))
-
-    signals = []
-    for symbol in symbols:
-        try:
-            quote = price_provider.get_current_price(symbol)
-            hist = price_provider.get_historical(symbol, period="6mo")
-            indicators = calculate_indicators(hist, symbol, config)
-
-            fundamentals = None
-            try:
-                fundamentals = fundamental_provider.get_fundamentals(symbol)
-            except Exception as e:
-                logger.warning("Fundamentals failed for %s: %s", symbol, e)
-
-            # 감성 분석: 현재 헤드라인 + 과거 뉴스 결합
-            sentiment_score = 0.0
-            if sentiment_analyzer:
-                # 현재 수집된 헤드라인
-                current_headlines = headlines[:10] if headlines else []
-
-                # DB에서 종목별 과거 뉴스 조회
-                historical = _get_historical_headlines(news_store, symbol, days=7)
+        sentiment_analyzer = SentimentAnalyzer(model=sentiment_cfg.get("model", "gpt-4o-mini"), cache=llm_cache)
 
-                # 현재 + 과거 결합 (현재 뉴스 우선)
-                combined = current_headlines + historical
-                if combined:
-                    sentiment_score = sentiment_analyzer.analyze(combined[:20])
+    snapshots: list[dict] | None = [] if stock_store is not None else None
 
-                    # 감성 점수를 DB에 역으로 저장 (최근 뉴스에 대해)
-                    if news_store and historical:
-                        for record in news_store.search_by_symbol(symbol, days=1, limit=5):
-                            if record.sentiment_score is None and record.id:
-                                news_store.update_sentiment(record.id, sentiment_score)
+    def _analyze(symbol: str):
+        return _analyze_symbol(
+            symbol, headlines, market_data, recommender,
+            sentiment_analyzer, news_store, snapshots,
+        )
 
-            signal = recommender.recommend(quote, indicators, fundamentals, sentiment_score)
-            signals.append(signal)
-            logger.info("%s: %s (confidence=%.0f%%)", symbol, signal.signal_type.value, signal.confidence * 100)
+    started = monotonic()
+    market_data.prefetch(symbols)
+    results = map_ordered(_analyze, symbols, max_workers=market_data.max_workers)
+    signals = [signal for signal in results if signal is not None]
 
-            # 스냅샷 저장 (추가 API 호출 없이 기존 데이터 재활용)
-            if stock_store is not None:
-                try:
-                    stock_store.save_snapshot(
-                        symbol=symbol,
-                        date=quote.timestamp,
-                        quote=quote,
-                        indicators=indicators,
-                        fundamentals=fundamentals,
-                    )
-                except Exception as e:
-                    logger.warning("Snapshot save failed for %s: %s", symbol, e)
+    if snapshots:
+        try:
+            stock_store.save_snapshots_batch(snapshots)
         except Exception as e:
-            logger.error("Analysis failed for %s: %s", symbol, e)
-
+            logger.warning("Snapshot batch save failed (%d symbols): %s", len(snapshots), e)
+    logger.info(
+        "Stock pipeline: %d/%d symbols analyzed in %.1fs (workers=%d)",
+        len(signals), len(symbols), monotonic() - started, market_data.max_workers,
+    )
     return signals
 
 
@@ -401,29 +599,28 @@ def run_news_evaluation(
     config: dict,
     symbol_news_map: dict[str, list[NewsAlertItem]],
     dup_checker: DuplicateChecker,
+    market_data: MarketDataContext | None = None,
+    delivery: DeliveryQueue | None = None,
+    digest: bool = False,
 ) -> list:
-    """뉴스 트리거 기반 종목 평가 → Slack 알림 발송."""
+    """뉴스 트리거 기반 종목 평가 → Slack 알림 발송.
+
+    digest=True면 발송하지 않고 알림 목록만 반환한다 (사이클 digest에 묶어서 발송).
+    """
     evaluator = NewsEvaluator(config)
     if not evaluator.enabled or not symbol_news_map:
         return []
 
-    price_provider = YFinancePriceProvider()
-    fundamental_provider = YFinanceFundamentalProvider()
+    market_data = market_data or MarketDataContext(config)
+    market_data.prefetch(list(symbol_news_map))
     alerts = []
 
     for symbol, news_items in symbol_news_map.items():
         try:
-            quote = price_provider.get_current_price(symbol)
-            hist = price_provider.get_historical(symbol, period="6mo")
-            indicators = calculate_indicators(hist, symbol, config)
-
-            fundamentals = None
-            try:
-                fundamentals = fundamental_provider.get_fundamentals(symbol)
-            except Exception as e:
-                logger.warning("Fundamentals failed for %s: %s", symbol, e)
-
-            alert = evaluator.evaluate(symbol, quote.price, news_items, indicators, fundamentals)
+            data = market_data.get(symbol)
+            alert = evaluator.evaluate(
+                symbol, data.quote.price, news_items, data.indicators, data.fundamentals,
+            )
             if alert is None:
                 continue
 
@@ -435,14 +632,13 @@ def run_news_evaluation(
 
             alerts.append(alert)
 
-            try:
-                slack = SlackSender()
-                msg = format_news_alert_message(alert)
-                slack.send_webhook_message(msg)
-                dup_checker.mark_signal_sent(symbol, alert_key)
-                logger.info("News alert sent: %s (%s)", symbol, alert.valuation)
-            except Exception as e:
-                logger.error("News alert Slack send failed: %s", e)
+            if delivery is not None and not digest:
+                try:
+                    delivery.enqueue_webhook(format_news_alert_message(alert))
+                    dup_checker.mark_signal_sent(symbol, alert_key)
+                    logger.info("News alert queued: %s (%s)", symbol, alert.valuation)
+                except Exception as e:
+                    logger.error("News alert Slack enqueue failed: %s", e)
 
         except Exception as e:
             logger.error("News evaluation failed for %s: %s", symbol, e)
@@ -450,25 +646,56 @@ def run_news_evaluation(
     return alerts
 
 
-def discover_new_stocks(config: dict, watchlist: list[str] | None = None) -> list[str]:
+def _send_cycle_digest(
+    delivery: DeliveryQueue,
+    dup_checker: DuplicateChecker,
+    signals: list,
+    alerts: list,
+) -> None:
+    """한 사이클의 시그널/뉴스 알림을 digest 메시지로 묶어 발송 예약하고 중복 기록."""
+    messages = format_cycle_digest(signals, alerts)
+    if not messages:
+        return
+    try:
+        for message in messages:
+            delivery.enqueue_webhook(message["text"], blocks=message["blocks"])
+    except Exception as e:
+        logger.error("Cycle digest Slack enqueue failed: %s", e)
+        return
+
+    for signal in signals:
+        dup_checker.mark_signal_sent(signal.symbol, signal.signal_type.value)
+    for alert in alerts:
+        dup_checker.mark_signal_sent(alert.symbol, f"news_{alert.valuation}")
+    logger.info(
+        "Cycle digest queued: %d signals, %d news alerts in %d messages",
+        len(signals), len(alerts), len(messages),
+    )
+
+
+def discover_new_stocks(
+    config: dict,
+    watchlist: list[str] | None = None,
+    fundamental_provider=None,
+    delivery: DeliveryQueue | None = None,
+) -> list[str]:
     """종목 자동 탐색 — 새로운 종목을 발견하여 심볼 리스트 반환"""
     if not is_discovery_enabled(config):
         return []
 
     discovery_cfg = get_discovery_config(config)
-    screener = StockScreener(discovery_cfg)
+    screener = StockScreener(discovery_cfg, fundamental_provider)
 
     try:
         discovered = screener.discover_stocks(extra_symbols=watchlist)
         logger.info("Discovered %d new stock candidates", len(discovered))
 
-        try:
-            slack = SlackSender()
-            msg = format_discovery_message(discovered)
-            if msg:
-                slack.send_webhook_message(msg)
-        except Exception:
-            pass
+        msg = format_discovery_message(discovered)
+        if msg and delivery is not None:
+            try:
+                delivery.enqueue_webhook(msg)
+            except Exception as e:
+                logger.warning("Discovery Slack enqueue failed: %s", e)
 
         return [d.symbol for d in discovered]
     except Exception as e:
@@ -476,36 +703,44 @@ def discover_new_stocks(config: dict, watchlist: list[str] | None = None) -> lis
         return []
 
 
-def backfill_categories(news_store, delay: float = 1.0) -> int:
-    """기존 뉴스에 카테고리를 소급 적용합니다."""
+def backfill_categories(news_store, delay: float = 1.0, llm_cache=None) -> int:
+    """기존 뉴스에 카테고리를 소급 적용합니다.
+
+    제목을 배치 요청으로 묶어 처리하며, delay는 배치 요청 사이의 대기 시간입니다.
+    """
     uncategorized = news_store.get_uncategorized_news()
     if not uncategorized:
         logger.info("No uncategorized news found")
         return 0
 
     logger.info("Backfilling categories for %d news items", len(uncategorized))
-    translator = GPTTranslator()
+    translator = GPTTranslator(cache=llm_cache)
     count = 0
-    for record in uncategorized:
-        try:
-            _, categories = translator.translate_and_categorize(record.title_original)
-            news_store.update_categories(record.id, categories)
-            count += 1
-            logger.info(
-                "Backfill (%d/%d) id=%d: [%s] %s",
-                count, len(uncategorized), record.id,
-                ", ".join(categories), record.title_original[:60],
-            )
-            if count < len(uncategorized):
-                sleep(delay)
-        except Exception as e:
-            logger.error("Backfill failed for id=%d: %s", record.id, e)
+    batch_size = 20
+    for start in range(0, len(uncategorized), batch_size):
+        batch = uncategorized[start : start + batch_size]
+        if start > 0:
+            sleep(delay)
+        _, categories_list, _ = translator.translate_and_categorize_batch(
+            [record.title_original for record in batch]
+        )
+        for record, categories in zip(batch, categories_list):
+            try:
+                news_store.update_categories(record.id, categories)
+                count += 1
+                logger.info(
+                    "Backfill (%d/%d) id=%d: [%s] %s",
+                    count, len(uncategorized), record.id,
+                    ", ".join(categories), record.title_original[:60],
+                )
+            except Exception as e:
+                logger.error("Backfill failed for id=%d: %s", record.id, e)
 
     logger.info("Backfill complete: %d/%d categorized", count, len(uncategorized))
     return count
 
 
-def run_sector_trend_pipeline(config: dict, news_store) -> bool:
+def run_sector_trend_pipeline(config: dict, news_store, delivery: DeliveryQueue | None = None) -> bool:
     """섹터 트렌드 분석 → 저평가 종목 발굴 → Slack 리포트 전송.
 
     Returns:
@@ -572,13 +807,15 @@ def run_sector_trend_pipeline(config: dict, news_store) -> bool:
     )
 
     msg = format_sector_trend_report(report)
+    if delivery is None:
+        logger.error("Sector trend report not sent: Slack delivery is not configured")
+        return False
     try:
-        slack = SlackSender()
-        slack.send_webhook_message(msg)
-        logger.info("=== Sector Trend Report sent to Slack ===")
+        delivery.enqueue_webhook(msg)
+        logger.info("=== Sector Trend Report queued for Slack ===")
         return True
     except Exception as e:
-        logger.error("Sector trend Slack send failed: %s", e)
+        logger.error("Sector trend Slack enqueue failed: %s", e)
         return False
 
 
@@ -611,15 +848,26 @@ def main():
 
     dup_checker = DuplicateChecker()
     poll_interval = config.get("poll_interval_seconds", 300)
+    digest = get_slack_delivery_config(config).get("digest", True)
     rate_limiter = RateLimiter(state_file="./data/rate_limiter_state.json")
 
-    # DB 초기화
+    # DB 초기화 (저장소들은 파일당 하나의 DuckDB 연결을 공유)
+    _configure_duckdb(config)
     news_store = _init_news_store(config)
     stock_store = _init_stock_store(config)
+    bar_store = _init_bar_store(config)
+
+    # 프로바이더는 사이클 간 재사용 (과거 데이터/펀더멘털 캐시 유지, 스크리너와 공유)
+    price_provider = YFinancePriceProvider(bar_store=bar_store)
+    fundamental_provider = _init_fundamental_provider(config)
+    llm_cache = _init_llm_cache(config)
+    embedding_window = _init_embedding_window(config, news_store)
+    delivery = _init_delivery_queue(config)
+    indicator_states = _init_indicator_states(config)
 
     # 종목 탐색은 첫 실행 시 한 번만
     watchlist = get_watchlist(config)
-    discovered_symbols = discover_new_stocks(config, watchlist)
+    discovered_symbols = discover_new_stocks(config, watchlist, fundamental_provider, delivery)
     all_symbols = list(dict.fromkeys(watchlist + discovered_symbols))
     logger.info("Tracking %d symbols: %s", len(all_symbols), all_symbols)
 
@@ -631,36 +879,49 @@ def main():
             # Docker 재시작 등으로 인한 429 방지: 마지막 실행 이후 남은 대기 시간만큼 대기
             rate_limiter.wait_if_needed("news_pipeline", poll_interval)
 
+            # 사이클 단위 시장 데이터 — 종목별 시세/지표/펀더멘털을 1회만 조회해 각 단계가 공유
+            market_data = MarketDataContext(
+                config, price_provider, fundamental_provider, indicator_states=indicator_states,
+            )
+
             # 1. 뉴스 파이프라인 (감성점수 즉시 계산 + DB 저장)
-            headlines, symbol_news_map = run_news_pipeline(config, dup_checker, news_store, all_symbols)
+            headlines, symbol_news_map = run_news_pipeline(
+                config, dup_checker, news_store, all_symbols, llm_cache, embedding_window, delivery,
+            )
 
             # 2. 뉴스 트리거 기반 즉시 분석 & 알림
+            alerts = []
             if symbol_news_map:
-                run_news_evaluation(config, symbol_news_map, dup_checker)
+                alerts = run_news_evaluation(
+                    config, symbol_news_map, dup_checker, market_data, delivery, digest=digest,
+                )
 
             # 3. 주식 분석 파이프라인 (과거 뉴스 DB 활용)
-            signals = run_stock_pipeline(config, all_symbols, headlines, news_store, stock_store)
+            signals = run_stock_pipeline(
+                config, all_symbols, headlines, news_store, stock_store, market_data, llm_cache,
+            )
 
             # 4. 시그널 Slack 전송 (HOLD 제외, 중복 제외)
-            for signal in signals:
-                if signal.signal_type == SignalType.HOLD:
-                    continue
-                if dup_checker.check_signal_duplicate(signal.symbol, signal.signal_type.value):
-                    continue
-
-                try:
-                    slack = SlackSender()
-                    msg = format_signal_message(signal)
-                    slack.send_webhook_message(msg)
-                    dup_checker.mark_signal_sent(signal.symbol, signal.signal_type.value)
-                    logger.info("Signal sent: %s %s", signal.signal_type.value, signal.symbol)
-                except Exception as e:
-                    logger.error("Slack send failed: %s", e)
+            new_signals = [
+                signal for signal in signals
+                if signal.signal_type != SignalType.HOLD
+                and not dup_checker.check_signal_duplicate(signal.symbol, signal.signal_type.value)
+            ]
+            if delivery is not None and digest:
+                _send_cycle_digest(delivery, dup_checker, new_signals, alerts)
+            elif delivery is not None:
+                for signal in new_signals:
+                    try:
+                        delivery.enqueue_webhook(format_signal_message(signal))
+                        dup_checker.mark_signal_sent(signal.symbol, signal.signal_type.value)
+                        logger.info("Signal queued: %s %s", signal.signal_type.value, signal.symbol)
+                    except Exception as e:
+                        logger.error("Slack enqueue failed: %s", e)
 
             # 5. 섹터 트렌드 분석 (스케줄 체크)
             if _check_sector_trend_schedule(config, sector_trend_last_runs):
                 try:
-                    run_sector_trend_pipeline(config, news_store)
+                    run_sector_trend_pipeline(config, news_store, delivery)
                 except Exception as e:
                     logger.error("Sector trend pipeline error: %s", e)
 
@@ -674,12 +935,44 @@ def main():
                         if signal.signal_type != SignalType.HOLD:
                             trader.execute_signal(signal)
                     trader.save()
+                    logger.info(
+                        "Paper portfolio value: $%.2f",
+                        trader.market_value(market_data.prices()),
+                    )
                 except Exception as e:
                     logger.error("Paper trading error: %s", e)
 
         except Exception as e:
             logger.error("Pipeline error: %s", e)
 
+        if indicator_states is not None:
+            try:
+                save_states(indicator_states, config["indicators"]["state_file"])
+            except Exception as e:
+                logger.warning("Indicator state save failed: %s", e)
+        if hasattr(fundamental_provider, "stats"):
+            stats = fundamental_provider.stats()
+            logger.info(
+                "Fundamentals cache: hits=%d stale=%d misses=%d hit_rate=%.1f%%",
+                stats["hits"], stats["stale_hits"], stats["misses"], stats["hit_rate"] * 100,
+            )
+        if llm_cache is not None:
+            try:
+                llm_cache.evict_if_due()
+            except Exception as e:
+                logger.warning("LLM cache eviction failed: %s", e)
+            stats = llm_cache.stats()
+            logger.info(
+                "LLM cache: hits=%d misses=%d hit_rate=%.1f%%",
+                stats["hits"], stats["misses"], stats["hit_rate"] * 100,
+            )
+        if delivery is not None:
+            stats = delivery.stats()
+            logger.info(
+                "Slack delivery: delivered=%d pending=%d rate_limited=%d failed=%d",
+                stats["delivered"], stats["pending"], stats["rate_limited"], stats["failed"],
+            )
+
         logger.info("Sleeping %d seconds...", poll_interval)
         sleep(poll_interval)
 
@@ -690,22 +983,41 @@ if __name__ == "__main__":
     if "--sector-trend" in sys.argv:
         load_dotenv()
         config = load_config()
+        _configure_duckdb(config)
         # 읽기 전용으로 열어서 다른 프로세스 lock 충돌 방지
         news_store = _init_news_store(config, read_only=True)
         if news_store is None:
             logger.error("Database not enabled in config")
             sys.exit(1)
-        success = run_sector_trend_pipeline(config, news_store)
+        delivery = _init_delivery_queue(config, process_name="sector_trend")
+        success = run_sector_trend_pipeline(config, news_store, delivery)
         news_store.close()
+        if delivery is not None:
+            flush_seconds = get_slack_delivery_config(config).get("shutdown_flush_seconds", 30)
+            if not delivery.stop(timeout=flush_seconds):
+                logger.warning("Undelivered Slack messages kept in outbox for the next run")
         sys.exit(0 if success else 1)
+    elif "--refresh-universe" in sys.argv:
+        load_dotenv()
+        config = load_config()
+        screener = StockScreener(get_discovery_config(config))
+        try:
+            counts = screener.refresh_universe()
+        except Exception as e:
+            logger.error("Universe refresh failed: %s", e)
+            sys.exit(1)
+        for universe, count in counts.items():
+            logger.info("Universe %s: %d symbols cached", universe, count)
     elif "--backfill-categories" in sys.argv:
         load_dotenv()
         config = load_config()
+        _configure_duckdb(config)
         news_store = _init_news_store(config)
         if news_store is None:
             logger.error("Database not enabled in config")
             sys.exit(1)
-        backfill_categories(news_store)
+        llm_cache = _init_llm_cache(config)
+        backfill_categories(news_store, llm_cache=llm_cache)
         news_store.close()
     else:
         main()
@@ -67,6 +67,13 @@ class PaperTrader:
         open_value = sum(p.entry_price * p.shares for p in self.positions if p.is_open)
         return self.cash + open_value
 
+    def market_value(self, prices: dict[str, float]) -> float:
+        """현재가 기준 평가액. 가격이 없는 종목은 진입가로 평가."""
+        open_value = sum(
+            prices.get(p.symbol, p.entry_price) * p.shares for p in self.positions if p.is_open
+        )
+        return self.cash + open_value
+
     @property
     def total_pnl(self) -> float:
         return self.total_value - self.initial_capital
@@ -0,0 +1,120 @@
+"""TTL + stale-while-revalidate 펀더멘털 캐시.
+
+PER/PBR/ROE/섹터 등은 하루에 한 번 이상 바뀌지 않으므로, ticker.info 결과를
+TTL 동안 재사용하고 TTL이 지난 뒤 stale 구간에서는 이전 값을 즉시 반환하면서
+백그라운드에서 갱신한다. FundamentalStore가 있으면 재시작 후에도 유지된다.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional
+
+from core.models import FundamentalData
+
+logger = logging.getLogger(__name__)
+
+
+class CachedFundamentalProvider:
+    def __init__(
+        self,
+        provider,
+        store=None,
+        ttl: timedelta = timedelta(hours=24),
+        stale_ttl: timedelta = timedelta(hours=72),
+    ):
+        self.provider = provider
+        self.store = store
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+
+        self._memory: dict[str, tuple[FundamentalData, datetime]] = {}
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="fundamentals")
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "refresh_failures": 0}
+
+    @property
+    def rate_limiter(self):
+        """감싼 프로바이더의 요청 제한 버킷. 백그라운드 갱신도 같은 버킷을 거친다."""
+        return getattr(self.provider, "rate_limiter", None)
+
+    def _lookup(self, symbol: str) -> Optional[tuple[FundamentalData, datetime]]:
+        entry = self._memory.get(symbol)
+        if entry is None and self.store is not None:
+            try:
+                entry = self.store.get(symbol)
+            except Exception as e:
+                logger.warning("Fundamentals cache read failed for %s: %s", symbol, e)
+            if entry is not None:
+                self._memory[symbol] = entry
+        return entry
+
+    def _save(self, data: FundamentalData) -> None:
+        fetched_at = datetime.now()
+        self._memory[data.symbol] = (data, fetched_at)
+        if self.store is not None:
+            try:
+                self.store.put(data, fetched_at)
+            except Exception as e:
+                logger.warning("Fundamentals cache write failed for %s: %s", data.symbol, e)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def is_cached(self, symbol: str) -> bool:
+        """네트워크 요청 없이 응답 가능한지 (fresh 또는 stale 구간) 여부."""
+        entry = self._lookup(symbol)
+        return entry is not None and datetime.now() - entry[1] < self.ttl + self.stale_ttl
+
+    def get_fundamentals(self, symbol: str) -> FundamentalData:
+        entry = self._lookup(symbol)
+        if entry is not None:
+            data, fetched_at = entry
+            age = datetime.now() - fetched_at
+            if age < self.ttl:
+                self._count("hits")
+                return data
+            if age < self.ttl + self.stale_ttl:
+                self._count("stale_hits")
+                self._schedule_refresh(symbol)
+                return data
+
+        self._count("misses")
+        data = self.provider.get_fundamentals(symbol)
+        self._save(data)
+        return data
+
+    def _schedule_refresh(self, symbol: str) -> None:
+        with self._lock:
+            if symbol in self._refreshing:
+                return
+            self._refreshing.add(symbol)
+        self._executor.submit(self._refresh, symbol)
+
+    def _refresh(self, symbol: str) -> None:
+        try:
+            self._save(self.provider.get_fundamentals(symbol))
+            self._count("refreshes")
+            logger.debug("Fundamentals refreshed in background: %s", symbol)
+        except Exception as e:
+            self._count("refresh_failures")
+            logger.warning("Background fundamentals refresh failed for %s: %s", symbol, e)
+        finally:
+            with self._lock:
+                self._refreshing.discard(symbol)
+
+    def stats(self) -> dict:
+        """캐시 적중/미스 카운터와 적중률."""
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] + stats["stale_hits"]) / lookups if lookups else 0.0
+        return stats
+
+    def wait_for_refreshes(self) -> None:
+        """진행 중인 백그라운드 갱신이 끝날 때까지 대기 (종료/테스트용)."""
+        self._executor.shutdown(wait=True)
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="fundamentals")
@@ -1,9 +1,11 @@
 import logging
 import time
+from typing import Optional
 
 import yfinance as yf
 
 from core.models import FundamentalData
+from utils.concurrency import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -12,10 +14,31 @@ _RETRY_DELAY = 3
 _TIMEOUT = 30
 
 
+def is_rate_limited(error: Exception) -> bool:
+    """yfinance YFRateLimitError 또는 HTTP 429 응답 여부."""
+    message = str(error)
+    return (
+        type(error).__name__ == "YFRateLimitError"
+        or "429" in message
+        or "Too Many Requests" in message
+    )
+
+
 class YFinanceFundamentalProvider:
+    """ticker.info 기반 펀더멘털 프로바이더.
+
+    rate_limiter(TokenBucket)가 있으면 재시도를 포함한 모든 요청이 토큰을 받은 뒤 나간다.
+    429는 여기서 재시도하지 않고 바로 올려, 호출 측이 버킷 전체를 멈추고 다시 시도한다.
+    """
+
+    def __init__(self, rate_limiter: Optional[TokenBucket] = None):
+        self.rate_limiter = rate_limiter
+
     def get_fundamentals(self, symbol: str) -> FundamentalData:
         last_err = None
         for attempt in range(_MAX_RETRIES + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
             try:
                 ticker = yf.Ticker(symbol)
                 if hasattr(ticker, "session") and ticker.session is not None:
@@ -34,8 +57,11 @@ class YFinanceFundamentalProvider:
                     psr=info.get("priceToSalesTrailing12Months"),
                     roe=info.get("returnOnEquity"),
                     debt_to_equity=info.get("debtToEquity"),
+                    name=info.get("longName"),
                 )
             except Exception as e:
+                if is_rate_limited(e):
+                    raise
                 last_err = e
                 if attempt < _MAX_RETRIES:
                     logger.warning(
@@ -0,0 +1,199 @@
+"""사이클 단위 시장 데이터 컨텍스트.
+
+한 폴링 사이클 동안 종목별 시세, 과거 데이터, 펀더멘털, 기술 지표를
+최대 1회만 조회/계산하여 뉴스 평가, 주식 분석, 스냅샷 저장, 페이퍼 트레이딩이
+같은 데이터를 공유하도록 한다. 매 사이클마다 새로 생성해서 사용한다.
+indicator_states를 넘기면 기술 지표는 사이클 간 유지되는 증분 상태(IndicatorState)에
+새로 확정된 봉만 반영하고, 진행 중인 오늘 봉은 현재가로 peek()해서 계산한다.
+"""
+
+import logging
+import math
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+import pandas as pd
+
+from core.models import FundamentalData, IndicatorResult, StockQuote
+from indicators.streaming import IndicatorState
+from indicators.technical import calculate_indicators, calculate_indicators_panel
+from providers.fundamental.yfinance_fundamental import YFinanceFundamentalProvider
+from providers.price.yfinance_provider import YFinancePriceProvider
+from utils.concurrency import ProviderLimits, map_ordered
+from utils.config_loader import get_concurrency_config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SymbolMarketData:
+    symbol: str
+    quote: StockQuote
+    history: pd.DataFrame
+    indicators: IndicatorResult
+    fundamentals: Optional[FundamentalData] = None
+
+
+class MarketDataContext:
+    def __init__(
+        self,
+        config: dict,
+        price_provider=None,
+        fundamental_provider=None,
+        limits: Optional[ProviderLimits] = None,
+        history_period: str = "6mo",
+        indicator_states: Optional[dict[str, IndicatorState]] = None,
+    ):
+        self.config = config
+        self.price_provider = price_provider or YFinancePriceProvider()
+        self.fundamental_provider = fundamental_provider or YFinanceFundamentalProvider()
+        concurrency_cfg = get_concurrency_config(config)
+        self.limits = limits or ProviderLimits(concurrency_cfg.get("provider_limits"))
+        self.max_workers = concurrency_cfg.get("max_workers", 1)
+        self.history_period = history_period
+        # symbol -> 증분 지표 상태. 호출 측이 사이클 간 같은 dict를 넘기고 저장한다
+        self.indicator_states = indicator_states
+
+        # symbol -> SymbolMarketData 또는 조회 실패 예외 (같은 사이클 내 재시도 방지)
+        self._entries: dict[str, SymbolMarketData | Exception] = {}
+        self._symbol_locks: dict[str, threading.Lock] = {}
+        # symbol -> (패널 계산에 사용한 과거 데이터, 지표) — prefetch에서 일괄 계산
+        self._panel_indicators: dict[str, tuple[pd.DataFrame, IndicatorResult]] = {}
+        self._lock = threading.Lock()
+
+    def _symbol_lock(self, symbol: str) -> threading.Lock:
+        with self._lock:
+            lock = self._symbol_locks.get(symbol)
+            if lock is None:
+                lock = self._symbol_locks[symbol] = threading.Lock()
+            return lock
+
+    def get(self, symbol: str) -> SymbolMarketData:
+        """종목 데이터 조회. 사이클 내 첫 호출에서만 실제 조회/계산이 일어난다.
+
+        시세나 과거 데이터 조회에 실패하면 예외를 발생시키며, 실패 결과도
+        캐시되어 같은 사이클 안에서는 다시 요청하지 않는다.
+        """
+        with self._symbol_lock(symbol):
+            entry = self._entries.get(symbol)
+            if entry is None:
+                try:
+                    entry = self._load(symbol)
+                except Exception as e:
+                    entry = e
+                self._entries[symbol] = entry
+
+        if isinstance(entry, Exception):
+            raise entry
+        return entry
+
+    def _load(self, symbol: str) -> SymbolMarketData:
+        with self.limits.limit("price"):
+            quote = self.price_provider.get_current_price(symbol)
+            hist = self.price_provider.get_historical(symbol, period=self.history_period)
+        indicators = None
+        if self.indicator_states is not None:
+            try:
+                indicators = self._streaming_indicators(symbol, hist, quote)
+            except Exception as e:
+                logger.warning("Streaming indicators failed for %s, recomputing: %s", symbol, e)
+        if indicators is None:
+            panel = self._panel_indicators.get(symbol)
+            if panel is not None and panel[0] is hist:
+                indicators = panel[1]
+            else:
+                indicators = calculate_indicators(hist, symbol, self.config)
+
+        fundamentals = None
+        try:
+            with self.limits.limit("fundamental"):
+                fundamentals = self.fundamental_provider.get_fundamentals(symbol)
+        except Exception as e:
+            logger.warning("Fundamentals failed for %s: %s", symbol, e)
+
+        return SymbolMarketData(
+            symbol=symbol,
+            quote=quote,
+            history=hist,
+            indicators=indicators,
+            fundamentals=fundamentals,
+        )
+
+    def _streaming_indicators(self, symbol: str, hist: pd.DataFrame, quote: StockQuote) -> Optional[IndicatorResult]:
+        """저장된 상태에 마지막 반영일 이후 확정된 봉만 update()하고, 오늘 봉이 있으면 현재가로 peek().
+
+        상태가 없거나, 지표 설정이 바뀌었거나, 마지막 반영일이 과거 데이터 밖이거나, 그날 종가가
+        달라졌으면(분할/배당 재조정) 과거 데이터의 확정 봉으로 다시 초기화한다.
+        날짜 인덱스가 아닌 과거 데이터는 None (전체 재계산으로 대체).
+        """
+        if not isinstance(hist.index, pd.DatetimeIndex):
+            return None
+        today = pd.Timestamp.now(tz=hist.index.tz).normalize()
+        closed = hist["Close"][hist.index < today].dropna()
+        dates = [ts.date().isoformat() for ts in closed.index]
+
+        with self._lock:
+            state = self.indicator_states.get(symbol)
+        start = None
+        if state is not None and state.config == {"indicators": dict(self.config.get("indicators", {}))}:
+            position = {d: i for i, d in enumerate(dates)}.get(state.as_of)
+            if position is not None and math.isclose(closed.iloc[position], state.last_close, rel_tol=1e-6):
+                start = position + 1
+        if start is None:
+            logger.debug("%s: seeding indicator state from %d closed bars", symbol, len(closed))
+            state = IndicatorState(symbol, self.config)
+            start = 0
+
+        for as_of, close in zip(dates[start:], closed.iloc[start:]):
+            state.update(float(close), as_of=as_of)
+        with self._lock:
+            self.indicator_states[symbol] = state
+
+        if len(closed) < len(hist["Close"].dropna()):
+            return state.peek(quote.price)
+        return state.result()
+
+    def prefetch(self, symbols: list[str]) -> None:
+        """여러 종목을 워커 풀에서 미리 조회. 개별 실패는 get() 호출 시점에 드러난다."""
+        pending = [s for s in dict.fromkeys(symbols) if s not in self._entries]
+        if not pending:
+            return
+
+        # 과거 데이터는 한 번의 배치 다운로드로 캐시를 먼저 채우고, 지표는 패널로 일괄 계산
+        if len(pending) > 1 and hasattr(self.price_provider, "get_historical_many"):
+            try:
+                with self.limits.limit("price"):
+                    frames, _ = self.price_provider.get_historical_many(pending, period=self.history_period)
+            except Exception as e:
+                logger.warning("Batch history prefetch failed, falling back to per-symbol: %s", e)
+            else:
+                try:
+                    if self.indicator_states is None:
+                        self._compute_panel_indicators(frames)
+                except Exception as e:
+                    logger.warning("Panel indicator calculation failed, falling back to per-symbol: %s", e)
+
+        def _load_quietly(symbol: str) -> None:
+            try:
+                self.get(symbol)
+            except Exception as e:
+                logger.debug("Prefetch failed for %s: %s", symbol, e)
+
+        map_ordered(_load_quietly, pending, max_workers=self.max_workers)
+
+    def _compute_panel_indicators(self, frames: dict[str, pd.DataFrame]) -> None:
+        frames = {sym: df for sym, df in frames.items() if df is not None and not df.empty}
+        if not frames:
+            return
+        close = pd.concat({sym: df["Close"] for sym, df in frames.items()}, axis=1).sort_index()
+        for sym, result in calculate_indicators_panel(close, self.config).items():
+            self._panel_indicators[sym] = (frames[sym], result)
+
+    def prices(self) -> dict[str, float]:
+        """이번 사이클에 조회된 종목별 현재가."""
+        return {
+            symbol: entry.quote.price
+            for symbol, entry in self._entries.items()
+            if isinstance(entry, SymbolMarketData)
+        }
@@ -1,22 +1,113 @@
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Optional
 
 from crawler.rss_fetcher import RSSFetcher
 from crawler.rss_parser import RSSParser
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_TIMEOUT = 30  # seconds (요청 1회 기준)
+_DEFAULT_RETRIES = 2  # 첫 요청 이후 재시도 횟수 (총 3회 요청)
+
+
+@dataclass
+class FeedResult:
+    source: str
+    url: str
+    items: list[dict] = field(default_factory=list)
+    latency: float = 0.0  # seconds
+    error: Optional[str] = None
+
 
 class RSSNewsProvider:
-    def __init__(self, url: str):
+    def __init__(self, url: str, timeout: int = _DEFAULT_TIMEOUT, retries: int = _DEFAULT_RETRIES):
+        if retries < 0:
+            raise ValueError(f"retries must be >= 0: {retries}")
         self.url = url
-        self.fetcher = RSSFetcher()
+        self.retries = retries
+        self.fetcher = RSSFetcher(timeout=timeout)
         self.parser = RSSParser()
 
+    def _fetch(self) -> list[dict]:
+        # RSSFetcher의 retries는 총 요청 횟수
+        xml_content = self.fetcher.fetch(self.url, retries=self.retries + 1)
+        items = self.parser.get_latest_items(xml_content, limit=20)
+        return [item.to_dict() for item in items]
+
     def fetch_news(self) -> list[dict]:
         try:
-            xml_content = self.fetcher.fetch(self.url)
-            items = self.parser.get_latest_items(xml_content, limit=20)
-            return [item.to_dict() for item in items]
+            return self._fetch()
         except Exception as e:
             logger.error("RSS fetch failed: %s", e)
             return []
+
+
+def _fetch_feed(source: str, url: str, timeout: int, retries: int) -> FeedResult:
+    started = time.monotonic()
+    provider = None
+    try:
+        provider = RSSNewsProvider(url, timeout=timeout, retries=retries)
+        items = provider._fetch()
+        return FeedResult(source=source, url=url, items=items, latency=time.monotonic() - started)
+    except Exception as e:
+        return FeedResult(source=source, url=url, latency=time.monotonic() - started, error=str(e))
+    finally:
+        if provider is not None:
+            provider.fetcher.close()
+
+
+def fetch_all_feeds(
+    news_configs: list[dict],
+    timeout: int = _DEFAULT_TIMEOUT,
+    retries: int = _DEFAULT_RETRIES,
+    deadline: Optional[float] = None,
+) -> list[FeedResult]:
+    """설정된 모든 RSS 피드를 동시에 수집하고 설정 순서대로 결과를 반환.
+
+    피드별 timeout/retries는 각 설정 항목 값이 우선한다. retries는 첫 요청 이후 재시도 횟수(0 이상).
+    deadline(초)이 지나도 끝나지 않은 피드는 error="timeout"으로 처리하고
+    기다리지 않는다 — 사이클 시간은 가장 느린 정상 피드에 의해 결정된다.
+    """
+    feeds = [cfg for cfg in news_configs if cfg.get("url")]
+    if not feeds:
+        return []
+
+    started = time.monotonic()
+    executor = ThreadPoolExecutor(max_workers=len(feeds), thread_name_prefix="rss")
+    futures = [
+        executor.submit(
+            _fetch_feed,
+            cfg.get("source", "unknown"),
+            cfg["url"],
+            cfg.get("timeout", timeout),
+            cfg.get("retries", retries),
+        )
+        for cfg in feeds
+    ]
+    try:
+        wait(futures, timeout=deadline)
+    finally:
+        # deadline을 넘긴 피드는 백그라운드에서 마무리되도록 두고 기다리지 않는다
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    results: list[FeedResult] = []
+    for cfg, future in zip(feeds, futures):
+        source = cfg.get("source", "unknown")
+        if future.done() and not future.cancelled():
+            result = future.result()
+        else:
+            result = FeedResult(
+                source=source, url=cfg["url"], latency=time.monotonic() - started, error="timeout",
+            )
+
+        if result.error:
+            logger.warning("[%s] RSS fetch failed after %.2fs: %s", source, result.latency, result.error)
+        else:
+            logger.info("[%s] fetched %d items in %.2fs", source, len(result.items), result.latency)
+        results.append(result)
+
+    logger.info("Fetched %d feeds in %.2fs", len(results), time.monotonic() - started)
+    return results
@@ -1,6 +1,8 @@
 import logging
+import math
+import re
 import time
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 import pandas as pd
 import yfinance as yf
@@ -13,6 +15,8 @@ _HISTORICAL_TTL = timedelta(hours=1)
 _MAX_RETRIES = 2
 _RETRY_DELAY = 3  # seconds
 _TIMEOUT = 30  # seconds
+_DOWNLOAD_CHUNK_SIZE = 100  # yf.download 1회 요청당 종목 수
+_READJUST_TOLERANCE = 1e-4  # 저장된 종가와 다시 받은 종가의 상대 오차가 이보다 크면 재조정으로 판단
 
 
 def _create_ticker(symbol: str) -> yf.Ticker:
@@ -40,10 +44,87 @@ def _retry(fn, symbol: str):
     raise last_err  # type: ignore[misc]
 
 
+def _split_download(raw: pd.DataFrame, symbols: list[str]) -> dict[str, pd.DataFrame]:
+    """yf.download(group_by="ticker") 결과를 종목별 DataFrame으로 분리. 데이터 없는 종목은 제외."""
+    frames: dict[str, pd.DataFrame] = {}
+    if raw is None or raw.empty:
+        return frames
+
+    if isinstance(raw.columns, pd.MultiIndex):
+        available = set(raw.columns.get_level_values(0))
+        for sym in symbols:
+            if sym not in available:
+                continue
+            df = raw[sym].dropna(how="all")
+            if not df.empty:
+                frames[sym] = df
+    elif len(symbols) == 1:
+        # 단일 종목일 때 MultiIndex가 아님
+        df = raw.dropna(how="all")
+        if not df.empty:
+            frames[symbols[0]] = df
+    return frames
+
+
+def _period_start(period: str, today: date | None = None) -> date:
+    """yfinance period 문자열(6mo, 1y, 5d, ytd, max)을 시작일로 변환."""
+    today = today or date.today()
+    if period == "max":
+        return date(1900, 1, 1)
+    if period == "ytd":
+        return date(today.year, 1, 1)
+
+    match = re.fullmatch(r"(\d+)(d|wk|mo|y)", period)
+    if not match:
+        raise ValueError(f"지원하지 않는 period 형식입니다: {period}")
+    n, unit = int(match.group(1)), match.group(2)
+    offsets = {
+        "d": pd.DateOffset(days=n),
+        "wk": pd.DateOffset(weeks=n),
+        "mo": pd.DateOffset(months=n),
+        "y": pd.DateOffset(years=n),
+    }
+    return (pd.Timestamp(today) - offsets[unit]).date()
+
+
+def _is_readjusted(df: pd.DataFrame | None, reference: tuple[date, float] | None) -> bool:
+    """증분으로 다시 받은 기준일 종가가 저장된 종가와 다른지 여부.
+
+    수정 주가(auto_adjust)는 분할/배당이 생기면 과거 전체가 다시 계산되므로, 이미 저장된
+    봉과 겹치는 날의 종가가 달라졌다면 저장 이력 전체가 낡은 것이다.
+    """
+    if reference is None or df is None or df.empty:
+        return False
+    ref_date, ref_close = reference
+    index = pd.DatetimeIndex(df.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    closes = df["Close"].to_numpy(dtype=float)[index.normalize() == pd.Timestamp(ref_date)]
+    if len(closes) == 0 or math.isnan(closes[0]):
+        return False
+    return not math.isclose(closes[0], ref_close, rel_tol=_READJUST_TOLERANCE)
+
+
+def _download(tickers: list[str], **kwargs) -> pd.DataFrame:
+    return yf.download(
+        tickers,
+        auto_adjust=True,
+        progress=False,
+        group_by="ticker",
+        threads=True,
+        timeout=_TIMEOUT,
+        **kwargs,
+    )
+
+
 class YFinancePriceProvider:
     # (symbol, period) -> (cached_at, DataFrame)
     _historical_cache: dict[tuple[str, str], tuple[datetime, pd.DataFrame]] = {}
 
+    def __init__(self, bar_store=None):
+        # bar_store가 있으면 일봉을 로컬에 저장하고 마지막 저장일 이후만 새로 받는다
+        self.bar_store = bar_store
+
     def get_current_price(self, symbol: str) -> StockQuote:
         def _fetch():
             ticker = _create_ticker(symbol)
@@ -69,14 +150,164 @@ class YFinancePriceProvider:
                 logger.debug("Historical cache hit: %s (%s)", symbol, period)
                 return df
 
-        def _fetch():
-            ticker = _create_ticker(symbol)
-            df = ticker.history(period=period)
-            if df.empty:
-                raise ValueError(f"{symbol}: 과거 데이터를 가져올 수 없습니다")
-            return df
+        if self.bar_store is not None:
+            df = self._get_historical_from_store(symbol, period)
+        else:
+            def _fetch():
+                ticker = _create_ticker(symbol)
+                df = ticker.history(period=period)
+                if df.empty:
+                    raise ValueError(f"{symbol}: 과거 데이터를 가져올 수 없습니다")
+                return df
+
+            df = _retry(_fetch, symbol)
 
-        df = _retry(_fetch, symbol)
         self._historical_cache[key] = (datetime.now(), df)
         logger.debug("Historical cache miss: %s (%s), fetched and cached", symbol, period)
         return df
+
+    def _get_historical_from_store(self, symbol: str, period: str) -> pd.DataFrame:
+        """로컬 일봉 저장소 기반 조회. 저장된 구간이 충분하면 마지막 저장일 직전 봉부터만 수집.
+
+        다시 받은 직전 봉의 종가가 저장된 값과 다르면(분할/배당 재조정) 기간 전체를 다시 받아
+        저장 이력을 교체한다.
+        """
+        start = _period_start(period)
+        covered_from, last_date = self.bar_store.get_coverage(symbol)
+
+        def _fetch_full() -> pd.DataFrame:
+            full = _retry(lambda: _create_ticker(symbol).history(period=period), symbol)
+            if full.empty:
+                raise ValueError(f"{symbol}: 과거 데이터를 가져올 수 없습니다")
+            return full
+
+        if covered_from is not None and covered_from <= start:
+            # 마지막 저장일도 다시 받아 장중 미완성 봉을 갱신하고, 확정된 직전 봉으로 재조정 여부 확인
+            reference = self.bar_store.get_reference_close(symbol)
+            delta_from = reference[0] if reference else last_date
+            delta = _retry(
+                lambda: _create_ticker(symbol).history(start=delta_from.isoformat()), symbol,
+            )
+            if _is_readjusted(delta, reference):
+                logger.info("%s: stored bars readjusted (split/dividend), refetching %s", symbol, period)
+                self.bar_store.replace_bars(symbol, _fetch_full(), covered_from=start)
+            elif not delta.empty:
+                self.bar_store.save_bars(symbol, delta)
+            logger.debug("%s: delta fetch from %s (%d bars)", symbol, delta_from, len(delta))
+        else:
+            full = _fetch_full()
+            self.bar_store.save_bars(symbol, full, covered_from=start)
+            logger.debug("%s: full fetch for %s (%d bars)", symbol, period, len(full))
+
+        df = self.bar_store.get_bars(symbol, start=start)
+        if df.empty:
+            raise ValueError(f"{symbol}: 과거 데이터를 가져올 수 없습니다")
+        return df
+
+    def get_historical_many(
+        self,
+        symbols: list[str],
+        period: str = "6mo",
+        chunk_size: int = _DOWNLOAD_CHUNK_SIZE,
+    ) -> tuple[dict[str, pd.DataFrame], dict[str, str]]:
+        """여러 종목의 과거 데이터를 yf.download로 묶어서 조회.
+
+        chunk_size 단위로 나누어 요청하고, 결과는 get_historical과 같은
+        _historical_cache에 채운다. 캐시가 유효한 종목은 요청하지 않는다.
+        bar_store가 있으면 이력이 저장된 종목은 마지막 저장일 직전 봉부터만 받되, 시작일이 같은
+        종목끼리 묶어 요청한다. 직전 봉 종가가 달라진(분할/배당 재조정) 종목은 기간 전체를 다시 받는다.
+        일부 종목이나 청크가 실패해도 나머지 결과는 그대로 반환한다.
+
+        Returns:
+            (frames, failures) 튜플
+            frames: {symbol: DataFrame}
+            failures: {symbol: 실패 사유}
+        """
+        frames: dict[str, pd.DataFrame] = {}
+        failures: dict[str, str] = {}
+        now = datetime.now()
+
+        unique = list(dict.fromkeys(symbols))
+        pending: list[str] = []
+        for symbol in unique:
+            cached = self._historical_cache.get((symbol, period))
+            if cached is not None and now - cached[0] < _HISTORICAL_TTL:
+                frames[symbol] = cached[1]
+            else:
+                pending.append(symbol)
+
+        # (종목 목록, download 인자, 전체 수집 여부)
+        start = _period_start(period)
+        plans: list[tuple[list[str], dict, bool]] = []
+        references: dict[str, tuple[date, float]] = {}
+        if self.bar_store is not None:
+            full: list[str] = []
+            delta_groups: dict[date, list[str]] = {}
+            for symbol in pending:
+                covered_from, last_date = self.bar_store.get_coverage(symbol)
+                if covered_from is not None and covered_from <= start:
+                    reference = self.bar_store.get_reference_close(symbol)
+                    if reference is not None:
+                        references[symbol] = reference
+                    # 시작일별로 묶어 오래 갱신되지 않은 종목 하나 때문에 배치 전체를 길게 받지 않도록
+                    delta_from = reference[0] if reference else last_date
+                    delta_groups.setdefault(delta_from, []).append(symbol)
+                else:
+                    full.append(symbol)
+            plans.append((full, {"period": period}, True))
+            for delta_from, group in sorted(delta_groups.items()):
+                plans.append((group, {"start": delta_from.isoformat()}, False))
+        else:
+            plans.append((pending, {"period": period}, True))
+
+        readjusted: list[str] = []
+
+        def _fetch_group(group: list[str], download_kwargs: dict, is_full: bool) -> None:
+            for offset in range(0, len(group), chunk_size):
+                chunk = group[offset:offset + chunk_size]
+                try:
+                    raw = _retry(
+                        lambda tickers=chunk: _download(tickers, **download_kwargs),
+                        f"batch[{offset}:{offset + len(chunk)}]",
+                    )
+                except Exception as e:
+                    logger.warning("Historical batch download failed (%d symbols): %s", len(chunk), e)
+                    failures.update({sym: str(e) for sym in chunk})
+                    continue
+
+                chunk_frames = _split_download(raw, chunk)
+                fetched_at = datetime.now()
+                for sym in chunk:
+                    df = chunk_frames.get(sym)
+                    if self.bar_store is not None:
+                        if not is_full and _is_readjusted(df, references.get(sym)):
+                            readjusted.append(sym)
+                            continue
+                        if df is not None and is_full and sym in readjusted:
+                            self.bar_store.replace_bars(sym, df, covered_from=start)
+                        elif df is not None:
+                            self.bar_store.save_bars(sym, df, covered_from=start if is_full else None)
+                        elif is_full:
+                            failures[sym] = f"{sym}: 과거 데이터를 가져올 수 없습니다"
+                            continue
+                        # 증분 구간에 새 봉이 없어도(휴장일 등) 저장된 이력은 유효
+                        df = self.bar_store.get_bars(sym, start=start)
+                    if df is None or df.empty:
+                        failures[sym] = f"{sym}: 과거 데이터를 가져올 수 없습니다"
+                        continue
+                    self._historical_cache[(sym, period)] = (fetched_at, df)
+                    frames[sym] = df
+
+        for group, download_kwargs, is_full in plans:
+            _fetch_group(group, download_kwargs, is_full)
+        if readjusted:
+            logger.info(
+                "Stored bars readjusted (split/dividend) for %d symbols, refetching %s", len(readjusted), period,
+            )
+            _fetch_group(readjusted, {"period": period}, True)
+
+        logger.info(
+            "Historical batch: %d cached, %d downloaded, %d failed",
+            len(unique) - len(pending), len(pending) - len(failures), len(failures),
+        )
+        return frames, failures
@@ -1,75 +1,47 @@
-import io
 import logging
 import time
+from datetime import timedelta
 
+import numpy as np
 import pandas as pd
-import requests
 import yfinance as yf
 
-from core.models import ScreenerResult
+from core.models import FundamentalData, ScreenerResult
+from indicators.technical import compute_rsi
+from providers.fundamental.yfinance_fundamental import YFinanceFundamentalProvider, is_rate_limited
+from screener.universe import UniverseCache
+from utils.concurrency import TokenBucket, map_ordered
 
 logger = logging.getLogger(__name__)
 
-SP500_URL = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
-NASDAQ100_URL = "https://en.wikipedia.org/wiki/Nasdaq-100#Components"
-
-_HEADERS = {"User-Agent": "StockUp/1.0 (stock screener)"}
-
-
-def _fetch_html(url: str) -> str:
-    resp = requests.get(url, headers=_HEADERS, timeout=30)
-    resp.raise_for_status()
-    return resp.text
-
-
-def _normalize_symbol(symbol: str) -> str:
-    """Wikipedia 심볼 표기(BRK.B)를 yfinance 형식(BRK-B)으로 변환."""
-    return symbol.replace(".", "-")
-
-
-def _fetch_sp500_symbols() -> list[dict]:
-    html = _fetch_html(SP500_URL)
-    tables = pd.read_html(io.StringIO(html))
-    df = tables[0]
-    return [
-        {
-            "symbol": _normalize_symbol(row["Symbol"]),
-            "name": row["Security"],
-            "sector": row.get("GICS Sector", ""),
-        }
-        for _, row in df.iterrows()
-    ]
-
-
-def _fetch_nasdaq100_symbols() -> list[dict]:
-    html = _fetch_html(NASDAQ100_URL)
-    tables = pd.read_html(io.StringIO(html))
-    for table in tables:
-        if "Ticker" in table.columns or "Symbol" in table.columns:
-            col = "Ticker" if "Ticker" in table.columns else "Symbol"
-            name_col = "Company" if "Company" in table.columns else col
-            return [
-                {
-                    "symbol": _normalize_symbol(row[col]),
-                    "name": row.get(name_col, row[col]),
-                    "sector": "",
-                }
-                for _, row in table.iterrows()
-            ]
-    return []
-
-
-UNIVERSE_FETCHERS = {
-    "sp500": _fetch_sp500_symbols,
-    "nasdaq100": _fetch_nasdaq100_symbols,
-}
+_RATE_LIMIT_BACKOFF = 5.0  # 첫 429 이후 요청 중단 시간 (초), 재시도마다 2배
+_MAX_BACKOFF = 120.0
 
 
 class StockScreener:
-    def __init__(self, discovery_config: dict):
+    def __init__(self, discovery_config: dict, fundamental_provider=None):
         self.universes: list[str] = discovery_config.get("universes", ["sp500"])
         self.max_candidates: int = discovery_config.get("max_candidates", 20)
         self.filters: dict = discovery_config.get("filters", {})
+        self.universe_cache = UniverseCache(
+            cache_dir=discovery_config.get("universe_cache_dir", "./data/universe"),
+            ttl=timedelta(hours=discovery_config.get("universe_ttl_hours", 168)),
+        )
+        info_fetch: dict = discovery_config.get("info_fetch", {})
+        self.info_rate: float = info_fetch.get("requests_per_second", 2.0)
+        self.info_burst: int = info_fetch.get("burst", 2)
+        self.info_workers: int = info_fetch.get("max_workers", 4)
+        self.info_max_retries: int = info_fetch.get("max_retries", 3)
+
+        # 프로바이더가 버킷을 갖고 있으면 재시도와 백그라운드 갱신까지 그 버킷을 거치므로 그대로 공유한다
+        if fundamental_provider is None:
+            fundamental_provider = YFinanceFundamentalProvider(
+                rate_limiter=TokenBucket(self.info_rate, burst=self.info_burst)
+            )
+        self.fundamental_provider = fundamental_provider
+        limiter = getattr(fundamental_provider, "rate_limiter", None)
+        self._provider_gated = isinstance(limiter, TokenBucket)
+        self.info_bucket = limiter if self._provider_gated else TokenBucket(self.info_rate, burst=self.info_burst)
 
     def discover_stocks(self, extra_symbols: list[str] | None = None) -> list[ScreenerResult]:
         all_symbols = self._load_universe()
@@ -90,19 +62,17 @@ class StockScreener:
         symbols: list[dict] = []
         seen = set()
         for universe in self.universes:
-            fetcher = UNIVERSE_FETCHERS.get(universe)
-            if not fetcher:
-                logger.warning("Unknown universe: %s", universe)
-                continue
-            for item in fetcher():
+            for item in self.universe_cache.load(universe):
                 if item["symbol"] not in seen:
                     seen.add(item["symbol"])
                     symbols.append(item)
         return symbols
 
-    def _screen(self, symbols: list[dict]) -> list[ScreenerResult]:
-        from indicators.technical import compute_rsi
+    def refresh_universe(self) -> dict[str, int]:
+        """설정된 유니버스를 즉시 다시 긁어 캐시 갱신. {유니버스: 종목 수} 반환."""
+        return {universe: len(self.universe_cache.refresh(universe)) for universe in self.universes}
 
+    def _screen(self, symbols: list[dict]) -> list[ScreenerResult]:
         min_market_cap = self.filters.get("min_market_cap", 0)
         min_avg_volume = self.filters.get("min_avg_volume", 0)
         max_per = self.filters.get("max_per")
@@ -121,41 +91,12 @@ class StockScreener:
             group_by="ticker",
         )
 
-        def get_df(sym: str) -> pd.DataFrame | None:
-            try:
-                if isinstance(raw.columns, pd.MultiIndex):
-                    if sym not in raw.columns.get_level_values(0):
-                        return None
-                    df = raw[sym].dropna(how="all")
-                else:
-                    # 단일 종목일 때 MultiIndex가 아님
-                    df = raw.dropna(how="all")
-                return df if not df.empty else None
-            except Exception:
-                return None
-
         # Step 2: 다운로드 데이터로 거래량 + RSI 필터 (추가 요청 없음)
-        pre_filtered: list[tuple[str, pd.DataFrame, float | None]] = []
-        for sym in sym_list:
-            try:
-                df = get_df(sym)
-                if df is None:
-                    continue
-
-                avg_vol = df["Volume"].mean()
-                if avg_vol < min_avg_volume:
-                    continue
-
-                rsi_val = None
-                if max_rsi:
-                    rsi_series = compute_rsi(df["Close"], period=14)
-                    rsi_val = float(rsi_series.iloc[-1]) if not rsi_series.empty else None
-                    if rsi_val is None or pd.isna(rsi_val) or rsi_val > max_rsi:
-                        continue
-
-                pre_filtered.append((sym, df, rsi_val))
-            except Exception as e:
-                logger.debug("Pre-filter skip %s: %s", sym, e)
+        metrics = _prefilter(raw, sym_list, min_avg_volume, max_rsi)
+        pre_filtered = [
+            (sym, row.price, row.avg_volume, _float_or_none(row.change_pct), _float_or_none(row.rsi))
+            for sym, row in zip(metrics.index, metrics.itertuples(index=False))
+        ]
 
         logger.info(
             "Pre-filter: %d/%d symbols passed volume/RSI check",
@@ -163,21 +104,26 @@ class StockScreener:
             len(sym_list),
         )
 
-        # Step 3: 사전 필터 통과 종목에만 ticker.info 호출 (market cap, PE)
+        # Step 3: 사전 필터 통과 종목에만 펀더멘털 조회 (market cap, PE)
+        # 토큰 버킷으로 초당 요청 수를 제한하며 동시 조회 — 캐시된 종목은 토큰을 쓰지 않는다
+        started = time.monotonic()
+        fetched = map_ordered(
+            lambda item: self._fetch_fundamentals(item[0]),
+            pre_filtered,
+            max_workers=self.info_workers,
+        )
+        logger.info(
+            "Fundamentals fetched for %d/%d symbols in %.1fs",
+            sum(f is not None for f in fetched), len(pre_filtered), time.monotonic() - started,
+        )
+
         results: list[ScreenerResult] = []
-        for sym, df, rsi_val in pre_filtered:
+        for (sym, price, avg_volume, change_pct, rsi_val), fundamentals in zip(pre_filtered, fetched):
+            if fundamentals is None:
+                continue
             try:
-                time.sleep(0.5)
-                info = yf.Ticker(sym).info
-                market_cap = info.get("marketCap", 0) or 0
-                trailing_pe = info.get("trailingPE")
-                price = float(df["Close"].iloc[-1])
-                avg_volume = float(df["Volume"].mean())
-                change_pct = (
-                    float((df["Close"].iloc[-1] - df["Close"].iloc[0]) / df["Close"].iloc[0])
-                    if len(df) > 1
-                    else None
-                )
+                market_cap = fundamentals.market_cap or 0
+                trailing_pe = fundamentals.per
 
                 if market_cap < min_market_cap:
                     continue
@@ -191,18 +137,18 @@ class StockScreener:
                     reasons.append(f"1mo drop ({change_pct:.1%})")
                 if avg_volume > 2_000_000:
                     reasons.append("High volume")
-                if rsi_val is not None and pd.notna(rsi_val):
+                if rsi_val is not None:
                     reasons.append(f"RSI={rsi_val:.1f}")
 
                 meta = name_map.get(sym, {})
                 results.append(
                     ScreenerResult(
                         symbol=sym,
-                        name=info.get("longName", meta.get("name", sym)),
-                        sector=info.get("sector", meta.get("sector", "")),
+                        name=fundamentals.name or meta.get("name", sym),
+                        sector=fundamentals.sector or meta.get("sector", ""),
                         market_cap=market_cap,
                         volume=int(avg_volume),
-                        price=price,
+                        price=float(price),
                         change_pct=change_pct,
                         discovery_reason="; ".join(reasons) if reasons else "Passed filters",
                     )
@@ -212,3 +158,110 @@ class StockScreener:
 
         results.sort(key=lambda r: (r.market_cap or 0), reverse=True)
         return results
+
+    def _fetch_fundamentals(self, symbol: str) -> FundamentalData | None:
+        """ticker.info 조회. 429면 버킷 전체를 지수 백오프로 멈춘 뒤 재시도, 그 외 실패는 None.
+
+        버킷을 가진 프로바이더는 요청마다 스스로 토큰을 받으므로 여기서는 받지 않는다.
+        """
+        is_cached = getattr(self.fundamental_provider, "is_cached", lambda _sym: False)
+        for attempt in range(self.info_max_retries + 1):
+            if not self._provider_gated and not is_cached(symbol):
+                self.info_bucket.acquire()
+            try:
+                return self.fundamental_provider.get_fundamentals(symbol)
+            except Exception as e:
+                if not is_rate_limited(e) or attempt == self.info_max_retries:
+                    logger.debug("Info fetch skip %s: %s", symbol, e)
+                    return None
+                delay = min(_RATE_LIMIT_BACKOFF * 2**attempt, _MAX_BACKOFF)
+                logger.warning("%s: rate limited, pausing info requests for %.0fs", symbol, delay)
+                self.info_bucket.pause(delay)
+        return None
+
+
+_METRIC_COLUMNS = ["price", "avg_volume", "change_pct", "rsi"]
+_RSI_PERIOD = 14
+
+
+def _float_or_none(value) -> float | None:
+    return None if pd.isna(value) else float(value)
+
+
+def _frame_metrics(df: pd.DataFrame, with_rsi: bool) -> dict:
+    """종목 하나의 OHLCV(빈 행 제거 후)에서 사전 필터 지표 계산."""
+    close = df["Close"]
+    return {
+        "price": float(close.iloc[-1]),
+        "avg_volume": float(df["Volume"].mean()),
+        "change_pct": float((close.iloc[-1] - close.iloc[0]) / close.iloc[0]) if len(df) > 1 else None,
+        "rsi": float(compute_rsi(close, period=_RSI_PERIOD).iloc[-1]) if with_rsi else None,
+    }
+
+
+def _prefilter(
+    raw: pd.DataFrame,
+    symbols: list[str],
+    min_avg_volume: float,
+    max_rsi: float | None,
+) -> pd.DataFrame:
+    """일괄 다운로드 결과에서 평균 거래량/1개월 등락률/RSI를 (날짜 x 종목) 행렬로 계산해 필터링.
+
+    종목별로 raw[sym]을 잘라 계산하던 것과 같은 통과 목록을 돌려준다. 상장 전 구간처럼
+    앞쪽만 비어 있는 종목은 행렬에서 그대로 계산하고, 중간/끝에 결측이 있거나 종가만 빠진
+    행이 있는 종목만 종목별로 빈 행을 제거한 뒤 계산한다.
+    Returns:
+        통과 종목을 입력 순서대로 index로 갖는 DataFrame (price, avg_volume, change_pct, rsi)
+    """
+    symbols = list(dict.fromkeys(symbols))
+    if raw.empty or not symbols:
+        return pd.DataFrame(columns=_METRIC_COLUMNS, dtype=float)
+    if not isinstance(raw.columns, pd.MultiIndex):
+        # 단일 종목일 때 MultiIndex가 아님
+        raw = pd.concat({symbols[0]: raw}, axis=1)
+
+    # 종목마다 블록이 나뉜 MultiIndex 프레임을 한 번에 배열로 바꾼 뒤 필드별 (날짜 x 종목) 행렬을 만든다
+    tickers = raw.columns.get_level_values(0)
+    fields = raw.columns.get_level_values(1)
+    values = raw.to_numpy(dtype=float, na_value=np.nan)
+    listed = set(tickers)
+    present = [sym for sym in symbols if sym in listed]
+
+    def field(name: str) -> pd.DataFrame:
+        mask = fields == name
+        return pd.DataFrame(values[:, mask], index=raw.index, columns=tickers[mask]).reindex(columns=present)
+
+    close = field("Close")
+    volume = field("Volume")
+    has_row = pd.DataFrame(~np.isnan(values).T).groupby(np.asarray(tickers)).any().T
+    has_row = has_row.set_axis(raw.index).reindex(columns=present)
+
+    # 종가가 있는 행 = 데이터가 있는 행이고, 첫 종가 이후 빈 값이 없는 종목만 행렬로 계산
+    valid = close.notna()
+    aligned = valid.any() & (valid | ~valid.cummax()).all() & (valid == has_row).all()
+    cols = aligned[aligned].index
+
+    metrics = pd.DataFrame(index=pd.Index(present), columns=_METRIC_COLUMNS, dtype=float)
+    aligned_close = close[cols]
+    last = aligned_close.iloc[-1]
+    first = aligned_close.bfill().iloc[0]
+    metrics.loc[cols, "price"] = last
+    metrics.loc[cols, "avg_volume"] = volume[cols].mean()
+    metrics.loc[cols, "change_pct"] = ((last - first) / first).where(valid[cols].sum() > 1)
+    if max_rsi and len(cols):
+        metrics.loc[cols, "rsi"] = compute_rsi(aligned_close, period=_RSI_PERIOD).iloc[-1]
+
+    keep = has_row.any()
+    for sym in aligned[~aligned & keep].index:
+        df = raw[sym].dropna(how="all")
+        try:
+            metrics.loc[sym] = pd.Series(_frame_metrics(df, bool(max_rsi)), dtype=float)
+        except Exception as e:
+            keep[sym] = False
+            logger.debug("Pre-filter skip %s: %s", sym, e)
+
+    metrics = metrics[keep]
+    passed = ~(metrics["avg_volume"] < min_avg_volume)
+    if max_rsi:
+        passed &= metrics["rsi"].notna() & ~(metrics["rsi"] > max_rsi)
+    return metrics[passed]
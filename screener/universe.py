@@ -0,0 +1,217 @@
+"""스크리너 유니버스(S&P 500, Nasdaq-100 구성 종목) 로딩과 디스크 캐시.
+
+구성 종목은 분기 리밸런싱 때나 바뀌므로 탐색할 때마다 Wikipedia를 긁지 않고
+디스크 캐시(cache_dir/<universe>.json)를 사용한다.
+- TTL 이내 캐시: 그대로 사용
+- TTL이 지난 캐시: 그대로 사용하고 백그라운드에서 갱신
+- 캐시 없음: 패키지에 포함된 스냅샷(screener/data/<universe>.json)을 사용하고 백그라운드에서 갱신
+따라서 탐색 시작이 네트워크 스크래핑을 기다리지 않는다. refresh()는 즉시 다시 긁어 캐시를 교체한다.
+"""
+
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from importlib import resources
+from typing import Callable, Optional
+
+import lxml.html
+import requests
+
+logger = logging.getLogger(__name__)
+
+SP500_URL = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
+NASDAQ100_URL = "https://en.wikipedia.org/wiki/Nasdaq-100#Components"
+
+_HEADERS = {"User-Agent": "StockUp/1.0 (stock screener)"}
+_DEFAULT_CACHE_DIR = "./data/universe"
+
+
+def _fetch_html(url: str) -> str:
+    resp = requests.get(url, headers=_HEADERS, timeout=30)
+    resp.raise_for_status()
+    return resp.text
+
+
+def _normalize_symbol(symbol: str) -> str:
+    """Wikipedia 심볼 표기(BRK.B)를 yfinance 형식(BRK-B)으로 변환."""
+    return symbol.replace(".", "-")
+
+
+def _cell_text(cell) -> str:
+    return " ".join(cell.text_content().split())
+
+
+def _parse_tables(html: str) -> list[list[dict[str, str]]]:
+    """문서의 <table>마다 첫 행을 헤더로 하는 행 목록 반환.
+
+    pd.read_html + iterrows 대신 lxml로 셀 텍스트만 읽는다. 각주(<sup class="reference">)는
+    제거하고, 헤더와 셀 수가 다른 행(병합 셀 등)은 건너뛴다.
+    """
+    doc = lxml.html.fromstring(html)
+    for sup in doc.xpath("//sup[contains(@class, 'reference')]"):
+        sup.drop_tree()
+
+    tables = []
+    for table in doc.iter("table"):
+        rows = table.xpath("./tr | ./thead/tr | ./tbody/tr")
+        if not rows:
+            continue
+        header = [_cell_text(c) for c in rows[0].xpath("./th | ./td")]
+        records = []
+        for row in rows[1:]:
+            cells = [_cell_text(c) for c in row.xpath("./th | ./td")]
+            if len(cells) == len(header):
+                records.append(dict(zip(header, cells)))
+        tables.append(records)
+    return tables
+
+
+def _parse_sp500(html: str) -> list[dict]:
+    for records in _parse_tables(html):
+        if records and "Symbol" in records[0] and "Security" in records[0]:
+            return [
+                {
+                    "symbol": _normalize_symbol(row["Symbol"]),
+                    "name": row["Security"],
+                    "sector": row.get("GICS Sector", ""),
+                }
+                for row in records
+            ]
+    return []
+
+
+def _parse_nasdaq100(html: str) -> list[dict]:
+    for records in _parse_tables(html):
+        if not records:
+            continue
+        first = records[0]
+        if "Ticker" in first or "Symbol" in first:
+            col = "Ticker" if "Ticker" in first else "Symbol"
+            name_col = "Company" if "Company" in first else col
+            return [
+                {"symbol": _normalize_symbol(row[col]), "name": row[name_col], "sector": ""}
+                for row in records
+            ]
+    return []
+
+
+def _fetch_sp500_symbols() -> list[dict]:
+    return _parse_sp500(_fetch_html(SP500_URL))
+
+
+def _fetch_nasdaq100_symbols() -> list[dict]:
+    return _parse_nasdaq100(_fetch_html(NASDAQ100_URL))
+
+
+UNIVERSE_FETCHERS: dict[str, Callable[[], list[dict]]] = {
+    "sp500": _fetch_sp500_symbols,
+    "nasdaq100": _fetch_nasdaq100_symbols,
+}
+
+
+def load_bundled(name: str) -> Optional[tuple[list[dict], datetime]]:
+    """패키지에 포함된 오프라인 스냅샷. 없으면 None."""
+    try:
+        raw = resources.files("screener").joinpath("data", f"{name}.json").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    data = json.loads(raw)
+    return data["symbols"], datetime.fromisoformat(data["fetched_at"])
+
+
+class UniverseCache:
+    def __init__(
+        self,
+        cache_dir: str = _DEFAULT_CACHE_DIR,
+        ttl: timedelta = timedelta(days=7),
+        fetchers: Optional[dict[str, Callable[[], list[dict]]]] = None,
+    ):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.fetchers = UNIVERSE_FETCHERS if fetchers is None else fetchers
+
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="universe")
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.cache_dir, f"{name}.json")
+
+    def _read(self, name: str) -> Optional[tuple[list[dict], datetime]]:
+        path = self._path(name)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data["symbols"], datetime.fromisoformat(data["fetched_at"])
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Failed to read universe cache %s: %s", path, e)
+            return None
+
+    def _write(self, name: str, symbols: list[dict], fetched_at: datetime) -> None:
+        """임시 파일에 쓴 뒤 교체 (갱신 도중 읽어도 깨진 파일을 보지 않도록)."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(name)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"universe": name, "fetched_at": fetched_at.isoformat(), "symbols": symbols},
+                f, ensure_ascii=False,
+            )
+        os.replace(tmp_path, path)
+
+    def load(self, name: str) -> list[dict]:
+        """캐시(없으면 번들 스냅샷)에서 구성 종목 반환. 오래됐으면 백그라운드 갱신을 예약한다."""
+        if name not in self.fetchers:
+            logger.warning("Unknown universe: %s", name)
+            return []
+
+        entry = self._read(name)
+        source = "cache"
+        if entry is None:
+            entry = load_bundled(name)
+            source = "bundled snapshot"
+        if entry is None:
+            # 캐시도 스냅샷도 없는 유니버스만 동기로 긁는다
+            return self.refresh(name)
+
+        symbols, fetched_at = entry
+        age = datetime.now() - fetched_at
+        if source != "cache" or age >= self.ttl:
+            self._schedule_refresh(name)
+        logger.debug("Universe %s: %d symbols from %s (age %s)", name, len(symbols), source, age)
+        return symbols
+
+    def refresh(self, name: str) -> list[dict]:
+        """Wikipedia에서 다시 긁어 캐시 교체. 실패하거나 비어 있으면 예외."""
+        symbols = self.fetchers[name]()
+        if not symbols:
+            raise ValueError(f"No symbols parsed for universe {name}")
+        self._write(name, symbols, datetime.now())
+        logger.info("Universe %s refreshed: %d symbols", name, len(symbols))
+        return symbols
+
+    def _schedule_refresh(self, name: str) -> None:
+        with self._lock:
+            if name in self._refreshing:
+                return
+            self._refreshing.add(name)
+        self._executor.submit(self._background_refresh, name)
+
+    def _background_refresh(self, name: str) -> None:
+        try:
+            self.refresh(name)
+        except Exception as e:
+            logger.warning("Background universe refresh failed for %s: %s", name, e)
+        finally:
+            with self._lock:
+                self._refreshing.discard(name)
+
+    def wait_for_refreshes(self) -> None:
+        """진행 중인 백그라운드 갱신이 끝날 때까지 대기 (종료/테스트용)."""
+        self._executor.shutdown(wait=True)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="universe")
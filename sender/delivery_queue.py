@@ -0,0 +1,267 @@
+"""백그라운드 Slack 발송 큐.
+
+파이프라인은 enqueue_*()로 메시지를 넣고 바로 다음 단계로 넘어가며, 워커 스레드가
+keep-alive 세션으로 순서대로 발송한다.
+- 429 응답은 Retry-After만큼 해당 웹훅/채널의 발송을 미루고 다시 시도
+- 같은 웹훅/채널로는 min_interval초 간격으로 발송 (Slack 채널당 초당 1건 제한)
+- 네트워크 오류/5xx는 지수 백오프로 max_attempts회까지 재시도
+- 아직 발송되지 않은 메시지는 outbox 파일에 저장되어 재시작 후 이어서 발송
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+import requests
+from dotenv import load_dotenv
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+_BOT_API_URL = "https://slack.com/api/chat.postMessage"
+_DEFAULT_OUTBOX = "./data/slack_outbox.json"
+_DEFAULT_RETRY_AFTER = 1.0
+_MAX_BACKOFF = 300.0
+
+
+@dataclass
+class Delivery:
+    kind: str                 # webhook / bot
+    payload: dict
+    key: str                  # 발송 간격을 맞추는 단위 (webhook:<채널> 또는 bot:<채널>)
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    attempts: int = 0
+    not_before: float = 0.0   # time.time() 기준 재시도 가능 시각
+
+
+class DeliveryQueue:
+    def __init__(
+        self,
+        webhook_url: Optional[str] = None,
+        bot_token: Optional[str] = None,
+        outbox_path: str = _DEFAULT_OUTBOX,
+        min_interval: float = 1.0,
+        max_attempts: int = 5,
+        timeout: float = 10.0,
+    ):
+        self.webhook_url = webhook_url or os.getenv("SLACK_WEBHOOK_URL")
+        self.bot_token = bot_token or os.getenv("SLACK_BOT_TOKEN")
+        if not self.webhook_url and not self.bot_token:
+            raise ValueError("Either webhook_url or bot_token must be provided")
+
+        self.outbox_path = outbox_path
+        self.min_interval = min_interval
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+
+        self._session = requests.Session()
+        self._pending: list[Delivery] = []
+        self._next_allowed: dict[str, float] = {}
+        self._cond = threading.Condition()
+        self._current: Optional[Delivery] = None  # 발송 중인 메시지 (outbox에는 계속 남김)
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"enqueued": 0, "delivered": 0, "failed": 0, "rate_limited": 0, "retries": 0}
+        self._load_outbox()
+
+    # ── 공개 API ─────────────────────────────────────────────
+
+    def start(self) -> "DeliveryQueue":
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="slack-delivery", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 30.0) -> bool:
+        """대기 중인 메시지를 최대 timeout초 동안 발송한 뒤 워커 종료. 모두 발송했으면 True."""
+        drained = self.flush(timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=max(self.timeout, 1.0))
+        self._session.close()
+        return drained
+
+    def flush(self, timeout: float = 30.0) -> bool:
+        """큐가 빌 때까지 최대 timeout초 대기."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._current:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def enqueue_webhook(
+        self, message: str, channel: Optional[str] = None, blocks: Optional[list] = None
+    ) -> None:
+        """웹훅 메시지 발송 예약. blocks가 있으면 message는 알림용 대체 텍스트로 쓰인다."""
+        if not self.webhook_url:
+            raise ValueError("Webhook URL not configured")
+        payload = {"text": message}
+        if channel:
+            payload["channel"] = channel
+        if blocks:
+            payload["blocks"] = blocks
+        self._enqueue(Delivery(kind="webhook", payload=payload, key=f"webhook:{channel or ''}"))
+
+    def enqueue_bot(self, channel: str, message: str, blocks: Optional[list] = None) -> None:
+        """Bot API(chat.postMessage) 메시지 발송 예약."""
+        if not self.bot_token:
+            raise ValueError("Bot token not configured")
+        payload = {"channel": channel, "text": message}
+        if blocks:
+            payload["blocks"] = blocks
+        self._enqueue(Delivery(kind="bot", payload=payload, key=f"bot:{channel}"))
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._pending) + (self._current is not None)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {**self._stats, "pending": len(self._pending) + (self._current is not None)}
+
+    # ── 워커 ────────────────────────────────────────────────
+
+    def _enqueue(self, delivery: Delivery) -> None:
+        with self._cond:
+            self._pending.append(delivery)
+            self._stats["enqueued"] += 1
+            self._save_outbox()
+            self._cond.notify_all()
+
+    def _next_ready(self) -> tuple[Optional[Delivery], float]:
+        """발송 가능한 메시지와, 없으면 다음 확인까지 대기 시간. 같은 key 안에서는 순서를 지킨다."""
+        now = time.time()
+        wait = 60.0
+        blocked: set[str] = set()
+        for delivery in self._pending:
+            if delivery.key in blocked:
+                continue
+            ready_at = max(delivery.not_before, self._next_allowed.get(delivery.key, 0.0))
+            if ready_at <= now:
+                return delivery, 0.0
+            blocked.add(delivery.key)
+            wait = min(wait, ready_at - now)
+        return None, wait
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                delivery, wait = self._next_ready()
+                while delivery is None:
+                    if self._stopping:
+                        return
+                    self._cond.wait(wait)
+                    delivery, wait = self._next_ready()
+                self._pending.remove(delivery)
+                self._current = delivery
+
+            outcome, retry_after = self._send(delivery)
+
+            with self._cond:
+                self._current = None
+                self._next_allowed[delivery.key] = time.time() + max(self.min_interval, retry_after or 0.0)
+                if outcome == "delivered":
+                    self._stats["delivered"] += 1
+                elif outcome == "rate_limited":
+                    # 429는 실패 횟수에 세지 않고 앞자리로 되돌린다
+                    self._stats["rate_limited"] += 1
+                    self._pending.insert(0, delivery)
+                elif outcome == "retry" and delivery.attempts < self.max_attempts:
+                    self._stats["retries"] += 1
+                    delivery.not_before = time.time() + min(2 ** delivery.attempts, _MAX_BACKOFF)
+                    self._pending.insert(0, delivery)
+                else:
+                    self._stats["failed"] += 1
+                    logger.error("Slack delivery dropped after %d attempts: %s", delivery.attempts, delivery.key)
+                self._save_outbox()
+                self._cond.notify_all()
+
+    def _send(self, delivery: Delivery) -> tuple[str, Optional[float]]:
+        """(delivered / rate_limited / retry / failed, Retry-After 초) 반환."""
+        delivery.attempts += 1
+        if delivery.kind == "bot":
+            url = _BOT_API_URL
+            headers = {"Authorization": f"Bearer {self.bot_token}", "Content-Type": "application/json"}
+        else:
+            url = self.webhook_url
+            headers = {"Content-Type": "application/json"}
+
+        try:
+            response = self._session.post(url, json=delivery.payload, headers=headers, timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            logger.warning("Slack delivery failed (attempt %d): %s", delivery.attempts, e)
+            return "retry", None
+
+        if response.status_code == 429:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            logger.warning("Slack rate limited on %s, retrying after %.1fs", delivery.key, retry_after)
+            delivery.attempts -= 1
+            return "rate_limited", retry_after
+        if response.status_code >= 500:
+            logger.warning("Slack delivery failed with HTTP %d (attempt %d)", response.status_code, delivery.attempts)
+            return "retry", None
+        if response.status_code >= 400:
+            logger.error("Slack rejected message with HTTP %d: %s", response.status_code, response.text[:200])
+            return "failed", None
+
+        if delivery.kind == "bot":
+            body = _json_or_empty(response)
+            if not body.get("ok", False):
+                if body.get("error") == "ratelimited":
+                    delivery.attempts -= 1
+                    return "rate_limited", _DEFAULT_RETRY_AFTER
+                logger.error("Slack bot API error: %s", body.get("error"))
+                return "failed", None
+        return "delivered", None
+
+    # ── outbox ──────────────────────────────────────────────
+
+    def _load_outbox(self) -> None:
+        if not os.path.exists(self.outbox_path):
+            return
+        try:
+            with open(self.outbox_path, "r") as f:
+                raw = json.load(f)
+            self._pending = [Delivery(**{**item, "not_before": 0.0}) for item in raw]
+        except Exception as e:
+            logger.warning("Failed to load Slack outbox from %s: %s", self.outbox_path, e)
+            return
+        if self._pending:
+            logger.info("Loaded %d undelivered Slack messages from %s", len(self._pending), self.outbox_path)
+
+    def _save_outbox(self) -> None:
+        """대기 + 발송 중 메시지를 원자적으로 저장 (임시 파일에 쓴 뒤 교체). _cond 잠금 안에서 호출."""
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.outbox_path)), exist_ok=True)
+            tmp_path = f"{self.outbox_path}.tmp"
+            with open(tmp_path, "w") as f:
+                current = [self._current] if self._current is not None else []
+                json.dump([asdict(d) for d in current + self._pending], f, ensure_ascii=False)
+            os.replace(tmp_path, self.outbox_path)
+        except OSError as e:
+            logger.warning("Failed to persist Slack outbox: %s", e)
+
+
+def _parse_retry_after(value: Optional[str]) -> float:
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return _DEFAULT_RETRY_AFTER
+
+
+def _json_or_empty(response: requests.Response) -> dict:
+    try:
+        return response.json()
+    except ValueError:
+        return {}
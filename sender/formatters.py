@@ -1,3 +1,5 @@
+import json
+
 from core.models import NewsAlert, Signal, SignalType
 
 
@@ -209,3 +211,57 @@ def format_discovery_message(discovered: list) -> str:
     for s in discovered[:10]:
         lines.append(f"  • *{s.symbol}* ({s.name}) — {s.discovery_reason}")
     return "\n".join(lines)
+
+
+# Slack Block Kit 제한: 메시지당 블록 50개, section 텍스트 3000자
+_DIGEST_MAX_BLOCKS = 50
+_SECTION_MAX_CHARS = 3000
+_DIGEST_MAX_CHARS = 30_000  # 직렬화된 blocks 길이 상한 (메시지 40k자 제한에 여유)
+
+
+def _section(text: str) -> dict:
+    if len(text) > _SECTION_MAX_CHARS:
+        text = text[: _SECTION_MAX_CHARS - 1] + "…"
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+
+def format_cycle_digest(
+    signals: list[Signal],
+    alerts: list[NewsAlert],
+    max_blocks: int = _DIGEST_MAX_BLOCKS,
+    max_chars: int = _DIGEST_MAX_CHARS,
+) -> list[dict]:
+    """한 사이클의 시그널/뉴스 알림을 Block Kit digest 메시지로 묶는다.
+
+    항목별 본문은 format_signal_message/format_news_alert_message를 그대로 쓰고,
+    블록 수와 직렬화 크기 제한을 넘지 않도록 여러 메시지로 나눈다.
+    Returns:
+        [{"text": 알림용 요약, "blocks": [...]}, ...] — 항목이 없으면 빈 리스트
+    """
+    items = [_section(format_signal_message(sig)) for sig in signals]
+    items += [_section(format_news_alert_message(alert)) for alert in alerts]
+    if not items:
+        return []
+
+    buys = sum(1 for sig in signals if sig.signal_type == SignalType.BUY)
+    sells = sum(1 for sig in signals if sig.signal_type == SignalType.SELL)
+    summary = f"사이클 요약: 매수 {buys} · 매도 {sells} · 뉴스 알림 {len(alerts)}"
+
+    # 헤더 블록 자리를 남기고 항목을 채운다
+    pages: list[list[dict]] = [[]]
+    size = 0
+    for block in items:
+        block_size = len(json.dumps(block, ensure_ascii=False))
+        page = pages[-1]
+        if page and (len(page) + 1 >= max_blocks or size + block_size > max_chars):
+            pages.append([])
+            size = 0
+        pages[-1].append(block)
+        size += block_size
+
+    messages = []
+    for i, page in enumerate(pages, 1):
+        title = summary if len(pages) == 1 else f"{summary} ({i}/{len(pages)})"
+        header = {"type": "header", "text": {"type": "plain_text", "text": title[:150]}}
+        messages.append({"text": title, "blocks": [header] + page})
+    return messages
@@ -6,8 +6,19 @@ from typing import List, Optional
 
 from openai import OpenAI
 
+from storage.llm_cache import prompt_version
+
 logger = logging.getLogger(__name__)
 
+# 배치 번역+태깅 한 요청에 묶을 최대 제목 수와 응답 토큰 예산
+_BATCH_MAX_ITEMS = 20
+_BATCH_MAX_OUTPUT_TOKENS = 3000
+# 토큰 수 추정치 (tiktoken 없이 보수적으로): 영문 약 4자당 1토큰,
+# 항목당 응답은 한국어 번역 + 카테고리/심볼 JSON으로 원문 대비 약 3배
+_CHARS_PER_TOKEN = 4
+_ITEM_OUTPUT_OVERHEAD = 40
+_OUTPUT_TOKEN_RATIO = 3
+
 
 CATEGORIES = [
     "금리/통화정책", "인플레이션/물가", "고용/노동시장", "기업실적",
@@ -20,13 +31,15 @@ CATEGORIES = [
 class GPTTranslator:
     """GPT를 사용한 경제 뉴스 번역기"""
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-3.5-turbo"):
+    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-3.5-turbo", cache=None):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API 키가 필요합니다. OPENAI_API_KEY 환경변수를 설정하거나 api_key 파라미터를 제공하세요.")
 
         self.client = OpenAI(api_key=self.api_key)
         self.model = model
+        # 선택: storage.llm_cache.LLMCache — 같은 제목은 API 요청 없이 재사용
+        self.cache = cache
 
         # 경제 뉴스 번역을 위한 시스템 프롬프트
         self.system_prompt = """
@@ -71,9 +84,29 @@ Symbol extraction rules:
 Respond ONLY with valid JSON in this format:
 {{"translation": "번역된 제목", "categories": ["카테고리1", "카테고리2"], "symbols": ["TICKER1"]}}
 """
+
+        # 여러 제목을 한 요청으로 처리하는 배치 프롬프트 (규칙은 단건과 동일, 입출력만 index 기반 배열)
+        self.batch_categorize_system_prompt = self.categorize_system_prompt.split(
+            "Respond ONLY with valid JSON"
+        )[0] + """
+You will receive a JSON object {"items": [{"index": 0, "title": "..."}, ...]}.
+Process every item independently and return exactly one result per input index.
+
+Respond ONLY with valid JSON in this format:
+{"results": [{"index": 0, "translation": "번역된 제목", "categories": ["카테고리1"], "symbols": ["TICKER1"]}]}
+"""
+
+        # 캐시 키에 들어가는 프롬프트 버전 (배치 프롬프트는 단건 프롬프트에서 파생되므로 공유)
+        self._translate_version = prompt_version(self.system_prompt)
+        self._categorize_version = prompt_version(self.categorize_system_prompt)
     
     def translate_title(self, english_title: str) -> str:
         """단일 제목을 번역합니다"""
+        if self.cache is not None:
+            cached = self.cache.get("translate", self.model, self._translate_version, english_title)
+            if cached is not None:
+                return cached
+
         try:
             request_params = {
                 "model": self.model,
@@ -93,6 +126,8 @@ Respond ONLY with valid JSON in this format:
             if translated.startswith('"') and translated.endswith('"'):
                 translated = translated[1:-1]
 
+            if self.cache is not None:
+                self.cache.put("translate", self.model, self._translate_version, english_title, translated)
             return translated
 
         except Exception as e:
@@ -119,6 +154,11 @@ Respond ONLY with valid JSON in this format:
         Returns:
             (번역된 제목, 카테고리 이름 리스트, 심볼 리스트) 튜플
         """
+        if self.cache is not None:
+            cached = self.cache.get("categorize", self.model, self._categorize_version, english_title)
+            if cached is not None:
+                return _from_cached(cached)
+
         try:
             request_params = {
                 "model": self.model,
@@ -136,24 +176,9 @@ Respond ONLY with valid JSON in this format:
             content = response.choices[0].message.content.strip()
             logger.debug("OpenAI categorize response: %s", content)
 
-            data = json.loads(content)
-            translated = data.get("translation", english_title)
-            categories = data.get("categories", [])
-            symbols = data.get("symbols", [])
-
-            # 따옴표 제거
-            if translated.startswith('"') and translated.endswith('"'):
-                translated = translated[1:-1]
-
-            # 유효한 카테고리만 필터링
-            valid_categories = [c for c in categories if c in CATEGORIES]
-            if not valid_categories:
-                valid_categories = ["기타"]
-
-            # 심볼은 대문자 문자열 리스트로 정규화
-            valid_symbols = [s.upper().strip() for s in symbols if isinstance(s, str) and s.strip()]
-
-            return translated, valid_categories, valid_symbols
+            result = _normalize_categorized(json.loads(content), english_title)
+            self._cache_categorized({english_title: result})
+            return result
 
         except Exception as e:
             logger.error("번역+카테고리 태깅 중 오류 발생: %s", e)
@@ -187,6 +212,101 @@ Respond ONLY with valid JSON in this format:
 
         return translated_titles, categories_list, symbols_list
 
+    def translate_and_categorize_batch(
+        self,
+        english_titles: List[str],
+        max_items: int = _BATCH_MAX_ITEMS,
+        max_output_tokens: int = _BATCH_MAX_OUTPUT_TOKENS,
+    ) -> tuple[List[str], List[List[str]], List[List[str]]]:
+        """여러 제목을 JSON 모드 요청 하나에 묶어 번역 + 카테고리 태깅 + 심볼 추출합니다.
+
+        예상 응답 토큰이 max_output_tokens를 넘지 않도록 최대 max_items개씩 나누어
+        요청하고, 응답의 index가 입력과 맞지 않거나 형식이 잘못된 항목만
+        translate_and_categorize()로 개별 재처리합니다.
+
+        Returns:
+            (번역 리스트, 카테고리 리스트, 심볼 리스트) 튜플 — 입력 순서와 동일
+        """
+        cached: dict = {}
+        if self.cache is not None:
+            cached = {
+                title: _from_cached(value)
+                for title, value in self.cache.get_many(
+                    "categorize", self.model, self._categorize_version, english_titles
+                ).items()
+            }
+            if cached:
+                logger.info("번역+카테고리 캐시 적중: %d/%d건", len(cached), len(english_titles))
+
+        pending = [t for t in dict.fromkeys(english_titles) if t not in cached]
+        chunks = _chunk_by_tokens(pending, max_items, max_output_tokens)
+        for n, chunk in enumerate(chunks, 1):
+            cached.update(zip(chunk, self._categorize_chunk(chunk, max_output_tokens)))
+            logger.info("배치 번역+카테고리+심볼 완료 (%d/%d): %d건", n, len(chunks), len(chunk))
+
+        results = [cached[t] for t in english_titles]
+        return (
+            [r[0] for r in results],
+            [r[1] for r in results],
+            [r[2] for r in results],
+        )
+
+    def _categorize_chunk(
+        self, titles: List[str], max_output_tokens: int
+    ) -> List[tuple[str, List[str], List[str]]]:
+        by_index: dict = {}
+        try:
+            payload = {"items": [{"index": i, "title": t} for i, t in enumerate(titles)]}
+            request_params = {
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": self.batch_categorize_system_prompt},
+                    {"role": "user", "content": json.dumps(payload, ensure_ascii=False)},
+                ],
+                "temperature": 0.3,
+                "max_tokens": max_output_tokens,
+                "response_format": {"type": "json_object"},
+            }
+            logger.debug("OpenAI batch categorize request: %s", json.dumps(request_params, ensure_ascii=False))
+            response = self.client.chat.completions.create(**request_params)
+
+            content = response.choices[0].message.content.strip()
+            logger.debug("OpenAI batch categorize response: %s", content)
+
+            entries = json.loads(content).get("results", [])
+            for entry in entries if isinstance(entries, list) else []:
+                if isinstance(entry, dict) and isinstance(entry.get("index"), int):
+                    by_index.setdefault(entry["index"], entry)
+        except Exception as e:
+            logger.error("배치 번역+카테고리 태깅 중 오류 발생 (%d건 개별 처리): %s", len(titles), e)
+
+        results = []
+        valid: dict = {}
+        fallbacks = 0
+        for i, title in enumerate(titles):
+            entry = by_index.get(i)
+            if _is_valid_entry(entry):
+                valid[title] = _normalize_categorized(entry, title)
+                results.append(valid[title])
+            else:
+                fallbacks += 1
+                results.append(self.translate_and_categorize(title))
+        self._cache_categorized(valid)
+        if fallbacks:
+            logger.warning("배치 응답 중 %d/%d건 누락/형식 오류로 개별 재처리", fallbacks, len(titles))
+        return results
+
+    def _cache_categorized(self, results: dict) -> None:
+        if self.cache is None or not results:
+            return
+        self.cache.put_many(
+            "categorize", self.model, self._categorize_version,
+            {
+                title: {"translation": r[0], "categories": r[1], "symbols": r[2]}
+                for title, r in results.items()
+            },
+        )
+
     def translate_batch(self, english_titles: List[str], batch_size: int = 5) -> List[str]:
         """배치로 여러 제목을 번역합니다"""
         if not english_titles:
@@ -234,4 +354,60 @@ Respond ONLY with valid JSON in this format:
             
         except Exception as e:
             logger.error("배치 번역 중 오류 발생: %s", e)
-            return english_titles  # 번역 실패시 원문 반환
\ No newline at end of file
+            return english_titles  # 번역 실패시 원문 반환
+
+
+def _normalize_categorized(data: dict, english_title: str) -> tuple[str, List[str], List[str]]:
+    """GPT 응답 항목을 (번역, 유효 카테고리, 대문자 심볼)로 정규화합니다."""
+    translated = data.get("translation") or english_title
+    categories = data.get("categories") or []
+    symbols = data.get("symbols") or []
+
+    # 따옴표 제거
+    if translated.startswith('"') and translated.endswith('"'):
+        translated = translated[1:-1]
+
+    # 유효한 카테고리만 필터링
+    valid_categories = [c for c in categories if c in CATEGORIES]
+    if not valid_categories:
+        valid_categories = ["기타"]
+
+    # 심볼은 대문자 문자열 리스트로 정규화
+    valid_symbols = [s.upper().strip() for s in symbols if isinstance(s, str) and s.strip()]
+
+    return translated, valid_categories, valid_symbols
+
+
+def _from_cached(value: dict) -> tuple[str, List[str], List[str]]:
+    return value["translation"], list(value["categories"]), list(value["symbols"])
+
+
+def _is_valid_entry(entry) -> bool:
+    """배치 응답 항목이 번역 문자열과 리스트 형태의 categories/symbols를 갖는지 확인."""
+    if not isinstance(entry, dict):
+        return False
+    translation = entry.get("translation")
+    if not isinstance(translation, str) or not translation.strip():
+        return False
+    return all(isinstance(entry.get(key, []), list) for key in ("categories", "symbols"))
+
+
+def _estimate_output_tokens(title: str) -> int:
+    return len(title) // _CHARS_PER_TOKEN * _OUTPUT_TOKEN_RATIO + _ITEM_OUTPUT_OVERHEAD
+
+
+def _chunk_by_tokens(titles: List[str], max_items: int, max_output_tokens: int) -> List[List[str]]:
+    """예상 응답 토큰과 항목 수 제한에 맞춰 제목을 순서대로 나눕니다."""
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    budget = 0
+    for title in titles:
+        cost = _estimate_output_tokens(title)
+        if current and (len(current) >= max_items or budget + cost > max_output_tokens):
+            chunks.append(current)
+            current, budget = [], 0
+        current.append(title)
+        budget += cost
+    if current:
+        chunks.append(current)
+    return chunks
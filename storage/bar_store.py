@@ -0,0 +1,166 @@
+import logging
+from datetime import date
+from typing import Optional
+
+import pandas as pd
+
+from storage.duckdb_manager import DuckDBStore, writes
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS price_bars (
+    symbol      VARCHAR NOT NULL,
+    date        DATE NOT NULL,
+    open        DOUBLE,
+    high        DOUBLE,
+    low         DOUBLE,
+    close       DOUBLE,
+    volume      BIGINT,
+    updated_at  TIMESTAMP NOT NULL,
+    PRIMARY KEY (symbol, date)
+);
+
+-- 종목별로 어느 날짜부터의 이력을 전부 받아 두었는지 기록
+-- (상장일이 요청 기간보다 늦은 종목도 매번 전체 재수집하지 않도록)
+CREATE TABLE IF NOT EXISTS price_bar_coverage (
+    symbol        VARCHAR PRIMARY KEY,
+    covered_from  DATE NOT NULL
+);
+"""
+
+_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def _normalize_bars(df: pd.DataFrame) -> pd.DataFrame:
+    """yfinance DataFrame을 (date, open, high, low, close, volume) 형태로 정규화."""
+    index = pd.DatetimeIndex(df.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    bars = pd.DataFrame({
+        "date": index.normalize(),
+        "open": df["Open"].to_numpy(dtype=float),
+        "high": df["High"].to_numpy(dtype=float),
+        "low": df["Low"].to_numpy(dtype=float),
+        "close": df["Close"].to_numpy(dtype=float),
+        "volume": pd.to_numeric(df["Volume"], errors="coerce").to_numpy(dtype=float),
+    })
+    return bars.dropna(subset=["close"]).drop_duplicates(subset=["date"], keep="last")
+
+
+class BarStore(DuckDBStore):
+    """종목별 일봉(OHLCV) 로컬 저장소.
+
+    stock_snapshots와 같은 DuckDB 파일의 price_bars 테이블에 이력을 보관하고,
+    마지막 저장일 이후 구간만 새로 받아 채우는 증분 수집에 사용한다.
+    """
+
+    def __init__(self, db_path: str = "./data/news.duckdb", read_only: bool = False):
+        super().__init__(db_path, read_only)
+
+    @writes
+    def init_schema(self) -> None:
+        self.conn.execute(SCHEMA_SQL)
+        logger.info("DuckDB price_bars schema initialized: %s", self.db_path)
+
+    def get_coverage(self, symbol: str) -> tuple[Optional[date], Optional[date]]:
+        """(이력 보장 시작일, 마지막 저장일) 반환. 저장된 데이터가 없으면 (None, None)."""
+        row = self.conn.execute(
+            """
+            SELECT cv.covered_from, MAX(b.date)
+            FROM price_bar_coverage cv
+            LEFT JOIN price_bars b ON b.symbol = cv.symbol
+            WHERE cv.symbol = ?
+            GROUP BY cv.covered_from
+            """,
+            [symbol],
+        ).fetchone()
+        if row is None or row[1] is None:
+            return None, None
+        return row[0], row[1]
+
+    def get_reference_close(self, symbol: str) -> Optional[tuple[date, float]]:
+        """증분 수집 때 재조정 여부를 확인할 (날짜, 종가) — 마지막 저장일 직전 봉.
+
+        마지막 봉은 장중 미완성 봉일 수 있어 종가가 달라도 재조정으로 볼 수 없다.
+        저장된 봉이 두 개 미만이면 None.
+        """
+        row = self.conn.execute(
+            """
+            SELECT date, close FROM price_bars
+            WHERE symbol = ?
+            ORDER BY date DESC
+            LIMIT 1 OFFSET 1
+            """,
+            [symbol],
+        ).fetchone()
+        return None if row is None else (row[0], row[1])
+
+    def get_bars(self, symbol: str, start: Optional[date] = None) -> pd.DataFrame:
+        """저장된 일봉을 yfinance history()와 같은 컬럼(Open/High/Low/Close/Volume)으로 반환."""
+        sql = """
+            SELECT date, open, high, low, close, volume
+            FROM price_bars
+            WHERE symbol = ?
+              AND (? IS NULL OR date >= ?)
+            ORDER BY date
+        """
+        rows = self.conn.execute(sql, [symbol, start, start]).fetchall()
+        df = pd.DataFrame(rows, columns=["Date"] + _COLUMNS)
+        df["Date"] = pd.to_datetime(df["Date"])
+        return df.set_index("Date")
+
+    @writes
+    def save_bars(self, symbol: str, df: pd.DataFrame, covered_from: Optional[date] = None) -> int:
+        """일봉을 upsert. covered_from을 주면 해당 날짜부터의 이력이 완전함을 기록."""
+        bars = _normalize_bars(df)
+        if not bars.empty:
+            bars.insert(0, "symbol", symbol)
+            self.conn.register("_staged_bars", bars)
+            try:
+                self.conn.execute(
+                    """
+                    INSERT INTO price_bars (symbol, date, open, high, low, close, volume, updated_at)
+                    SELECT symbol, CAST(date AS DATE), open, high, low, close,
+                           CAST(volume AS BIGINT), CURRENT_TIMESTAMP
+                    FROM _staged_bars
+                    ON CONFLICT (symbol, date) DO UPDATE SET
+                        open = EXCLUDED.open,
+                        high = EXCLUDED.high,
+                        low = EXCLUDED.low,
+                        close = EXCLUDED.close,
+                        volume = EXCLUDED.volume,
+                        updated_at = EXCLUDED.updated_at
+                    """
+                )
+            finally:
+                self.conn.unregister("_staged_bars")
+
+        if covered_from is not None:
+            self.conn.execute(
+                """
+                INSERT INTO price_bar_coverage (symbol, covered_from) VALUES (?, ?)
+                ON CONFLICT (symbol) DO UPDATE SET
+                    covered_from = LEAST(price_bar_coverage.covered_from, EXCLUDED.covered_from)
+                """,
+                [symbol, covered_from],
+            )
+        logger.debug("Saved %d bars for %s", len(bars), symbol)
+        return len(bars)
+
+    @writes
+    def replace_bars(self, symbol: str, df: pd.DataFrame, covered_from: date) -> int:
+        """종목의 저장 이력을 지우고 df로 교체 (분할/배당으로 과거 가격이 재조정됐을 때).
+
+        삭제와 재저장을 한 트랜잭션으로 묶어, 실패하면 기존 이력과 보장 기록이 그대로 남는다.
+        """
+        self.conn.execute("BEGIN TRANSACTION")
+        try:
+            self.conn.execute("DELETE FROM price_bars WHERE symbol = ?", [symbol])
+            self.conn.execute("DELETE FROM price_bar_coverage WHERE symbol = ?", [symbol])
+            saved = self.save_bars(symbol, df, covered_from=covered_from)
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return saved
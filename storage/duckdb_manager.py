@@ -0,0 +1,161 @@
+import functools
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+import duckdb
+
+logger = logging.getLogger(__name__)
+
+
+class DuckDBManager:
+    """DuckDB 파일 하나당 프로세스 공용 연결 관리자.
+
+    NewsStore, StockStore 등 같은 파일을 쓰는 저장소가 duckdb.connect()를 각자 열면
+    버퍼 풀과 카탈로그가 따로 잡히므로, 파일 경로별로 연결 하나를 공유한다.
+    - cursor(): 스레드별 커서 (같은 데이터베이스 인스턴스를 공유하는 동시 읽기용)
+    - writer(): 쓰기 잠금을 잡고 현재 스레드 커서를 반환 — 쓰기는 한 번에 하나만 실행
+    acquire()/release()로 참조 수를 세고, 마지막 release()에서 연결을 닫는다.
+    """
+
+    _registry: dict[str, "DuckDBManager"] = {}
+    _registry_lock = threading.Lock()
+    _settings: dict[str, object] = {}
+
+    def __init__(self, db_path: str, read_only: bool = False):
+        self.db_path = db_path
+        self.read_only = read_only
+        self._conn = duckdb.connect(db_path, read_only=read_only, config=self._connect_config())
+        self._cursors: dict[threading.Thread, duckdb.DuckDBPyConnection] = {}
+        self._cursor_lock = threading.Lock()
+        self._write_lock = threading.RLock()
+        self._refs = 0
+
+    @classmethod
+    def acquire(cls, db_path: str, read_only: bool = False) -> "DuckDBManager":
+        """경로의 공용 관리자를 반환 (없으면 연결). 쓰기 연결이 열려 있으면 읽기 전용 요청도 공유한다."""
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        key = os.path.realpath(db_path)
+        with cls._registry_lock:
+            manager = cls._registry.get(key)
+            if manager is None:
+                manager = cls(db_path, read_only=read_only)
+                cls._registry[key] = manager
+                logger.info("DuckDB opened: %s (read_only=%s)", db_path, read_only)
+            elif manager.read_only and not read_only:
+                raise duckdb.ConnectionException(f"{db_path} is already open read-only in this process")
+            manager._refs += 1
+            return manager
+
+    @classmethod
+    def configure(cls, memory_limit: Optional[str] = None, threads: Optional[int] = None) -> None:
+        """memory_limit/threads 설정. 이후 여는 연결과 이미 열린 연결 모두에 적용."""
+        settings = {}
+        if memory_limit:
+            settings["memory_limit"] = str(memory_limit)
+        if threads:
+            settings["threads"] = int(threads)
+        cls._settings = settings
+        with cls._registry_lock:
+            managers = list(cls._registry.values())
+        for manager in managers:
+            manager._apply_settings()
+
+    @classmethod
+    def _connect_config(cls) -> dict:
+        return dict(cls._settings)
+
+    def _apply_settings(self) -> None:
+        with self._write_lock:
+            for name, value in self._settings.items():
+                self._conn.execute(f"SET {name} = ?", [value])
+
+    def cursor(self) -> duckdb.DuckDBPyConnection:
+        """현재 스레드 전용 커서. 종료된 스레드의 커서는 새 커서를 만들 때 정리한다."""
+        thread = threading.current_thread()
+        with self._cursor_lock:
+            cur = self._cursors.get(thread)
+            if cur is None:
+                for dead in [t for t in self._cursors if not t.is_alive()]:
+                    self._cursors.pop(dead).close()
+                cur = self._conn.cursor()
+                self._cursors[thread] = cur
+            return cur
+
+    @contextmanager
+    def writer(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """쓰기 잠금을 잡은 채 현재 스레드 커서를 빌려준다 (재진입 가능)."""
+        with self._write_lock:
+            yield self.cursor()
+
+    def settings(self) -> dict:
+        """현재 적용된 memory_limit/threads 값."""
+        rows = self.cursor().execute(
+            "SELECT name, value FROM duckdb_settings() WHERE name IN ('memory_limit', 'threads')"
+        ).fetchall()
+        return dict(rows)
+
+    def release(self) -> None:
+        """참조 하나를 반납. 마지막 참조면 모든 커서와 연결을 닫는다."""
+        key = os.path.realpath(self.db_path)
+        with self._registry_lock:
+            self._refs -= 1
+            if self._refs > 0:
+                return
+            if self._registry.get(key) is self:
+                del self._registry[key]
+        with self._cursor_lock:
+            for cur in self._cursors.values():
+                cur.close()
+            self._cursors.clear()
+        self._conn.close()
+        logger.info("DuckDB closed: %s", self.db_path)
+
+
+class DuckDBStore:
+    """DuckDBManager 공용 연결을 쓰는 저장소의 베이스 클래스.
+
+    첫 사용 시 경로의 관리자를 acquire()하고 close()에서 release()한다. 워커 스레드가
+    동시에 처음 접근해도 참조를 한 번만 잡도록 잠금 안에서 acquire한다.
+    쓰기 메서드는 @writes로 감싸 쓰기 잠금 안에서 self.conn을 사용한다.
+    """
+
+    def __init__(self, db_path: str, read_only: bool = False):
+        self.db_path = db_path
+        self._read_only = read_only
+        self._db: Optional[DuckDBManager] = None
+        self._db_lock = threading.Lock()
+
+    @property
+    def db(self) -> DuckDBManager:
+        db = self._db
+        if db is None:
+            with self._db_lock:
+                if self._db is None:
+                    self._db = DuckDBManager.acquire(self.db_path, read_only=self._read_only)
+                db = self._db
+        return db
+
+    @property
+    def conn(self) -> duckdb.DuckDBPyConnection:
+        """현재 스레드의 공용 연결 커서 (워커 스레드마다 별도 커서로 동시 조회)."""
+        return self.db.cursor()
+
+    def close(self) -> None:
+        with self._db_lock:
+            db, self._db = self._db, None
+        if db is not None:
+            db.release()
+
+
+def writes(method: Callable) -> Callable:
+    """저장소 쓰기 메서드 데코레이터 — self.db.writer() 잠금 안에서 실행."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.db.writer():
+            return method(self, *args, **kwargs)
+
+    return wrapper
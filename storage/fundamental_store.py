@@ -0,0 +1,68 @@
+import logging
+from dataclasses import asdict, fields
+from datetime import datetime
+from typing import Optional
+
+from core.models import FundamentalData
+from storage.duckdb_manager import DuckDBStore, writes
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS fundamentals_cache (
+    symbol          VARCHAR PRIMARY KEY,
+    per             DOUBLE,
+    pbr             DOUBLE,
+    eps             DOUBLE,
+    market_cap      DOUBLE,
+    dividend_yield  DOUBLE,
+    sector          VARCHAR,
+    industry        VARCHAR,
+    psr             DOUBLE,
+    roe             DOUBLE,
+    debt_to_equity  DOUBLE,
+    name            VARCHAR,
+    fetched_at      TIMESTAMP NOT NULL
+);
+"""
+
+# symbol을 제외한 FundamentalData 필드 — 테이블 컬럼 순서와 동일
+_FIELDS = [f.name for f in fields(FundamentalData) if f.name != "symbol"]
+
+
+class FundamentalStore(DuckDBStore):
+    """펀더멘털 캐시 영속 저장소 (DuckDB fundamentals_cache 테이블).
+
+    재시작 후에도 ticker.info 결과를 재사용하기 위한 저장소로,
+    TTL 판단은 CachedFundamentalProvider가 fetched_at을 보고 수행한다.
+    """
+
+    def __init__(self, db_path: str = "./data/news.duckdb", read_only: bool = False):
+        super().__init__(db_path, read_only)
+
+    @writes
+    def init_schema(self) -> None:
+        self.conn.execute(SCHEMA_SQL)
+        logger.info("DuckDB fundamentals_cache schema initialized: %s", self.db_path)
+
+    def get(self, symbol: str) -> Optional[tuple[FundamentalData, datetime]]:
+        """(FundamentalData, fetched_at) 반환. 없으면 None."""
+        sql = f"SELECT {', '.join(_FIELDS)}, fetched_at FROM fundamentals_cache WHERE symbol = ?"
+        row = self.conn.execute(sql, [symbol]).fetchone()
+        if row is None:
+            return None
+        data = FundamentalData(symbol=symbol, **dict(zip(_FIELDS, row[:-1])))
+        return data, row[-1]
+
+    @writes
+    def put(self, data: FundamentalData, fetched_at: Optional[datetime] = None) -> None:
+        values = asdict(data)
+        columns = ["symbol"] + _FIELDS + ["fetched_at"]
+        params = [data.symbol] + [values[name] for name in _FIELDS] + [fetched_at or datetime.now()]
+        updates = ", ".join(f"{col} = EXCLUDED.{col}" for col in columns[1:])
+        sql = f"""
+            INSERT INTO fundamentals_cache ({', '.join(columns)})
+            VALUES ({', '.join('?' for _ in columns)})
+            ON CONFLICT (symbol) DO UPDATE SET {updates}
+        """
+        self.conn.execute(sql, params)
@@ -0,0 +1,163 @@
+import hashlib
+import json
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Optional
+
+from storage.duckdb_manager import DuckDBStore, writes
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key          VARCHAR PRIMARY KEY,   -- sha256(model, prompt_version, kind, text)
+    kind         VARCHAR NOT NULL,      -- categorize / translate / sentiment / sentiment_avg
+    model        VARCHAR NOT NULL,
+    value        VARCHAR NOT NULL,      -- 구조화된 출력 (JSON)
+    created_at   TIMESTAMP NOT NULL,
+    last_hit_at  TIMESTAMP NOT NULL
+);
+"""
+
+
+def prompt_version(*prompts: str) -> str:
+    """프롬프트 내용 해시. 프롬프트가 바뀌면 이전 캐시는 자연히 무효화된다."""
+    digest = hashlib.sha256("\0".join(prompts).encode("utf-8")).hexdigest()
+    return digest[:12]
+
+
+def make_key(model: str, version: str, kind: str, text: str) -> str:
+    return hashlib.sha256("\0".join([model, version, kind, text]).encode("utf-8")).hexdigest()
+
+
+class LLMCache(DuckDBStore):
+    """LLM 출력(번역, 카테고리, 심볼, 감성점수) 내용 주소 기반 캐시.
+
+    같은 헤드라인이 피드 재게시, 중복 체크 기간 만료, 백필 등으로 다시 들어와도
+    OpenAI 요청 없이 로컬 조회로 결과를 재사용한다. 오래된 항목은 evict()에서
+    max_age_days와 max_entries 기준으로 정리한다.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "./data/news.duckdb",
+        max_entries: int = 50_000,
+        max_age_days: int = 30,
+        read_only: bool = False,
+        evict_interval: timedelta = timedelta(hours=24),
+    ):
+        super().__init__(db_path, read_only)
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.evict_interval = evict_interval
+        self._last_evicted: Optional[datetime] = None
+        # 감성 분석이 워커 스레드에서 호출되므로 적중/미스 카운터 갱신을 직렬화
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @writes
+    def init_schema(self) -> None:
+        self.conn.execute(SCHEMA_SQL)
+        logger.info("DuckDB llm_cache schema initialized: %s", self.db_path)
+
+    def get(self, kind: str, model: str, version: str, text: str) -> Optional[Any]:
+        return self.get_many(kind, model, version, [text]).get(text)
+
+    def get_many(self, kind: str, model: str, version: str, texts: Iterable[str]) -> dict[str, Any]:
+        """{text: 캐시된 값} 반환. 캐시에 없는 텍스트는 결과에서 빠진다."""
+        keys = {make_key(model, version, kind, t): t for t in dict.fromkeys(texts)}
+        if not keys:
+            return {}
+
+        try:
+            rows = self.conn.execute(
+                "SELECT key, value FROM llm_cache WHERE key IN (SELECT unnest(?))",
+                [list(keys)],
+            ).fetchall()
+            if rows and not self._read_only:
+                self._touch([r[0] for r in rows])
+        except Exception as e:
+            logger.warning("LLM cache read failed: %s", e)
+            rows = []
+
+        found = {keys[key]: json.loads(value) for key, value in rows}
+        with self._lock:
+            self._hits += len(found)
+            self._misses += len(keys) - len(found)
+        return found
+
+    @writes
+    def _touch(self, keys: list[str]) -> None:
+        self.conn.execute(
+            "UPDATE llm_cache SET last_hit_at = ? WHERE key IN (SELECT unnest(?))",
+            [datetime.now(), keys],
+        )
+
+    def put(self, kind: str, model: str, version: str, text: str, value: Any) -> None:
+        self.put_many(kind, model, version, {text: value})
+
+    def put_many(self, kind: str, model: str, version: str, values: dict[str, Any]) -> None:
+        if not values or self._read_only:
+            return
+        now = datetime.now()
+        rows = [
+            (make_key(model, version, kind, text), kind, model, json.dumps(value, ensure_ascii=False), now, now)
+            for text, value in values.items()
+        ]
+        try:
+            self._insert(rows)
+        except Exception as e:
+            logger.warning("LLM cache write failed: %s", e)
+
+    @writes
+    def _insert(self, rows: list[tuple]) -> None:
+        self.conn.executemany(
+            """
+            INSERT INTO llm_cache (key, kind, model, value, created_at, last_hit_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (key) DO UPDATE SET
+                value = EXCLUDED.value,
+                created_at = EXCLUDED.created_at,
+                last_hit_at = EXCLUDED.last_hit_at
+            """,
+            rows,
+        )
+
+    @writes
+    def evict(self) -> int:
+        """max_age_days보다 오래된 항목을 지우고, 남은 항목이 max_entries를 넘으면
+        가장 오래 사용되지 않은 항목부터 정리한다. 삭제 건수 반환."""
+        cutoff = datetime.now() - timedelta(days=self.max_age_days)
+        before = self.conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        self.conn.execute("DELETE FROM llm_cache WHERE created_at < ?", [cutoff])
+        self.conn.execute(
+            """
+            DELETE FROM llm_cache WHERE key IN (
+                SELECT key FROM llm_cache
+                ORDER BY last_hit_at DESC
+                OFFSET ?
+            )
+            """,
+            [self.max_entries],
+        )
+        after = self.conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        removed = before - after
+        self._last_evicted = datetime.now()
+        if removed:
+            logger.info("LLM cache evicted %d entries (%d remaining)", removed, after)
+        return removed
+
+    def evict_if_due(self) -> int:
+        """마지막 정리 후 evict_interval이 지났으면 evict(). 데몬 루프에서 매 사이클 호출."""
+        if self._last_evicted is not None and datetime.now() - self._last_evicted < self.evict_interval:
+            return 0
+        return self.evict()
+
+    def stats(self) -> dict:
+        """조회 적중/미스 카운터와 적중률."""
+        with self._lock:
+            hits, misses = self._hits, self._misses
+        total = hits + misses
+        return {"hits": hits, "misses": misses, "hit_rate": hits / total if total else 0.0}
@@ -1,16 +1,16 @@
 import hashlib
 import logging
-import os
 from datetime import datetime
 from typing import Optional
 
-import duckdb
+import pandas as pd
 
 from storage.models import NewsRecord
 
 logger = logging.getLogger(__name__)
 
 from sender.translator import CATEGORIES
+from storage.duckdb_manager import DuckDBStore, writes
 
 SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS news (
@@ -53,9 +53,46 @@ LEFT JOIN news_categories nc ON n.id = nc.news_id
 LEFT JOIN categories c ON nc.category_id = c.id
 GROUP BY n.id, n.title_original, n.title_translated, n.source, n.link,
          n.published_at, n.collected_at, n.sentiment_score, n.related_symbols, n.title_hash,
-         n.embedding;
+         n.embedding, n.category_mask;
 """
 
+# news.category_mask 비트 i = CATEGORIES[i] — 읽기 쿼리에서 카테고리 조인 없이 사용
+_CATEGORY_BITS = {name: 1 << i for i, name in enumerate(CATEGORIES)}
+
+# news_categories 기준으로 category_mask가 비어 있는 기존 행을 채운다
+BACKFILL_CATEGORY_MASK_SQL = """
+UPDATE news SET category_mask = agg.mask
+FROM (
+    SELECT nc.news_id, bit_or(CAST(1 AS INTEGER) << (list_position(?, c.name) - 1)) AS mask
+    FROM news_categories nc
+    JOIN categories c ON nc.category_id = c.id
+    WHERE list_position(?, c.name) > 0
+    GROUP BY nc.news_id
+) agg
+WHERE news.id = agg.news_id AND news.category_mask IS NULL
+"""
+
+
+# _fetch_records()가 기대하는 컬럼 순서
+_RECORD_COLUMNS = """id, title_original, title_translated, source, link,
+                   published_at, collected_at, sentiment_score, related_symbols, category_mask"""
+
+# get_category_sentiment_summary()의 카테고리별 상위 헤드라인 수
+_TOP_HEADLINES = 5
+
+
+def _category_mask(names: Optional[list[str]]) -> int:
+    mask = 0
+    for name in names or []:
+        mask |= _CATEGORY_BITS.get(name, 0)
+    return mask
+
+
+def _mask_to_categories(mask: Optional[int]) -> Optional[list[str]]:
+    if not mask:
+        return None
+    return [name for name, bit in _CATEGORY_BITS.items() if mask & bit]
+
 
 def _interval(n: int, unit: str = "DAY") -> str:
     """안전한 INTERVAL 리터럴 생성 (정수만 허용)"""
@@ -66,25 +103,23 @@ def _interval(n: int, unit: str = "DAY") -> str:
     return f"INTERVAL '{n}' {unit}"
 
 
-class NewsStore:
-    def __init__(self, db_path: str = "./data/news.duckdb", read_only: bool = False):
-        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
-        self.db_path = db_path
-        self._read_only = read_only
-        self._conn: Optional[duckdb.DuckDBPyConnection] = None
+def _title_hash(title: str) -> str:
+    return hashlib.sha256(title.encode("utf-8")).hexdigest()
 
-    @property
-    def conn(self) -> duckdb.DuckDBPyConnection:
-        if self._conn is None:
-            self._conn = duckdb.connect(self.db_path, read_only=self._read_only)
-        return self._conn
 
+class NewsStore(DuckDBStore):
+    def __init__(self, db_path: str = "./data/news.duckdb", read_only: bool = False):
+        super().__init__(db_path, read_only)
+
+    @writes
     def init_schema(self) -> None:
         self.conn.execute("CREATE SEQUENCE IF NOT EXISTS news_id_seq START 1")
         self.conn.execute(SCHEMA_SQL)
         self.conn.execute(INDEX_SQL)
         # 기존 DB 마이그레이션: embedding 컬럼 추가 (VIEW 생성 전에 실행)
         self.conn.execute("ALTER TABLE news ADD COLUMN IF NOT EXISTS embedding FLOAT[]")
+        # 카테고리 비트마스크 컬럼 (쓰기 시 news_categories와 함께 갱신)
+        self.conn.execute("ALTER TABLE news ADD COLUMN IF NOT EXISTS category_mask INTEGER")
         self.conn.execute("CREATE SEQUENCE IF NOT EXISTS categories_id_seq START 1")
         self.conn.execute(CATEGORIES_SCHEMA_SQL)
         # 시드 데이터 삽입
@@ -93,10 +128,22 @@ class NewsStore:
                 "INSERT INTO categories (name) VALUES (?) ON CONFLICT (name) DO NOTHING",
                 [name],
             )
+        if not self._read_only:
+            self._backfill_category_mask()
         logger.info("DuckDB schema initialized: %s", self.db_path)
 
+    def _backfill_category_mask(self) -> None:
+        """category_mask 컬럼 도입 이전 행을 news_categories 기준으로 채운다 (1회성)."""
+        pending = self.conn.execute("SELECT COUNT(*) FROM news WHERE category_mask IS NULL").fetchone()[0]
+        if not pending:
+            return
+        self.conn.execute(BACKFILL_CATEGORY_MASK_SQL, [CATEGORIES, CATEGORIES])
+        self.conn.execute("UPDATE news SET category_mask = 0 WHERE category_mask IS NULL")
+        logger.info("Backfilled category_mask for %d news rows", pending)
+
+    @writes
     def save_news(self, record: NewsRecord) -> Optional[int]:
-        title_hash = hashlib.sha256(record.title_original.encode("utf-8")).hexdigest()
+        title_hash = _title_hash(record.title_original)
 
         existing = self.conn.execute(
             "SELECT id FROM news WHERE title_hash = ?", [title_hash]
@@ -108,8 +155,8 @@ class NewsStore:
             """
             INSERT INTO news (title_original, title_translated, source, link,
                               published_at, collected_at, sentiment_score,
-                              related_symbols, title_hash, embedding)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                              related_symbols, title_hash, embedding, category_mask)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             RETURNING id
             """,
             [
@@ -123,6 +170,7 @@ class NewsStore:
                 record.related_symbols,
                 title_hash,
                 record.embedding,
+                _category_mask(record.categories),
             ],
         ).fetchone()
 
@@ -131,35 +179,93 @@ class NewsStore:
             self._save_news_categories(news_id, record.categories)
         return news_id
 
+    @writes
     def save_news_batch(self, records: list[NewsRecord]) -> int:
-        """배치로 뉴스 레코드를 저장합니다 (트랜잭션으로 감싸서 I/O 최소화)."""
-        saved = 0
+        """배치로 뉴스 레코드를 저장합니다.
+
+        배치 전체를 DataFrame 하나로 등록한 뒤, 이미 저장된 제목(title_hash)과
+        배치 내 중복을 제외하고 INSERT ... SELECT 한 번으로 저장하고,
+        news_categories도 categories 테이블과의 조인 한 번으로 채운다.
+        배치 크기와 관계없이 실행하는 SQL 문 수는 일정하다.
+        """
+        if not records:
+            return 0
+
+        staged = pd.DataFrame(
+            {
+                "ord": list(range(len(records))),
+                "title_original": [r.title_original for r in records],
+                "title_translated": [r.title_translated for r in records],
+                "source": [r.source for r in records],
+                "link": [r.link for r in records],
+                "published_at": [r.published_at for r in records],
+                "collected_at": [r.collected_at for r in records],
+                "sentiment_score": [r.sentiment_score for r in records],
+                "related_symbols": [r.related_symbols for r in records],
+                "title_hash": [_title_hash(r.title_original) for r in records],
+                "embedding": [r.embedding for r in records],
+                "categories": [r.categories or [] for r in records],
+                "category_mask": [_category_mask(r.categories) for r in records],
+            },
+            dtype=object,
+        )
+
+        self.conn.register("_staged_news", staged)
         self.conn.execute("BEGIN TRANSACTION")
         try:
-            for record in records:
-                result = self.save_news(record)
-                if result is not None:
-                    saved += 1
+            inserted = self.conn.execute(
+                """
+                INSERT INTO news (title_original, title_translated, source, link,
+                                  published_at, collected_at, sentiment_score,
+                                  related_symbols, title_hash, embedding, category_mask)
+                SELECT s.title_original, s.title_translated, s.source, s.link,
+                       CAST(s.published_at AS TIMESTAMP), CAST(s.collected_at AS TIMESTAMP),
+                       CAST(s.sentiment_score AS REAL), CAST(s.related_symbols AS VARCHAR[]),
+                       s.title_hash, CAST(s.embedding AS FLOAT[]), CAST(s.category_mask AS INTEGER)
+                FROM _staged_news s
+                WHERE NOT EXISTS (SELECT 1 FROM news n WHERE n.title_hash = s.title_hash)
+                QUALIFY row_number() OVER (PARTITION BY s.title_hash ORDER BY s.ord) = 1
+                ORDER BY s.ord
+                RETURNING id
+                """
+            ).fetchall()
+            new_ids = [row[0] for row in inserted]
+
+            if new_ids:
+                self.conn.execute(
+                    """
+                    INSERT INTO news_categories (news_id, category_id)
+                    SELECT DISTINCT n.id, c.id
+                    FROM (
+                        SELECT title_hash, unnest(CAST(categories AS VARCHAR[])) AS name
+                        FROM _staged_news
+                        QUALIFY row_number() OVER (PARTITION BY title_hash ORDER BY ord) = 1
+                    ) s
+                    JOIN news n ON n.title_hash = s.title_hash
+                    JOIN categories c ON c.name = s.name
+                    WHERE list_contains(?, n.id)
+                    ON CONFLICT DO NOTHING
+                    """,
+                    [new_ids],
+                )
             self.conn.execute("COMMIT")
         except Exception:
             self.conn.execute("ROLLBACK")
             raise
+        finally:
+            self.conn.unregister("_staged_news")
+
+        saved = len(new_ids)
         logger.info("Saved %d/%d news records", saved, len(records))
         return saved
 
     def search_by_keyword(self, keyword: str, days: int = 30, limit: int = 50) -> list[NewsRecord]:
         sql = f"""
-            SELECT n.id, n.title_original, n.title_translated, n.source, n.link,
-                   n.published_at, n.collected_at, n.sentiment_score, n.related_symbols,
-                   list(c.name ORDER BY c.id) AS categories
-            FROM news n
-            LEFT JOIN news_categories nc ON n.id = nc.news_id
-            LEFT JOIN categories c ON nc.category_id = c.id
-            WHERE (n.title_original ILIKE ? OR n.title_translated ILIKE ?)
-              AND n.collected_at >= CURRENT_TIMESTAMP - {_interval(days)}
-            GROUP BY n.id, n.title_original, n.title_translated, n.source, n.link,
-                     n.published_at, n.collected_at, n.sentiment_score, n.related_symbols
-            ORDER BY n.published_at DESC NULLS LAST
+            SELECT {_RECORD_COLUMNS}
+            FROM news
+            WHERE (title_original ILIKE ? OR title_translated ILIKE ?)
+              AND collected_at >= CURRENT_TIMESTAMP - {_interval(days)}
+            ORDER BY published_at DESC NULLS LAST
             LIMIT ?
         """
         pattern = f"%{keyword}%"
@@ -167,17 +273,11 @@ class NewsStore:
 
     def search_by_symbol(self, symbol: str, days: int = 30, limit: int = 50) -> list[NewsRecord]:
         sql = f"""
-            SELECT n.id, n.title_original, n.title_translated, n.source, n.link,
-                   n.published_at, n.collected_at, n.sentiment_score, n.related_symbols,
-                   list(c.name ORDER BY c.id) AS categories
-            FROM news n
-            LEFT JOIN news_categories nc ON n.id = nc.news_id
-            LEFT JOIN categories c ON nc.category_id = c.id
-            WHERE list_contains(n.related_symbols, ?)
-              AND n.collected_at >= CURRENT_TIMESTAMP - {_interval(days)}
-            GROUP BY n.id, n.title_original, n.title_translated, n.source, n.link,
-                     n.published_at, n.collected_at, n.sentiment_score, n.related_symbols
-            ORDER BY n.published_at DESC NULLS LAST
+            SELECT {_RECORD_COLUMNS}
+            FROM news
+            WHERE list_contains(related_symbols, ?)
+              AND collected_at >= CURRENT_TIMESTAMP - {_interval(days)}
+            ORDER BY published_at DESC NULLS LAST
             LIMIT ?
         """
         return self._fetch_records(sql, [symbol, limit])
@@ -199,48 +299,38 @@ class NewsStore:
 
     def get_recent_headlines(self, hours: int = 24, limit: int = 100) -> list[NewsRecord]:
         sql = f"""
-            SELECT n.id, n.title_original, n.title_translated, n.source, n.link,
-                   n.published_at, n.collected_at, n.sentiment_score, n.related_symbols,
-                   list(c.name ORDER BY c.id) AS categories
-            FROM news n
-            LEFT JOIN news_categories nc ON n.id = nc.news_id
-            LEFT JOIN categories c ON nc.category_id = c.id
-            WHERE n.collected_at >= CURRENT_TIMESTAMP - {_interval(hours, 'HOUR')}
-            GROUP BY n.id, n.title_original, n.title_translated, n.source, n.link,
-                     n.published_at, n.collected_at, n.sentiment_score, n.related_symbols
-            ORDER BY n.published_at DESC NULLS LAST
+            SELECT {_RECORD_COLUMNS}
+            FROM news
+            WHERE collected_at >= CURRENT_TIMESTAMP - {_interval(hours, 'HOUR')}
+            ORDER BY published_at DESC NULLS LAST
             LIMIT ?
         """
         return self._fetch_records(sql, [limit])
 
     def get_negative_news(self, threshold: float = -0.3, days: int = 7, limit: int = 50) -> list[NewsRecord]:
         sql = f"""
-            SELECT n.id, n.title_original, n.title_translated, n.source, n.link,
-                   n.published_at, n.collected_at, n.sentiment_score, n.related_symbols,
-                   list(c.name ORDER BY c.id) AS categories
-            FROM news n
-            LEFT JOIN news_categories nc ON n.id = nc.news_id
-            LEFT JOIN categories c ON nc.category_id = c.id
-            WHERE n.sentiment_score IS NOT NULL
-              AND n.sentiment_score <= ?
-              AND n.collected_at >= CURRENT_TIMESTAMP - {_interval(days)}
-            GROUP BY n.id, n.title_original, n.title_translated, n.source, n.link,
-                     n.published_at, n.collected_at, n.sentiment_score, n.related_symbols
-            ORDER BY n.sentiment_score ASC
+            SELECT {_RECORD_COLUMNS}
+            FROM news
+            WHERE sentiment_score IS NOT NULL
+              AND sentiment_score <= ?
+              AND collected_at >= CURRENT_TIMESTAMP - {_interval(days)}
+            ORDER BY sentiment_score ASC
             LIMIT ?
         """
         return self._fetch_records(sql, [threshold, limit])
 
+    @writes
     def update_sentiment(self, news_id: int, score: float) -> None:
         self.conn.execute("UPDATE news SET sentiment_score = ? WHERE id = ?", [score, news_id])
 
+    @writes
     def update_embedding(self, news_id: int, vector: list[float]) -> None:
         self.conn.execute("UPDATE news SET embedding = ? WHERE id = ?", [vector, news_id])
 
     def get_news_for_clustering(self, days: int = 30, limit: int = 5000) -> list[dict]:
-        """클러스터링용 — id, 제목, embedding을 함께 반환. embedding이 있는 것만 조회."""
+        """클러스터링용 — id, 제목, embedding, 수집 시각을 함께 반환. embedding이 있는 것만 조회."""
         sql = f"""
-            SELECT id, title_original, title_translated, embedding
+            SELECT id, title_original, title_translated, embedding, collected_at
             FROM news
             WHERE embedding IS NOT NULL
               AND collected_at >= CURRENT_TIMESTAMP - {_interval(days)}
@@ -249,7 +339,13 @@ class NewsStore:
         """
         rows = self.conn.execute(sql, [limit]).fetchall()
         return [
-            {"id": row[0], "title_original": row[1], "title_translated": row[2], "embedding": list(row[3])}
+            {
+                "id": row[0],
+                "title_original": row[1],
+                "title_translated": row[2],
+                "embedding": list(row[3]),
+                "collected_at": row[4],
+            }
             for row in rows
         ]
 
@@ -273,35 +369,35 @@ class NewsStore:
             for row in rows
         ]
 
+    @writes
     def update_related_symbols(self, news_id: int, symbols: list[str]) -> None:
         self.conn.execute("UPDATE news SET related_symbols = ? WHERE id = ?", [symbols, news_id])
 
     def search_by_category(self, category_name: str, days: int = 30, limit: int = 50) -> list[NewsRecord]:
+        bit = _CATEGORY_BITS.get(category_name)
+        if bit is None:
+            return []
         sql = f"""
-            SELECT n.id, n.title_original, n.title_translated, n.source, n.link,
-                   n.published_at, n.collected_at, n.sentiment_score, n.related_symbols,
-                   list(c2.name ORDER BY c2.id) AS categories
-            FROM news n
-            JOIN news_categories nc ON n.id = nc.news_id
-            JOIN categories c ON nc.category_id = c.id
-            LEFT JOIN news_categories nc2 ON n.id = nc2.news_id
-            LEFT JOIN categories c2 ON nc2.category_id = c2.id
-            WHERE c.name = ?
-              AND n.collected_at >= CURRENT_TIMESTAMP - {_interval(days)}
-            GROUP BY n.id, n.title_original, n.title_translated, n.source, n.link,
-                     n.published_at, n.collected_at, n.sentiment_score, n.related_symbols
-            ORDER BY n.published_at DESC NULLS LAST
+            SELECT {_RECORD_COLUMNS}
+            FROM news
+            WHERE (category_mask & ?) != 0
+              AND collected_at >= CURRENT_TIMESTAMP - {_interval(days)}
+            ORDER BY published_at DESC NULLS LAST
             LIMIT ?
         """
-        return self._fetch_records(sql, [category_name, limit])
+        return self._fetch_records(sql, [bit, limit])
 
     def get_all_categories(self) -> list[dict]:
         rows = self.conn.execute("SELECT id, name FROM categories ORDER BY id").fetchall()
         return [{"id": row[0], "name": row[1]} for row in rows]
 
+    @writes
     def update_categories(self, news_id: int, category_names: list[str]) -> None:
         self.conn.execute("DELETE FROM news_categories WHERE news_id = ?", [news_id])
         self._save_news_categories(news_id, category_names)
+        self.conn.execute(
+            "UPDATE news SET category_mask = ? WHERE id = ?", [_category_mask(category_names), news_id]
+        )
 
     def _save_news_categories(self, news_id: int, category_names: list[str]) -> None:
         for name in category_names:
@@ -315,15 +411,10 @@ class NewsStore:
                 )
 
     def _fetch_records(self, sql: str, params: list) -> list[NewsRecord]:
-        """쿼리 결과를 NewsRecord 리스트로 변환 (카테고리 JOIN 포함)."""
+        """_RECORD_COLUMNS 순서의 쿼리 결과를 NewsRecord 리스트로 변환 (category_mask → 카테고리 이름)."""
         rows = self.conn.execute(sql, params).fetchall()
         records = []
         for row in rows:
-            # JOIN으로 가져온 categories 컬럼 (인덱스 9)
-            raw_categories = row[9] if len(row) > 9 else None
-            # DuckDB list()는 NULL 값을 포함할 수 있으므로 필터링
-            categories = [c for c in raw_categories if c is not None] if raw_categories else None
-
             records.append(NewsRecord(
                 id=row[0],
                 title_original=row[1],
@@ -334,7 +425,7 @@ class NewsStore:
                 collected_at=row[6],
                 sentiment_score=row[7],
                 related_symbols=row[8],
-                categories=categories if categories else None,
+                categories=_mask_to_categories(row[9]),
             ))
         return records
 
@@ -349,7 +440,7 @@ class NewsStore:
         """
         half = max(1, days // 2)
 
-        # 카테고리별 전체 평균/건수 + 전반/후반 평균
+        # 집계와 카테고리별 상위 헤드라인(max_by top-k)을 한 번의 스캔으로 계산
         sql = f"""
             SELECT
                 c.name AS category,
@@ -359,7 +450,8 @@ class NewsStore:
                          THEN n.sentiment_score END) AS recent_avg,
                 AVG(CASE WHEN n.collected_at <  CURRENT_TIMESTAMP - {_interval(half)}
                               AND n.collected_at >= CURRENT_TIMESTAMP - {_interval(days)}
-                         THEN n.sentiment_score END) AS older_avg
+                         THEN n.sentiment_score END) AS older_avg,
+                max_by((n.title_translated, n.sentiment_score), n.sentiment_score, {_TOP_HEADLINES}) AS top_headlines
             FROM news n
             JOIN news_categories nc ON n.id = nc.news_id
             JOIN categories c ON nc.category_id = c.id
@@ -371,35 +463,14 @@ class NewsStore:
         rows = self.conn.execute(sql).fetchall()
 
         results = []
-        for row in rows:
-            category = row[0]
-            avg_sent = row[1]
-            count = row[2]
-            recent_avg = row[3]
-            older_avg = row[4]
-
-            # 해당 카테고리의 감성점수 상위 헤드라인
-            hl_sql = f"""
-                SELECT n.title_translated, n.sentiment_score
-                FROM news n
-                JOIN news_categories nc ON n.id = nc.news_id
-                JOIN categories c ON nc.category_id = c.id
-                WHERE c.name = ?
-                  AND n.sentiment_score IS NOT NULL
-                  AND n.collected_at >= CURRENT_TIMESTAMP - {_interval(days)}
-                ORDER BY n.sentiment_score DESC
-                LIMIT 5
-            """
-            hl_rows = self.conn.execute(hl_sql, [category]).fetchall()
-            top_headlines = [(r[0], r[1]) for r in hl_rows]
-
+        for category, avg_sent, count, recent_avg, older_avg, top_headlines in rows:
             results.append({
                 "category": category,
                 "avg_sentiment": float(avg_sent) if avg_sent is not None else 0.0,
                 "news_count": int(count),
                 "recent_avg": float(recent_avg) if recent_avg is not None else None,
                 "older_avg": float(older_avg) if older_avg is not None else None,
-                "top_headlines": top_headlines,
+                "top_headlines": [tuple(h) for h in top_headlines],
             })
 
         return results
@@ -407,12 +478,11 @@ class NewsStore:
     def get_uncategorized_news(self, limit: int = 500) -> list[NewsRecord]:
         """카테고리가 없는 뉴스 목록 조회"""
         sql = """
-            SELECT n.id, n.title_original, n.title_translated, n.source, n.link,
-                   n.published_at, n.collected_at, n.sentiment_score, n.related_symbols
-            FROM news n
-            LEFT JOIN news_categories nc ON n.id = nc.news_id
-            WHERE nc.news_id IS NULL
-            ORDER BY n.collected_at DESC
+            SELECT id, title_original, title_translated, source, link,
+                   published_at, collected_at, sentiment_score, related_symbols
+            FROM news
+            WHERE category_mask = 0 OR category_mask IS NULL
+            ORDER BY collected_at DESC
             LIMIT ?
         """
         rows = self.conn.execute(sql, [limit]).fetchall()
@@ -425,8 +495,3 @@ class NewsStore:
             )
             for row in rows
         ]
-
-    def close(self) -> None:
-        if self._conn:
-            self._conn.close()
-            self._conn = None
@@ -1,10 +1,16 @@
+import hashlib
 import logging
 import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Iterator, Optional
 
 import psycopg2
 import psycopg2.extras
+import psycopg2.pool
 from dotenv import load_dotenv
 
 from sender.translator import CATEGORIES
@@ -61,76 +67,203 @@ LEFT JOIN categories c ON nc.category_id = c.id
 GROUP BY n.id;
 """
 
+# execute_values 한 문장당 행 수
+_PAGE_SIZE = 1000
+
+# 뉴스 컬럼 + 카테고리 배열. 카테고리는 같은 문장의 상관 서브쿼리로 가져오며,
+# ORDER BY ... LIMIT가 있으면 Postgres가 LIMIT 이후 행에 대해서만 평가한다.
+_RECORD_COLUMNS = """n.id, n.title_original, n.title_translated, n.source, n.link,
+                   n.published_at, n.collected_at, n.sentiment_score, n.related_symbols,
+                   (SELECT array_agg(c.name ORDER BY c.id) FILTER (WHERE c.name IS NOT NULL)
+                    FROM news_categories nc
+                    JOIN categories c ON nc.category_id = c.id
+                    WHERE nc.news_id = n.id) AS categories"""
+
+# iter_news() 서버측 커서가 한 번에 가져오는 행 수
+_STREAM_BATCH_SIZE = 2000
+
+
+def _title_hash(title: str) -> str:
+    return hashlib.sha256(title.encode("utf-8")).hexdigest()
+
+
+def _row_to_record(row) -> NewsRecord:
+    return NewsRecord(
+        id=row["id"],
+        title_original=row["title_original"],
+        title_translated=row["title_translated"],
+        source=row["source"],
+        link=row["link"],
+        published_at=row["published_at"],
+        collected_at=row["collected_at"],
+        sentiment_score=row["sentiment_score"],
+        related_symbols=row["related_symbols"],
+        categories=row["categories"],
+    )
+
 
 class PgNewsStore:
-    def __init__(self, dsn: Optional[str] = None):
+    """Postgres 뉴스 저장소.
+
+    여러 작성자(스레드)가 동시에 쓰는 배포를 위해 ThreadedConnectionPool을 사용한다.
+    풀 자체는 연결이 모두 사용 중이면 즉시 PoolError를 내므로, 세마포어로 최대
+    acquire_timeout초까지 대기시키고 대기/포화 지표를 pool_stats()로 노출한다.
+    각 _connection() 블록은 하나의 트랜잭션이다 (정상 종료 시 commit, 예외 시 rollback).
+    """
+
+    def __init__(
+        self,
+        dsn: Optional[str] = None,
+        min_connections: int = 1,
+        max_connections: int = 10,
+        acquire_timeout: float = 30.0,
+    ):
         self.dsn = dsn or os.getenv("DATABASE_URL", "postgresql://localhost:5432/stock_up")
-        self._conn: Optional[psycopg2.extensions.connection] = None
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.acquire_timeout = acquire_timeout
+        self._pool: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._stats_lock = threading.Lock()
+        self._in_use = 0
+        self._peak_in_use = 0
+        self._acquisitions = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._timeouts = 0
 
     @property
-    def conn(self) -> psycopg2.extensions.connection:
-        if self._conn is None or self._conn.closed:
-            self._conn = psycopg2.connect(self.dsn)
-            self._conn.autocommit = True
-        return self._conn
+    def pool(self) -> psycopg2.pool.ThreadedConnectionPool:
+        with self._pool_lock:
+            if self._pool is None or self._pool.closed:
+                self._pool = psycopg2.pool.ThreadedConnectionPool(
+                    self.min_connections, self.max_connections, self.dsn,
+                )
+            return self._pool
+
+    @contextmanager
+    def _connection(self) -> Iterator[psycopg2.extensions.connection]:
+        """풀에서 연결을 빌려 한 트랜잭션을 실행."""
+        started = time.monotonic()
+        if not self._slots.acquire(blocking=False):
+            with self._stats_lock:
+                self._waits += 1
+            if not self._slots.acquire(timeout=self.acquire_timeout):
+                with self._stats_lock:
+                    self._timeouts += 1
+                raise psycopg2.pool.PoolError(
+                    f"connection pool exhausted ({self.max_connections} in use for {self.acquire_timeout}s)"
+                )
+        waited = time.monotonic() - started
+
+        try:
+            conn = self.pool.getconn()
+        except Exception:
+            self._slots.release()
+            raise
+        with self._stats_lock:
+            self._acquisitions += 1
+            self._wait_seconds += waited
+            self._in_use += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+
+        broken = False
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                broken = True
+            raise
+        finally:
+            self.pool.putconn(conn, close=broken or conn.closed != 0)
+            with self._stats_lock:
+                self._in_use -= 1
+            self._slots.release()
+
+    def pool_stats(self) -> dict:
+        """풀 포화 지표. saturation = 사용 중 연결 / 최대 연결."""
+        with self._stats_lock:
+            return {
+                "max_connections": self.max_connections,
+                "in_use": self._in_use,
+                "peak_in_use": self._peak_in_use,
+                "saturation": self._in_use / self.max_connections,
+                "acquisitions": self._acquisitions,
+                "waits": self._waits,
+                "avg_wait_ms": self._wait_seconds / self._acquisitions * 1000 if self._acquisitions else 0.0,
+                "timeouts": self._timeouts,
+            }
 
     def init_schema(self) -> None:
-        with self.conn.cursor() as cur:
+        with self._connection() as conn, conn.cursor() as cur:
             cur.execute(SCHEMA_SQL)
             cur.execute(CATEGORIES_SCHEMA_SQL)
-            for name in CATEGORIES:
-                cur.execute(
-                    "INSERT INTO categories (name) VALUES (%s) ON CONFLICT (name) DO NOTHING",
-                    (name,),
-                )
+            psycopg2.extras.execute_values(
+                cur,
+                "INSERT INTO categories (name) VALUES %s ON CONFLICT (name) DO NOTHING",
+                [(name,) for name in CATEGORIES],
+            )
         logger.info("Database schema initialized")
 
     def save_news(self, record: NewsRecord) -> Optional[int]:
-        import hashlib
+        with self._connection() as conn, conn.cursor() as cur:
+            ids = self._insert_records(cur, [record])
+        return ids.get(_title_hash(record.title_original))
 
-        title_hash = hashlib.sha256(record.title_original.encode("utf-8")).hexdigest()
-        sql = """
+    def save_news_batch(self, records: list[NewsRecord]) -> int:
+        """배치 전체를 한 트랜잭션에서 execute_values로 저장하고 신규 저장 건수 반환."""
+        if not records:
+            return 0
+        with self._connection() as conn, conn.cursor() as cur:
+            saved = len(self._insert_records(cur, records))
+        logger.info("Saved %d/%d news records", saved, len(records))
+        return saved
+
+    def _insert_records(self, cur, records: list[NewsRecord]) -> dict[str, int]:
+        """신규 레코드를 넣고 {title_hash: id} 반환. 기존/배치 내 중복은 건너뛴다."""
+        unique: dict[str, NewsRecord] = {}
+        for record in records:
+            unique.setdefault(_title_hash(record.title_original), record)
+
+        rows = psycopg2.extras.execute_values(
+            cur,
+            """
             INSERT INTO news (title_original, title_translated, source, link,
                               published_at, collected_at, sentiment_score,
                               related_symbols, title_hash)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            VALUES %s
             ON CONFLICT (title_hash) DO NOTHING
-            RETURNING id
-        """
-        with self.conn.cursor() as cur:
-            cur.execute(sql, (
-                record.title_original,
-                record.title_translated,
-                record.source,
-                record.link,
-                record.published_at,
-                record.collected_at,
-                record.sentiment_score,
-                record.related_symbols,
-                title_hash,
-            ))
-            row = cur.fetchone()
-            news_id = row[0] if row else None
-
-        if news_id and record.categories:
-            self._save_news_categories(news_id, record.categories)
-        return news_id
-
-    def save_news_batch(self, records: list[NewsRecord]) -> int:
-        saved = 0
-        for record in records:
-            result = self.save_news(record)
-            if result is not None:
-                saved += 1
-        logger.info("Saved %d/%d news records", saved, len(records))
-        return saved
+            RETURNING title_hash, id
+            """,
+            [
+                (
+                    r.title_original, r.title_translated, r.source, r.link,
+                    r.published_at, r.collected_at, r.sentiment_score,
+                    r.related_symbols, title_hash,
+                )
+                for title_hash, r in unique.items()
+            ],
+            page_size=_PAGE_SIZE,
+            fetch=True,
+        )
+        ids = dict(rows)
+
+        self._save_news_categories(cur, [
+            (news_id, name)
+            for title_hash, news_id in ids.items()
+            for name in unique[title_hash].categories or []
+        ])
+        return ids
 
     def search_by_keyword(self, keyword: str, days: int = 30, limit: int = 50) -> list[NewsRecord]:
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-        sql = """
-            SELECT id, title_original, title_translated, source, link,
-                   published_at, collected_at, sentiment_score, related_symbols
-            FROM news
+        sql = f"""
+            SELECT {_RECORD_COLUMNS}
+            FROM news n
             WHERE to_tsvector('simple', title_original || ' ' || title_translated)
                   @@ plainto_tsquery('simple', %s)
               AND collected_at >= %s
@@ -141,10 +274,9 @@ class PgNewsStore:
 
     def search_by_symbol(self, symbol: str, days: int = 30, limit: int = 50) -> list[NewsRecord]:
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-        sql = """
-            SELECT id, title_original, title_translated, source, link,
-                   published_at, collected_at, sentiment_score, related_symbols
-            FROM news
+        sql = f"""
+            SELECT {_RECORD_COLUMNS}
+            FROM news n
             WHERE %s = ANY(related_symbols)
               AND collected_at >= %s
             ORDER BY published_at DESC
@@ -164,16 +296,15 @@ class PgNewsStore:
             GROUP BY DATE(published_at)
             ORDER BY date DESC
         """
-        with self.conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
+        with self._connection() as conn, conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
             cur.execute(sql, (cutoff,))
             return [dict(row) for row in cur.fetchall()]
 
     def get_recent_headlines(self, hours: int = 24, limit: int = 100) -> list[NewsRecord]:
         cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-        sql = """
-            SELECT id, title_original, title_translated, source, link,
-                   published_at, collected_at, sentiment_score, related_symbols
-            FROM news
+        sql = f"""
+            SELECT {_RECORD_COLUMNS}
+            FROM news n
             WHERE collected_at >= %s
             ORDER BY published_at DESC
             LIMIT %s
@@ -182,10 +313,9 @@ class PgNewsStore:
 
     def get_negative_news(self, threshold: float = -0.3, days: int = 7, limit: int = 50) -> list[NewsRecord]:
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-        sql = """
-            SELECT id, title_original, title_translated, source, link,
-                   published_at, collected_at, sentiment_score, related_symbols
-            FROM news
+        sql = f"""
+            SELECT {_RECORD_COLUMNS}
+            FROM news n
             WHERE sentiment_score IS NOT NULL
               AND sentiment_score <= %s
               AND collected_at >= %s
@@ -196,23 +326,24 @@ class PgNewsStore:
 
     def update_sentiment(self, news_id: int, score: float) -> None:
         sql = "UPDATE news SET sentiment_score = %s WHERE id = %s"
-        with self.conn.cursor() as cur:
+        with self._connection() as conn, conn.cursor() as cur:
             cur.execute(sql, (score, news_id))
 
     def update_related_symbols(self, news_id: int, symbols: list[str]) -> None:
         sql = "UPDATE news SET related_symbols = %s WHERE id = %s"
-        with self.conn.cursor() as cur:
+        with self._connection() as conn, conn.cursor() as cur:
             cur.execute(sql, (symbols, news_id))
 
     def search_by_category(self, category_name: str, days: int = 30, limit: int = 50) -> list[NewsRecord]:
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-        sql = """
-            SELECT DISTINCT n.id, n.title_original, n.title_translated, n.source, n.link,
-                   n.published_at, n.collected_at, n.sentiment_score, n.related_symbols
+        sql = f"""
+            SELECT {_RECORD_COLUMNS}
             FROM news n
-            JOIN news_categories nc ON n.id = nc.news_id
-            JOIN categories c ON nc.category_id = c.id
-            WHERE c.name = %s
+            WHERE EXISTS (
+                SELECT 1 FROM news_categories nc
+                JOIN categories c ON nc.category_id = c.id
+                WHERE nc.news_id = n.id AND c.name = %s
+            )
               AND n.collected_at >= %s
             ORDER BY n.published_at DESC
             LIMIT %s
@@ -220,58 +351,68 @@ class PgNewsStore:
         return self._fetch_records(sql, (category_name, cutoff, limit))
 
     def get_all_categories(self) -> list[dict]:
-        with self.conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
+        with self._connection() as conn, conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
             cur.execute("SELECT id, name FROM categories ORDER BY id")
             return [dict(row) for row in cur.fetchall()]
 
     def update_categories(self, news_id: int, category_names: list[str]) -> None:
-        with self.conn.cursor() as cur:
+        with self._connection() as conn, conn.cursor() as cur:
             cur.execute("DELETE FROM news_categories WHERE news_id = %s", (news_id,))
-        self._save_news_categories(news_id, category_names)
-
-    def _save_news_categories(self, news_id: int, category_names: list[str]) -> None:
-        with self.conn.cursor() as cur:
-            for name in category_names:
-                cur.execute("SELECT id FROM categories WHERE name = %s", (name,))
-                cat = cur.fetchone()
-                if cat:
-                    cur.execute(
-                        "INSERT INTO news_categories (news_id, category_id) VALUES (%s, %s) ON CONFLICT DO NOTHING",
-                        (news_id, cat[0]),
-                    )
+            self._save_news_categories(cur, [(news_id, name) for name in category_names])
+
+    def _save_news_categories(self, cur, pairs: list[tuple[int, str]]) -> None:
+        """(news_id, 카테고리명) 쌍을 카테고리 id로 바꿔 한 문장으로 저장. 없는 이름은 무시."""
+        if not pairs:
+            return
+        psycopg2.extras.execute_values(
+            cur,
+            """
+            INSERT INTO news_categories (news_id, category_id)
+            SELECT v.news_id, c.id
+            FROM (VALUES %s) AS v(news_id, name)
+            JOIN categories c ON c.name = v.name
+            ON CONFLICT DO NOTHING
+            """,
+            pairs,
+            template="(%s::integer, %s::varchar)",
+            page_size=_PAGE_SIZE,
+        )
+
+    def iter_news(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        batch_size: int = _STREAM_BATCH_SIZE,
+    ) -> Iterator[NewsRecord]:
+        """수집 시각 순으로 뉴스를 스트리밍 (내보내기용).
+
+        서버측 named cursor로 batch_size 행씩 가져오므로 결과 전체를 메모리에 올리지 않는다.
+        반복이 끝나거나 제너레이터가 닫힐 때까지 풀 연결 하나를 점유한다.
+        """
+        sql = f"""
+            SELECT {_RECORD_COLUMNS}
+            FROM news n
+            WHERE (%s::timestamptz IS NULL OR n.collected_at >= %s)
+              AND (%s::timestamptz IS NULL OR n.collected_at < %s)
+            ORDER BY n.collected_at, n.id
+        """
+        with self._connection() as conn:
+            with conn.cursor(
+                name=f"iter_news_{uuid.uuid4().hex}", cursor_factory=psycopg2.extras.DictCursor,
+            ) as cur:
+                cur.itersize = batch_size
+                cur.execute(sql, (since, since, until, until))
+                for row in cur:
+                    yield _row_to_record(row)
 
     def _fetch_records(self, sql: str, params: tuple) -> list[NewsRecord]:
-        with self.conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
+        with self._connection() as conn, conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
             cur.execute(sql, params)
-            records = []
-            for row in cur.fetchall():
-                news_id = row["id"]
-                # 카테고리 조회
-                cur2 = self.conn.cursor()
-                cur2.execute(
-                    """SELECT c.name FROM categories c
-                       JOIN news_categories nc ON c.id = nc.category_id
-                       WHERE nc.news_id = %s""",
-                    (news_id,),
-                )
-                cat_rows = cur2.fetchall()
-                categories = [r[0] for r in cat_rows] if cat_rows else None
-                cur2.close()
-
-                records.append(NewsRecord(
-                    id=news_id,
-                    title_original=row["title_original"],
-                    title_translated=row["title_translated"],
-                    source=row["source"],
-                    link=row["link"],
-                    published_at=row["published_at"],
-                    collected_at=row["collected_at"],
-                    sentiment_score=row["sentiment_score"],
-                    related_symbols=row["related_symbols"],
-                    categories=categories,
-                ))
-            return records
+            return [_row_to_record(row) for row in cur.fetchall()]
 
     def close(self) -> None:
-        if self._conn and not self._conn.closed:
-            self._conn.close()
+        with self._pool_lock:
+            if self._pool is not None and not self._pool.closed:
+                self._pool.closeall()
+            self._pool = None
+
@@ -1,9 +1,9 @@
 import logging
-import os
 from datetime import datetime
-from typing import Optional
 
-import duckdb
+import pandas as pd
+
+from storage.duckdb_manager import DuckDBStore, writes
 
 logger = logging.getLogger(__name__)
 
@@ -51,20 +51,91 @@ CREATE INDEX IF NOT EXISTS idx_snapshot_date ON stock_snapshots(date);
 CREATE INDEX IF NOT EXISTS idx_snapshot_symbol_date ON stock_snapshots(symbol, date);
 """
 
-
-class StockStore:
+# stock_snapshots 쓰기/조회 컬럼 (id 제외, 스키마 순서)
+_SNAPSHOT_COLUMNS = [
+    "symbol", "date", "open", "high", "low", "close", "volume",
+    "rsi", "macd", "macd_signal", "macd_histogram",
+    "sma_20", "sma_50", "sma_200",
+    "bollinger_upper", "bollinger_middle", "bollinger_lower",
+    "per", "pbr", "psr", "roe", "eps", "dividend_yield", "debt_to_equity",
+    "market_cap", "sector", "industry", "collected_at",
+]
+
+_COLUMN_TYPES = {
+    **{col: "REAL" for col in _SNAPSHOT_COLUMNS},
+    "symbol": "VARCHAR",
+    "date": "DATE",
+    "volume": "BIGINT",
+    "market_cap": "BIGINT",
+    "sector": "VARCHAR",
+    "industry": "VARCHAR",
+    "collected_at": "TIMESTAMP",
+}
+
+
+def _typed_column(values: pd.Series, sql_type: str) -> pd.Series:
+    """_COLUMN_TYPES에 맞는 pandas dtype으로 변환.
+
+    object 컬럼을 그대로 register하면 DuckDB가 앞쪽 샘플로 타입을 추정하므로, 뒤쪽에 큰
+    거래량이 나오면 INT로 추정된 컬럼에 넣다가 배치 전체가 실패한다.
+    """
+    if sql_type == "VARCHAR":
+        return values.astype(object).where(values.notna(), None)
+    if sql_type == "DATE":
+        return pd.to_datetime(
+            [v.date() if isinstance(v, datetime) else v for v in values], errors="coerce"
+        ).normalize().to_series(index=values.index)
+    if sql_type == "TIMESTAMP":
+        return pd.to_datetime(values, errors="coerce")
+    numeric = pd.to_numeric(values, errors="coerce")
+    if sql_type == "BIGINT":
+        if not pd.api.types.is_integer_dtype(numeric):
+            numeric = numeric.round()
+        return numeric.astype("Int64")
+    return numeric.astype("Float64")
+
+
+def _snapshot_row(symbol: str, date, quote, indicators, fundamentals, collected_at: datetime) -> list:
+    """(quote, indicators, fundamentals) 객체를 _SNAPSHOT_COLUMNS 순서의 값 리스트로 변환."""
+    sma = getattr(indicators, "sma", {}) or {}
+    market_cap = getattr(fundamentals, "market_cap", None)
+    return [
+        symbol,
+        date.date() if isinstance(date, datetime) else date,
+        getattr(quote, "open", None),
+        getattr(quote, "high", None),
+        getattr(quote, "low", None),
+        getattr(quote, "price", None),
+        getattr(quote, "volume", None),
+        getattr(indicators, "rsi", None),
+        getattr(indicators, "macd", None),
+        getattr(indicators, "macd_signal", None),
+        getattr(indicators, "macd_histogram", None),
+        sma.get(20),
+        sma.get(50),
+        sma.get(200),
+        getattr(indicators, "bollinger_upper", None),
+        getattr(indicators, "bollinger_middle", None),
+        getattr(indicators, "bollinger_lower", None),
+        getattr(fundamentals, "per", None),
+        getattr(fundamentals, "pbr", None),
+        getattr(fundamentals, "psr", None),
+        getattr(fundamentals, "roe", None),
+        getattr(fundamentals, "eps", None),
+        getattr(fundamentals, "dividend_yield", None),
+        getattr(fundamentals, "debt_to_equity", None),
+        int(market_cap) if market_cap is not None else None,
+        getattr(fundamentals, "sector", None),
+        getattr(fundamentals, "industry", None),
+        collected_at,
+    ]
+
+
+class StockStore(DuckDBStore):
     def __init__(self, db_path: str = "./data/news.duckdb", read_only: bool = False):
-        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
-        self.db_path = db_path
-        self._read_only = read_only
-        self._conn: Optional[duckdb.DuckDBPyConnection] = None
-
-    @property
-    def conn(self) -> duckdb.DuckDBPyConnection:
-        if self._conn is None:
-            self._conn = duckdb.connect(self.db_path, read_only=self._read_only)
-        return self._conn
+        super().__init__(db_path, read_only)
 
+    @writes
     def init_schema(self) -> None:
         self.conn.execute("CREATE SEQUENCE IF NOT EXISTS stock_snapshot_id_seq START 1")
         self.conn.execute(SCHEMA_SQL)
@@ -80,115 +151,71 @@ class StockStore:
         fundamentals=None,
     ) -> None:
         """스냅샷 저장. 같은 (symbol, date)가 있으면 최신 값으로 갱신."""
-        snap_date = date.date() if isinstance(date, datetime) else date
-
-        # quote 데이터
-        open_ = getattr(quote, "open", None)
-        high = getattr(quote, "high", None)
-        low = getattr(quote, "low", None)
-        close = getattr(quote, "price", None)
-        volume = getattr(quote, "volume", None)
-
-        # 기술적 지표
-        rsi = getattr(indicators, "rsi", None)
-        macd = getattr(indicators, "macd", None)
-        macd_signal = getattr(indicators, "macd_signal", None)
-        macd_histogram = getattr(indicators, "macd_histogram", None)
-        sma = getattr(indicators, "sma", {}) or {}
-        sma_20 = sma.get(20)
-        sma_50 = sma.get(50)
-        sma_200 = sma.get(200)
-        bollinger_upper = getattr(indicators, "bollinger_upper", None)
-        bollinger_middle = getattr(indicators, "bollinger_middle", None)
-        bollinger_lower = getattr(indicators, "bollinger_lower", None)
-
-        # 펀더멘탈
-        per = getattr(fundamentals, "per", None)
-        pbr = getattr(fundamentals, "pbr", None)
-        psr = getattr(fundamentals, "psr", None)
-        roe = getattr(fundamentals, "roe", None)
-        eps = getattr(fundamentals, "eps", None)
-        dividend_yield = getattr(fundamentals, "dividend_yield", None)
-        debt_to_equity = getattr(fundamentals, "debt_to_equity", None)
-        market_cap = getattr(fundamentals, "market_cap", None)
-        if market_cap is not None:
-            market_cap = int(market_cap)
-        sector = getattr(fundamentals, "sector", None)
-        industry = getattr(fundamentals, "industry", None)
-
-        self.conn.execute(
-            """
-            INSERT INTO stock_snapshots (
-                symbol, date, open, high, low, close, volume,
-                rsi, macd, macd_signal, macd_histogram,
-                sma_20, sma_50, sma_200,
-                bollinger_upper, bollinger_middle, bollinger_lower,
-                per, pbr, psr, roe, eps, dividend_yield, debt_to_equity,
-                market_cap, sector, industry, collected_at
-            ) VALUES (
-                ?, ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?,
-                ?, ?, ?,
-                ?, ?, ?,
-                ?, ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?
-            )
-            ON CONFLICT (symbol, date) DO UPDATE SET
-                open = EXCLUDED.open,
-                high = EXCLUDED.high,
-                low = EXCLUDED.low,
-                close = EXCLUDED.close,
-                volume = EXCLUDED.volume,
-                rsi = EXCLUDED.rsi,
-                macd = EXCLUDED.macd,
-                macd_signal = EXCLUDED.macd_signal,
-                macd_histogram = EXCLUDED.macd_histogram,
-                sma_20 = EXCLUDED.sma_20,
-                sma_50 = EXCLUDED.sma_50,
-                sma_200 = EXCLUDED.sma_200,
-                bollinger_upper = EXCLUDED.bollinger_upper,
-                bollinger_middle = EXCLUDED.bollinger_middle,
-                bollinger_lower = EXCLUDED.bollinger_lower,
-                per = EXCLUDED.per,
-                pbr = EXCLUDED.pbr,
-                psr = EXCLUDED.psr,
-                roe = EXCLUDED.roe,
-                eps = EXCLUDED.eps,
-                dividend_yield = EXCLUDED.dividend_yield,
-                debt_to_equity = EXCLUDED.debt_to_equity,
-                market_cap = EXCLUDED.market_cap,
-                sector = EXCLUDED.sector,
-                industry = EXCLUDED.industry,
-                collected_at = EXCLUDED.collected_at
-            """,
+        self.save_snapshots_batch([{
+            "symbol": symbol,
+            "date": date,
+            "quote": quote,
+            "indicators": indicators,
+            "fundamentals": fundamentals,
+        }])
+
+    def save_snapshots_batch(self, snapshots: list[dict]) -> int:
+        """배치로 스냅샷 저장. 각 dict는 save_snapshot과 동일한 키를 가짐."""
+        collected_at = datetime.now()
+        frame = pd.DataFrame(
             [
-                symbol, snap_date, open_, high, low, close, volume,
-                rsi, macd, macd_signal, macd_histogram,
-                sma_20, sma_50, sma_200,
-                bollinger_upper, bollinger_middle, bollinger_lower,
-                per, pbr, psr, roe, eps, dividend_yield, debt_to_equity,
-                market_cap, sector, industry, datetime.now(),
+                _snapshot_row(
+                    snap["symbol"], snap["date"], snap.get("quote"),
+                    snap.get("indicators"), snap.get("fundamentals"), collected_at,
+                )
+                for snap in snapshots
             ],
+            columns=_SNAPSHOT_COLUMNS,
+            dtype=object,
         )
+        return self.save_snapshots_frame(frame)
 
-    def save_snapshots_batch(self, snapshots: list[dict]) -> int:
-        """배치로 스냅샷 저장. 각 dict는 save_snapshot과 동일한 키를 가짐."""
-        saved = 0
-        self.conn.execute("BEGIN TRANSACTION")
+    @writes
+    def save_snapshots_frame(self, frame: pd.DataFrame) -> int:
+        """컬럼형 배치 upsert. stock_snapshots 컬럼명을 가진 DataFrame을 한 문장으로 저장.
+
+        symbol, date는 필수이고 없는 컬럼은 NULL, collected_at이 없으면 현재 시각으로 채운다.
+        배치 안에서 (symbol, date)가 겹치면 마지막 행이 반영된다.
+        """
+        if frame.empty:
+            return 0
+        unknown = set(frame.columns) - set(_SNAPSHOT_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown snapshot columns: {sorted(unknown)}")
+
+        staged = frame.reindex(columns=_SNAPSHOT_COLUMNS).astype(object)
+        if staged["collected_at"].isna().any():
+            staged["collected_at"] = staged["collected_at"].where(staged["collected_at"].notna(), datetime.now())
+        staged = pd.DataFrame(
+            {col: _typed_column(staged[col], _COLUMN_TYPES[col]) for col in _SNAPSHOT_COLUMNS},
+            index=staged.index,
+        )
+        staged.insert(0, "ord", range(len(staged)))
+
+        casts = ",\n                       ".join(
+            f"CAST({col} AS {_COLUMN_TYPES[col]})" for col in _SNAPSHOT_COLUMNS
+        )
+        self.conn.register("_staged_snapshots", staged)
         try:
-            for snap in snapshots:
-                self.save_snapshot(
-                    symbol=snap["symbol"],
-                    date=snap["date"],
-                    quote=snap.get("quote"),
-                    indicators=snap.get("indicators"),
-                    fundamentals=snap.get("fundamentals"),
-                )
-                saved += 1
-            self.conn.execute("COMMIT")
-        except Exception:
-            self.conn.execute("ROLLBACK")
-            raise
+            self.conn.execute(
+                f"""
+                INSERT INTO stock_snapshots ({", ".join(_SNAPSHOT_COLUMNS)})
+                SELECT {casts}
+                FROM _staged_snapshots
+                QUALIFY row_number() OVER (PARTITION BY symbol, CAST(date AS DATE) ORDER BY ord DESC) = 1
+                ON CONFLICT (symbol, date) DO UPDATE SET
+                    {", ".join(f"{col} = EXCLUDED.{col}" for col in _SNAPSHOT_COLUMNS[2:])}
+                """
+            )
+        finally:
+            self.conn.unregister("_staged_snapshots")
+
+        saved = staged.drop_duplicates(["symbol", "date"]).shape[0]
         logger.info("Saved %d stock snapshots", saved)
         return saved
 
@@ -207,17 +234,4 @@ class StockStore:
             ORDER BY date DESC
         """
         rows = self.conn.execute(sql, [symbol]).fetchall()
-        cols = [
-            "symbol", "date", "open", "high", "low", "close", "volume",
-            "rsi", "macd", "macd_signal", "macd_histogram",
-            "sma_20", "sma_50", "sma_200",
-            "bollinger_upper", "bollinger_middle", "bollinger_lower",
-            "per", "pbr", "psr", "roe", "eps", "dividend_yield", "debt_to_equity",
-            "market_cap", "sector", "industry", "collected_at",
-        ]
-        return [dict(zip(cols, row)) for row in rows]
-
-    def close(self) -> None:
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        return [dict(zip(_SNAPSHOT_COLUMNS, row)) for row in rows]
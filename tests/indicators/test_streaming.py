@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators.streaming import IndicatorState, load_states, save_states
+from indicators.technical import calculate_indicators
+
+_CONFIG = {"indicators": {"sma_periods": [5, 20, 50]}}
+
+
+def _assert_same(actual, expected):
+    assert actual.symbol == expected.symbol
+    for name in ("rsi", "macd", "macd_signal", "macd_histogram",
+                 "bollinger_upper", "bollinger_middle", "bollinger_lower"):
+        if getattr(expected, name) is None:
+            assert getattr(actual, name) is None, name
+        else:
+            assert getattr(actual, name) == pytest.approx(getattr(expected, name), rel=1e-9), name
+    assert actual.sma.keys() == expected.sma.keys()
+    for period, value in expected.sma.items():
+        assert actual.sma[period] == (None if value is None else pytest.approx(value, rel=1e-9))
+
+
+@pytest.fixture
+def closes():
+    rng = np.random.default_rng(7)
+    return list(100 + np.cumsum(rng.normal(0, 1, 120)))
+
+
+def test_update_matches_full_recompute(closes):
+    state = IndicatorState.from_history("AAPL", closes[:30], _CONFIG)
+    for i in range(30, len(closes)):
+        result = state.update(closes[i])
+        if i % 15 == 0:
+            expected = calculate_indicators(pd.DataFrame({"Close": closes[: i + 1]}), "AAPL", _CONFIG)
+            _assert_same(result, expected)
+
+    expected = calculate_indicators(pd.DataFrame({"Close": closes}), "AAPL", _CONFIG)
+    _assert_same(state.result(), expected)
+
+
+def test_short_history_leaves_unready_values_empty(closes):
+    state = IndicatorState.from_history("AAPL", closes[:10], _CONFIG)
+    expected = calculate_indicators(pd.DataFrame({"Close": closes[:10]}), "AAPL", _CONFIG)
+
+    _assert_same(state.result(), expected)
+    assert state.result().rsi is None
+    assert state.result().sma[20] is None
+
+
+def test_peek_does_not_mutate_state(closes):
+    state = IndicatorState.from_history("AAPL", closes[:-1], _CONFIG)
+    before = state.result()
+
+    peeked = state.peek(closes[-1])
+
+    assert state.result() == before
+    expected = calculate_indicators(pd.DataFrame({"Close": closes}), "AAPL", _CONFIG)
+    _assert_same(peeked, expected)
+
+
+def test_states_round_trip_through_json(tmp_path, closes):
+    path = str(tmp_path / "states.json")
+    state = IndicatorState.from_history("AAPL", closes[:-1], _CONFIG)
+    state.as_of = "2024-06-01"
+    save_states({"AAPL": state}, path)
+
+    restored = load_states(path)["AAPL"]
+
+    assert restored.as_of == "2024-06-01"
+    _assert_same(restored.result(), state.result())
+    _assert_same(restored.update(closes[-1]), state.update(closes[-1]))
+
+
+def test_load_states_missing_file(tmp_path):
+    assert load_states(str(tmp_path / "missing.json")) == {}
@@ -1,8 +1,10 @@
+import numpy as np
 import pandas as pd
 import pytest
 
 from indicators.technical import (
     calculate_indicators,
+    calculate_indicators_panel,
     compute_bollinger,
     compute_macd,
     compute_rsi,
@@ -77,3 +79,41 @@ def test_calculate_indicators():
     assert result.macd is not None
     assert 20 in result.sma
     assert 50 in result.sma
+
+
+def _random_walk(n: int, seed: int) -> list[float]:
+    rng = np.random.default_rng(seed)
+    return list(100 + np.cumsum(rng.normal(0, 1, n)))
+
+
+def test_calculate_indicators_panel_matches_per_symbol():
+    index = pd.date_range("2024-01-01", periods=250, freq="B")
+    panel = pd.DataFrame({
+        "AAA": _random_walk(250, 1),
+        "BBB": _random_walk(250, 2),
+        "NEW": [np.nan] * 100 + _random_walk(150, 3),  # 상장이 늦은 종목
+        "GAP": _random_walk(250, 4),
+        "EMPTY": [np.nan] * 250,
+    }, index=index)
+    panel.iloc[120, panel.columns.get_loc("GAP")] = np.nan  # 중간 결측
+    config = {"indicators": {"sma_periods": [20, 50, 200]}}
+
+    results = calculate_indicators_panel(panel, config)
+
+    assert list(results) == ["AAA", "BBB", "NEW", "GAP"]
+    for sym, result in results.items():
+        df = panel[[sym]].dropna().rename(columns={sym: "Close"})
+        assert result == calculate_indicators(df, sym, config)
+    assert results["NEW"].sma[200] is None
+
+
+def test_calculate_indicators_panel_accepts_array():
+    values = np.column_stack([_random_walk(60, 5), _random_walk(60, 6)])
+
+    results = calculate_indicators_panel(values, {}, symbols=["X", "Y"])
+
+    expected = calculate_indicators(pd.DataFrame({"Close": values[:, 1]}), "Y", {})
+    assert results["Y"] == expected
+
+    with pytest.raises(ValueError):
+        calculate_indicators_panel(values, {}, symbols=["X"])
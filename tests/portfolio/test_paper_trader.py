@@ -82,3 +82,10 @@ class TestPosition:
         p2 = Position.from_dict(d)
         assert p2.symbol == p.symbol
         assert p2.entry_price == p.entry_price
+
+
+def test_market_value_uses_current_prices(trader):
+    trader.execute_signal(_make_signal(price=50.0))
+    shares = trader.positions[0].shares
+    assert trader.market_value({"TEST": 60.0}) == pytest.approx(trader.cash + shares * 60.0)
+    assert trader.market_value({}) == pytest.approx(trader.total_value)
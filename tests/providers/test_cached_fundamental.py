@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.models import FundamentalData
+from providers.fundamental.cached_fundamental import CachedFundamentalProvider
+from providers.fundamental.yfinance_fundamental import YFinanceFundamentalProvider
+from storage.fundamental_store import FundamentalStore
+from utils.concurrency import TokenBucket
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = FundamentalStore(db_path=str(tmp_path / "test.duckdb"))
+    s.init_schema()
+    yield s
+    s.close()
+
+
+def _provider(per: float = 12.0):
+    provider = MagicMock()
+    provider.get_fundamentals.side_effect = lambda s: FundamentalData(
+        symbol=s, per=per, sector="Technology", name=f"{s} Inc.",
+    )
+    return provider
+
+
+def test_fresh_entry_is_served_from_cache(store):
+    provider = _provider()
+    cache = CachedFundamentalProvider(provider, store=store)
+
+    first = cache.get_fundamentals("AAPL")
+    second = cache.get_fundamentals("AAPL")
+
+    assert first == second
+    assert provider.get_fundamentals.call_count == 1
+    stats = cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_cache_survives_restart(store):
+    CachedFundamentalProvider(_provider(), store=store).get_fundamentals("AAPL")
+
+    provider = _provider()
+    cache = CachedFundamentalProvider(provider, store=store)
+    data = cache.get_fundamentals("AAPL")
+
+    assert provider.get_fundamentals.call_count == 0
+    assert data.per == 12.0
+    assert data.name == "AAPL Inc."
+    assert cache.is_cached("AAPL")
+    assert not cache.is_cached("MSFT")
+
+
+def test_stale_entry_returned_and_refreshed_in_background(store):
+    store.put(FundamentalData(symbol="AAPL", per=10.0), datetime.now() - timedelta(hours=30))
+    provider = _provider(per=20.0)
+    cache = CachedFundamentalProvider(provider, store=store, ttl=timedelta(hours=24))
+
+    stale = cache.get_fundamentals("AAPL")
+    cache.wait_for_refreshes()
+
+    assert stale.per == 10.0
+    assert provider.get_fundamentals.call_count == 1
+    assert store.get("AAPL")[0].per == 20.0
+    assert cache.get_fundamentals("AAPL").per == 20.0
+    stats = cache.stats()
+    assert stats["stale_hits"] == 1
+    assert stats["refreshes"] == 1
+
+
+def test_expired_entry_fetched_synchronously(store):
+    store.put(FundamentalData(symbol="AAPL", per=10.0), datetime.now() - timedelta(days=10))
+    cache = CachedFundamentalProvider(_provider(per=20.0), store=store)
+
+    assert not cache.is_cached("AAPL")
+    assert cache.get_fundamentals("AAPL").per == 20.0
+    assert cache.stats()["misses"] == 1
+
+
+def test_fetch_failure_is_not_cached():
+    provider = MagicMock()
+    provider.get_fundamentals.side_effect = RuntimeError("429")
+    cache = CachedFundamentalProvider(provider)
+
+    with pytest.raises(RuntimeError):
+        cache.get_fundamentals("AAPL")
+    assert not cache.is_cached("AAPL")
+
+
+@patch("providers.fundamental.yfinance_fundamental.yf.Ticker")
+def test_background_refresh_goes_through_provider_rate_limiter(mock_ticker, store):
+    store.put(FundamentalData(symbol="AAPL", per=10.0), datetime.now() - timedelta(hours=30))
+    mock_ticker.return_value.info = {"trailingPE": 20.0}
+    limiter = MagicMock(spec=TokenBucket)
+    cache = CachedFundamentalProvider(YFinanceFundamentalProvider(rate_limiter=limiter), store=store)
+
+    assert cache.rate_limiter is limiter
+    assert cache.get_fundamentals("AAPL").per == 10.0
+    cache.wait_for_refreshes()
+    assert limiter.acquire.call_count == 1
+    assert store.get("AAPL")[0].per == 20.0
@@ -0,0 +1,135 @@
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from core.models import FundamentalData, StockQuote
+from indicators.technical import calculate_indicators
+from providers.market_data import MarketDataContext
+
+_CONFIG = {"concurrency": {"max_workers": 4, "provider_limits": {"price": 2}}}
+
+
+def _providers():
+    price = MagicMock()
+    price.get_current_price.side_effect = lambda s: StockQuote(
+        symbol=s, price=100.0, open=99.0, high=101.0, low=98.0, volume=1000, timestamp=datetime.now(),
+    )
+    price.get_historical.return_value = pd.DataFrame({"Close": [100 + i * 0.5 for i in range(60)]})
+    fundamental = MagicMock()
+    fundamental.get_fundamentals.side_effect = lambda s: FundamentalData(symbol=s, per=12.0)
+    return price, fundamental
+
+
+def test_get_fetches_each_symbol_once():
+    price, fundamental = _providers()
+    ctx = MarketDataContext(_CONFIG, price, fundamental)
+
+    first = ctx.get("AAPL")
+    second = ctx.get("AAPL")
+
+    assert first is second
+    assert price.get_current_price.call_count == 1
+    assert price.get_historical.call_count == 1
+    assert fundamental.get_fundamentals.call_count == 1
+    assert first.indicators.symbol == "AAPL"
+    assert first.fundamentals.per == 12.0
+
+
+def test_prefetch_then_get_reuses_data():
+    price, fundamental = _providers()
+    ctx = MarketDataContext(_CONFIG, price, fundamental)
+
+    ctx.prefetch(["AAPL", "MSFT", "AAPL"])
+    ctx.get("MSFT")
+
+    assert price.get_current_price.call_count == 2
+    assert ctx.prices() == {"AAPL": 100.0, "MSFT": 100.0}
+
+
+def test_failure_is_cached_for_the_cycle():
+    price, fundamental = _providers()
+    price.get_current_price.side_effect = ValueError("no data")
+    ctx = MarketDataContext(_CONFIG, price, fundamental)
+
+    with pytest.raises(ValueError):
+        ctx.get("BAD")
+    with pytest.raises(ValueError):
+        ctx.get("BAD")
+    assert price.get_current_price.call_count == 1
+
+
+def test_fundamentals_failure_is_not_fatal():
+    price, fundamental = _providers()
+    fundamental.get_fundamentals.side_effect = RuntimeError("rate limited")
+    ctx = MarketDataContext(_CONFIG, price, fundamental)
+
+    assert ctx.get("AAPL").fundamentals is None
+
+
+def test_prefetch_uses_panel_indicators_for_batched_history():
+    price, fundamental = _providers()
+    frames = {
+        "AAPL": pd.DataFrame({"Close": [100 + i * 0.5 for i in range(60)]}),
+        "MSFT": pd.DataFrame({"Close": [200 - i * 0.5 for i in range(60)]}),
+    }
+    price.get_historical_many.return_value = (frames, {})
+    price.get_historical.side_effect = lambda s, period: frames[s]
+    ctx = MarketDataContext(_CONFIG, price, fundamental)
+
+    with patch("providers.market_data.calculate_indicators") as per_symbol:
+        ctx.prefetch(["AAPL", "MSFT"])
+
+    per_symbol.assert_not_called()
+    assert ctx.get("MSFT").indicators == calculate_indicators(frames["MSFT"], "MSFT", _CONFIG)
+
+
+def _daily_history(closes: list[float], end: pd.Timestamp) -> pd.DataFrame:
+    return pd.DataFrame({"Close": closes}, index=pd.date_range(end=end, periods=len(closes), freq="D"))
+
+
+def test_streaming_indicators_update_only_new_closed_bars():
+    price, fundamental = _providers()
+    closes = [100 + i * 0.5 + (i % 3) for i in range(80)]
+    today = pd.Timestamp.now().normalize()
+    states: dict = {}
+
+    # 1사이클: 어제까지 확정 봉 + 오늘 진행 중인 봉
+    price.get_historical.return_value = _daily_history(closes[:-1], today)
+    first = MarketDataContext(_CONFIG, price, fundamental, indicator_states=states).get("AAPL")
+    seeded = states["AAPL"]
+    assert seeded.as_of == (today - pd.Timedelta(days=1)).date().isoformat()
+
+    expected = calculate_indicators(pd.DataFrame({"Close": closes[:-2] + [100.0]}), "AAPL", _CONFIG)
+    assert first.indicators.rsi == pytest.approx(expected.rsi)
+    assert first.indicators.sma[20] == pytest.approx(expected.sma[20])
+
+    # 2사이클: 하루 뒤 — 새로 확정된 봉 하나만 반영
+    price.get_historical.return_value = _daily_history(closes, today + pd.Timedelta(days=1))
+    with patch.object(type(seeded), "update", wraps=seeded.update) as update:
+        ctx = MarketDataContext(_CONFIG, price, fundamental, indicator_states=states)
+        with patch("providers.market_data.pd.Timestamp.now", return_value=today + pd.Timedelta(days=1)):
+            ctx.get("AAPL")
+    assert states["AAPL"] is seeded
+    assert update.call_count == 1
+    assert seeded.as_of == today.date().isoformat()
+
+
+def test_streaming_indicators_reseed_when_history_is_readjusted():
+    price, fundamental = _providers()
+    closes = [100 + i * 0.5 for i in range(60)]
+    yesterday = pd.Timestamp.now().normalize() - pd.Timedelta(days=1)
+    states: dict = {}
+
+    price.get_historical.return_value = _daily_history(closes, yesterday)
+    MarketDataContext(_CONFIG, price, fundamental, indicator_states=states).get("AAPL")
+    seeded = states["AAPL"]
+
+    # 2:1 분할로 과거 종가가 모두 재조정됨
+    adjusted = _daily_history([c / 2 for c in closes], yesterday)
+    price.get_historical.return_value = adjusted
+    result = MarketDataContext(_CONFIG, price, fundamental, indicator_states=states).get("AAPL")
+
+    assert states["AAPL"] is not seeded
+    assert result.indicators.sma[20] == pytest.approx(calculate_indicators(adjusted, "AAPL", _CONFIG).sma[20])
@@ -0,0 +1,65 @@
+import time
+from unittest.mock import patch
+
+import requests
+
+from providers.news.rss_provider import RSSNewsProvider, fetch_all_feeds
+
+_FEEDS = [
+    {"source": "slow", "url": "https://slow.example.com/rss"},
+    {"source": "fast", "url": "https://fast.example.com/rss"},
+    {"source": "broken", "url": "https://broken.example.com/rss"},
+]
+
+
+def _fake_fetch(self):
+    if "slow" in self.url:
+        time.sleep(0.2)
+    if "broken" in self.url:
+        raise ValueError("boom")
+    return [{"title": f"headline from {self.url}"}]
+
+
+@patch.object(RSSNewsProvider, "_fetch", _fake_fetch)
+def test_fetch_all_feeds_keeps_config_order():
+    results = fetch_all_feeds(_FEEDS)
+    assert [r.source for r in results] == ["slow", "fast", "broken"]
+    assert results[0].items == [{"title": "headline from https://slow.example.com/rss"}]
+    assert results[2].error == "boom"
+    assert results[0].latency >= 0.2
+
+
+@patch.object(RSSNewsProvider, "_fetch", _fake_fetch)
+def test_fetch_all_feeds_runs_concurrently():
+    feeds = [{"source": f"slow{i}", "url": f"https://slow{i}.example.com/rss"} for i in range(4)]
+    started = time.monotonic()
+    results = fetch_all_feeds(feeds)
+    assert time.monotonic() - started < 0.6
+    assert all(r.error is None for r in results)
+
+
+@patch.object(RSSNewsProvider, "_fetch", _fake_fetch)
+def test_fetch_all_feeds_deadline_marks_timeout():
+    results = fetch_all_feeds(_FEEDS[:2], deadline=0.05)
+    by_source = {r.source: r for r in results}
+    assert by_source["slow"].error == "timeout"
+    assert by_source["fast"].error is None
+
+
+def test_fetch_all_feeds_skips_entries_without_url():
+    assert fetch_all_feeds([{"source": "empty"}]) == []
+
+
+@patch("crawler.rss_fetcher.time.sleep")
+@patch("crawler.rss_fetcher._validate_url")
+def test_retries_counts_retries_after_first_request(_validate, _sleep):
+    for retries, expected_calls in [(0, 1), (2, 3)]:
+        provider = RSSNewsProvider("https://feed.example.com/rss", retries=retries)
+        with patch.object(provider.fetcher.session, "get", side_effect=requests.ConnectionError("down")) as get:
+            assert provider.fetch_news() == []
+        assert get.call_count == expected_calls
+
+
+def test_negative_retries_override_is_reported_as_feed_error():
+    results = fetch_all_feeds([{"source": "bad", "url": "https://bad.example.com/rss", "retries": -1}])
+    assert "retries" in results[0].error
@@ -0,0 +1,86 @@
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from providers.price.yfinance_provider import YFinancePriceProvider
+
+
+def _download_frame(symbols, missing=()):
+    index = pd.date_range("2024-01-01", periods=5, freq="D")
+    columns = pd.MultiIndex.from_product([symbols, ["Open", "High", "Low", "Close", "Volume"]])
+    data = np.arange(len(index) * len(columns), dtype=float).reshape(len(index), len(columns))
+    raw = pd.DataFrame(data, index=index, columns=columns)
+    for sym in missing:
+        raw[sym] = np.nan
+    return raw
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    YFinancePriceProvider._historical_cache.clear()
+    yield
+    YFinancePriceProvider._historical_cache.clear()
+
+
+@patch("providers.price.yfinance_provider.yf.download")
+def test_get_historical_many_splits_and_caches(mock_download):
+    mock_download.return_value = _download_frame(["AAPL", "MSFT", "GONE"], missing=["GONE"])
+    provider = YFinancePriceProvider()
+
+    frames, failures = provider.get_historical_many(["AAPL", "MSFT", "GONE"], period="6mo")
+
+    assert set(frames) == {"AAPL", "MSFT"}
+    assert list(frames["AAPL"].columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert "GONE" in failures
+    assert mock_download.call_count == 1
+
+    # 배치로 채운 캐시를 단건 조회가 재사용
+    with patch("providers.price.yfinance_provider._create_ticker") as mock_ticker:
+        df = provider.get_historical("AAPL", period="6mo")
+        mock_ticker.assert_not_called()
+    assert df is frames["AAPL"]
+
+
+@patch("providers.price.yfinance_provider.yf.download")
+def test_get_historical_many_chunks_requests(mock_download):
+    mock_download.side_effect = lambda tickers, **kwargs: _download_frame(list(tickers))
+    provider = YFinancePriceProvider()
+
+    symbols = [f"S{i}" for i in range(5)]
+    frames, failures = provider.get_historical_many(symbols, chunk_size=2)
+
+    assert mock_download.call_count == 3
+    assert set(frames) == set(symbols)
+    assert failures == {}
+
+
+@patch("providers.price.yfinance_provider.time.sleep")
+@patch("providers.price.yfinance_provider.yf.download")
+def test_get_historical_many_chunk_failure_is_isolated(mock_download, _sleep):
+    def fake_download(tickers, **kwargs):
+        if "BAD" in tickers:
+            raise ConnectionError("network down")
+        return _download_frame(list(tickers))
+
+    mock_download.side_effect = fake_download
+    provider = YFinancePriceProvider()
+
+    frames, failures = provider.get_historical_many(["AAPL", "BAD"], chunk_size=1)
+
+    assert set(frames) == {"AAPL"}
+    assert "network down" in failures["BAD"]
+
+
+@patch("providers.price.yfinance_provider.yf.download")
+def test_get_historical_many_skips_cached_symbols(mock_download):
+    provider = YFinancePriceProvider()
+    cached = _download_frame(["AAPL"])["AAPL"]
+    YFinancePriceProvider._historical_cache[("AAPL", "6mo")] = (datetime.now(), cached)
+
+    frames, _ = provider.get_historical_many(["AAPL"])
+
+    mock_download.assert_not_called()
+    assert frames["AAPL"] is cached
@@ -1,6 +1,13 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
-from screener.stock_screener import StockScreener
+import numpy as np
+import pandas as pd
+
+from core.models import FundamentalData
+from indicators.technical import compute_rsi
+from providers.fundamental.yfinance_fundamental import YFinanceFundamentalProvider
+from screener.stock_screener import StockScreener, _prefilter
+from utils.concurrency import TokenBucket
 
 
 def test_screener_init():
@@ -21,9 +28,25 @@ def _mock_sp500():
     ]
 
 
-@patch("screener.stock_screener.UNIVERSE_FETCHERS", {"sp500": _mock_sp500})
-@patch("screener.stock_screener.yf.Tickers")
-def test_discover_stocks_filters(mock_tickers):
+def _download(symbols, days=22, seed=0, volume=1_000_000):
+    """yf.download(group_by="ticker") 형태의 (날짜, (종목, 필드)) 프레임."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2025-01-02", periods=days, freq="B")
+    frames = {}
+    for sym in symbols:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, days)))
+        frames[sym] = pd.DataFrame(
+            {"Open": close, "High": close, "Low": close, "Close": close,
+             "Volume": rng.integers(volume // 2, volume * 2, days).astype(float)},
+            index=dates,
+        )
+    return pd.concat(frames, axis=1)
+
+
+@patch("screener.stock_screener.UniverseCache.load", lambda self, universe: _mock_sp500())
+@patch("screener.stock_screener.yf.download", lambda *args, **kwargs: _download(["AAPL", "TINY"]))
+@patch("screener.stock_screener.yf.Ticker")
+def test_discover_stocks_filters(mock_ticker):
     mock_ticker_aapl = MagicMock()
     mock_ticker_aapl.info = {
         "marketCap": 3_000_000_000_000,
@@ -42,7 +65,7 @@ def test_discover_stocks_filters(mock_tickers):
         "currentPrice": 1.0,
     }
 
-    mock_tickers.return_value.tickers = {"AAPL": mock_ticker_aapl, "TINY": mock_ticker_tiny}
+    mock_ticker.side_effect = {"AAPL": mock_ticker_aapl, "TINY": mock_ticker_tiny}.get
 
     config = {
         "universes": ["sp500"],
@@ -55,3 +78,133 @@ def test_discover_stocks_filters(mock_tickers):
     symbols = [r.symbol for r in results]
     assert "AAPL" in symbols
     assert "TINY" not in symbols
+
+
+class _RateLimitedProvider:
+    """처음 failures번은 429로 실패하는 펀더멘털 프로바이더."""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.calls = 0
+
+    def get_fundamentals(self, symbol):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise Exception("429 Client Error: Too Many Requests")
+        return FundamentalData(symbol=symbol, market_cap=2_000_000_000)
+
+
+def _info_screener(provider, max_retries=3):
+    config = {"info_fetch": {"requests_per_second": 1000, "max_retries": max_retries}}
+    return StockScreener(config, fundamental_provider=provider)
+
+
+@patch("screener.stock_screener._RATE_LIMIT_BACKOFF", 0.01)
+def test_fetch_fundamentals_retries_after_rate_limit():
+    provider = _RateLimitedProvider(failures=2)
+    fundamentals = _info_screener(provider)._fetch_fundamentals("AAPL")
+
+    assert fundamentals.market_cap == 2_000_000_000
+    assert provider.calls == 3
+
+
+@patch("screener.stock_screener._RATE_LIMIT_BACKOFF", 0.01)
+def test_fetch_fundamentals_gives_up_after_max_retries():
+    provider = _RateLimitedProvider(failures=10)
+    assert _info_screener(provider, max_retries=1)._fetch_fundamentals("AAPL") is None
+    assert provider.calls == 2
+
+
+def test_fetch_fundamentals_does_not_retry_other_errors():
+    provider = MagicMock()
+    provider.get_fundamentals.side_effect = ValueError("no data")
+    assert _info_screener(provider)._fetch_fundamentals("AAPL") is None
+    assert provider.get_fundamentals.call_count == 1
+
+
+class _CountingBucket(TokenBucket):
+    def __init__(self):
+        super().__init__(rate=1000)
+        self.acquired = 0
+        self.paused = 0
+
+    def acquire(self) -> float:
+        self.acquired += 1
+        return super().acquire()
+
+    def pause(self, seconds: float) -> None:
+        self.paused += 1
+        super().pause(seconds)
+
+
+@patch("screener.stock_screener._RATE_LIMIT_BACKOFF", 0.01)
+@patch("providers.fundamental.yfinance_fundamental.yf.Ticker")
+def test_rate_limit_retry_goes_through_provider_bucket(mock_ticker):
+    """429는 프로바이더 내부에서 재시도하지 않고, 스크리너 재시도도 프로바이더 버킷을 거친다."""
+    limited = MagicMock()
+    type(limited).info = PropertyMock(side_effect=Exception("429 Client Error: Too Many Requests"))
+    ok = MagicMock()
+    ok.info = {"marketCap": 2_000_000_000}
+    mock_ticker.side_effect = [limited, ok]
+
+    bucket = _CountingBucket()
+    screener = _info_screener(YFinanceFundamentalProvider(rate_limiter=bucket))
+
+    assert screener.info_bucket is bucket
+    assert screener._fetch_fundamentals("AAPL").market_cap == 2_000_000_000
+    assert mock_ticker.call_count == 2
+    assert bucket.acquired == 2
+    assert bucket.paused == 1
+
+
+def _legacy_prefilter(raw, symbols, min_avg_volume, max_rsi):
+    """종목별로 raw[sym]을 잘라 계산하던 기존 사전 필터."""
+    passed = []
+    for sym in symbols:
+        if sym not in raw.columns.get_level_values(0):
+            continue
+        df = raw[sym].dropna(how="all")
+        if df.empty or df["Volume"].mean() < min_avg_volume:
+            continue
+        if max_rsi:
+            rsi = compute_rsi(df["Close"], period=14).iloc[-1]
+            if pd.isna(rsi) or rsi > max_rsi:
+                continue
+        passed.append(sym)
+    return passed
+
+
+def test_prefilter_matches_per_symbol_loop():
+    symbols = [f"S{i}" for i in range(60)]
+    raw = _download(symbols, seed=1)
+    raw.loc[raw.index[:5], "S1"] = np.nan            # 상장 전 구간
+    raw.loc[raw.index[7], "S2"] = np.nan             # 중간 거래 정지
+    raw.loc[raw.index[-1], "S3"] = np.nan            # 마지막 날 결측
+    raw.loc[raw.index[3], ("S4", "Close")] = np.nan  # 종가만 결측
+    raw.loc[:, "S5"] = np.nan                        # 데이터 없음
+    raw.loc[raw.index[:-1], "S6"] = np.nan           # 하루치만 있음
+
+    for min_avg_volume, max_rsi in [(0, None), (1_000_000, None), (500_000, 45), (0, 60)]:
+        metrics = _prefilter(raw, symbols + ["MISSING"], min_avg_volume, max_rsi)
+        assert list(metrics.index) == _legacy_prefilter(raw, symbols + ["MISSING"], min_avg_volume, max_rsi)
+
+
+def test_prefilter_metrics():
+    raw = _download(["AAPL", "MSFT"], seed=2)
+    raw.loc[raw.index[:5], "MSFT"] = np.nan
+    metrics = _prefilter(raw, ["AAPL", "MSFT"], 0, 100)
+
+    msft = raw["MSFT"].dropna(how="all")
+    assert metrics.loc["MSFT", "price"] == msft["Close"].iloc[-1]
+    assert np.isclose(metrics.loc["MSFT", "avg_volume"], msft["Volume"].mean())
+    assert np.isclose(
+        metrics.loc["MSFT", "change_pct"],
+        (msft["Close"].iloc[-1] - msft["Close"].iloc[0]) / msft["Close"].iloc[0],
+    )
+    assert np.isclose(metrics.loc["AAPL", "rsi"], compute_rsi(raw["AAPL"]["Close"], 14).iloc[-1])
+
+
+def test_prefilter_single_symbol_and_empty_download():
+    raw = _download(["AAPL"])["AAPL"]
+    assert list(_prefilter(raw, ["AAPL"], 0, None).index) == ["AAPL"]
+    assert _prefilter(pd.DataFrame(), ["AAPL"], 0, None).empty
@@ -0,0 +1,114 @@
+import io
+import json
+import os
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from screener.universe import UniverseCache, _parse_nasdaq100, _parse_sp500, load_bundled
+
+SP500_HTML = """
+<html><body>
+<table class="wikitable" id="constituents">
+  <tbody>
+    <tr><th>Symbol</th><th>Security</th><th>GICS Sector</th><th>Date added</th></tr>
+    <tr><td><a href="#">AAPL</a></td><td>Apple Inc.</td><td>Information Technology</td><td>1982-11-30</td></tr>
+    <tr><td><a href="#">BRK.B</a></td><td>Berkshire Hathaway<sup class="reference">[3]</sup></td><td>Financials</td><td>2010-02-16</td></tr>
+    <tr><td>MMM</td><td>3M</td><td>Industrials</td><td>1957-03-04</td></tr>
+  </tbody>
+</table>
+<table class="wikitable"><tr><th>Date</th><th>Added</th></tr><tr><td>2025</td><td>X</td></tr></table>
+</body></html>
+"""
+
+NASDAQ_HTML = """
+<html><body>
+<table><tr><th>Year</th><th>Close</th></tr><tr><td>2024</td><td>21012</td></tr></table>
+<table class="wikitable" id="constituents">
+  <thead><tr><th>Company</th><th>Ticker</th><th>GICS Sector</th></tr></thead>
+  <tbody>
+    <tr><td>Adobe Inc.</td><td>ADBE</td><td>Information Technology</td></tr>
+    <tr><td>Amgen</td><td>AMGN</td><td>Health Care</td></tr>
+  </tbody>
+</table>
+</body></html>
+"""
+
+
+def test_parse_sp500_matches_read_html():
+    expected = [
+        {"symbol": row["Symbol"].replace(".", "-"), "name": row["Security"], "sector": row["GICS Sector"]}
+        for _, row in pd.read_html(io.StringIO(SP500_HTML))[0].iterrows()
+    ]
+    parsed = _parse_sp500(SP500_HTML)
+    assert [p["symbol"] for p in parsed] == ["AAPL", "BRK-B", "MMM"]
+    assert parsed[1]["name"] == "Berkshire Hathaway"
+    assert [(p["symbol"], p["sector"]) for p in parsed] == [(e["symbol"], e["sector"]) for e in expected]
+
+
+def test_parse_nasdaq100_finds_constituents_table():
+    assert _parse_nasdaq100(NASDAQ_HTML) == [
+        {"symbol": "ADBE", "name": "Adobe Inc.", "sector": ""},
+        {"symbol": "AMGN", "name": "Amgen", "sector": ""},
+    ]
+
+
+@pytest.mark.parametrize("name", ["sp500", "nasdaq100"])
+def test_bundled_snapshots(name):
+    symbols, fetched_at = load_bundled(name)
+    assert len(symbols) >= 100
+    assert isinstance(fetched_at, datetime)
+    assert len({s["symbol"] for s in symbols}) == len(symbols)
+    assert all("." not in s["symbol"] for s in symbols)
+
+
+def _write_cache(cache_dir, name, symbols, fetched_at):
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(os.path.join(cache_dir, f"{name}.json"), "w") as f:
+        json.dump({"universe": name, "fetched_at": fetched_at.isoformat(), "symbols": symbols}, f)
+
+
+def test_fresh_cache_is_used_without_fetching(tmp_path):
+    calls = []
+    cache = UniverseCache(str(tmp_path), fetchers={"sp500": lambda: calls.append(1) or []})
+    _write_cache(str(tmp_path), "sp500", [{"symbol": "AAPL", "name": "Apple", "sector": ""}], datetime.now())
+
+    assert [s["symbol"] for s in cache.load("sp500")] == ["AAPL"]
+    cache.wait_for_refreshes()
+    assert calls == []
+
+
+def test_stale_cache_is_served_and_refreshed_in_background(tmp_path):
+    fresh = [{"symbol": "MSFT", "name": "Microsoft", "sector": ""}]
+    cache = UniverseCache(str(tmp_path), ttl=timedelta(days=1), fetchers={"sp500": lambda: fresh})
+    _write_cache(
+        str(tmp_path), "sp500", [{"symbol": "AAPL", "name": "Apple", "sector": ""}],
+        datetime.now() - timedelta(days=2),
+    )
+
+    assert [s["symbol"] for s in cache.load("sp500")] == ["AAPL"]
+    cache.wait_for_refreshes()
+    assert [s["symbol"] for s in cache.load("sp500")] == ["MSFT"]
+
+
+def test_missing_cache_falls_back_to_bundled_snapshot(tmp_path):
+    def unreachable():
+        raise ConnectionError("wikipedia down")
+
+    cache = UniverseCache(str(tmp_path), fetchers={"sp500": unreachable})
+    symbols = cache.load("sp500")
+    cache.wait_for_refreshes()
+
+    assert symbols == load_bundled("sp500")[0]
+    assert not os.path.exists(tmp_path / "sp500.json")
+
+
+def test_refresh_rejects_empty_scrape(tmp_path):
+    cache = UniverseCache(str(tmp_path), fetchers={"sp500": lambda: []})
+    with pytest.raises(ValueError):
+        cache.refresh("sp500")
+
+
+def test_unknown_universe(tmp_path):
+    assert UniverseCache(str(tmp_path), fetchers={}).load("dow30") == []
@@ -0,0 +1,133 @@
+import json
+import time
+
+import pytest
+import responses
+
+from sender.delivery_queue import DeliveryQueue
+
+WEBHOOK = "https://hooks.slack.com/test"
+BOT_API = "https://slack.com/api/chat.postMessage"
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    return str(tmp_path / "outbox.json")
+
+
+def _queue(outbox, **kwargs):
+    kwargs.setdefault("min_interval", 0.0)
+    return DeliveryQueue(webhook_url=WEBHOOK, bot_token="xoxb-test", outbox_path=outbox, **kwargs)
+
+
+@responses.activate
+def test_enqueue_returns_immediately_and_delivers_in_order(outbox):
+    responses.add(responses.POST, WEBHOOK, body="ok", status=200)
+    queue = _queue(outbox)
+
+    for i in range(3):
+        queue.enqueue_webhook(f"msg {i}")
+    assert queue.pending() == 3
+    assert len(responses.calls) == 0
+
+    queue.start()
+    assert queue.stop(timeout=5)
+    assert [json.loads(c.request.body)["text"] for c in responses.calls] == ["msg 0", "msg 1", "msg 2"]
+    assert queue.stats()["delivered"] == 3
+    with open(outbox) as f:
+        assert json.load(f) == []
+
+
+@responses.activate
+def test_retry_after_is_honoured_on_429(outbox):
+    responses.add(responses.POST, WEBHOOK, status=429, headers={"Retry-After": "0.3"})
+    responses.add(responses.POST, WEBHOOK, body="ok", status=200)
+    queue = _queue(outbox, max_attempts=1).start()
+
+    started = time.monotonic()
+    queue.enqueue_webhook("hello")
+    assert queue.stop(timeout=5)
+
+    assert time.monotonic() - started >= 0.3
+    assert len(responses.calls) == 2
+    stats = queue.stats()
+    assert stats["rate_limited"] == 1
+    assert stats["delivered"] == 1
+    assert stats["failed"] == 0
+
+
+@responses.activate
+def test_pacing_is_per_channel(outbox):
+    responses.add(responses.POST, BOT_API, json={"ok": True}, status=200)
+    queue = _queue(outbox, min_interval=0.5).start()
+
+    queue.enqueue_bot("C1", "a")
+    queue.enqueue_bot("C1", "b")
+    queue.enqueue_bot("C2", "c")
+    assert queue.flush(timeout=5)
+    queue.stop()
+
+    order = [json.loads(c.request.body)["text"] for c in responses.calls]
+    assert order == ["a", "c", "b"]  # C1 두 번째 메시지는 간격을 기다리는 동안 C2가 먼저 나감
+
+
+@responses.activate
+def test_server_errors_retry_then_drop_and_client_errors_drop(outbox):
+    responses.add(responses.POST, WEBHOOK, status=500)
+    queue = _queue(outbox, max_attempts=2)
+    queue.enqueue_webhook("flaky")
+    queue.start()
+    assert queue.stop(timeout=10)
+    assert len(responses.calls) == 2
+    assert queue.stats()["failed"] == 1
+
+    responses.replace(responses.POST, WEBHOOK, status=400, body="invalid_payload")
+    queue = _queue(outbox).start()
+    queue.enqueue_webhook("bad")
+    assert queue.stop(timeout=5)
+    assert queue.stats()["failed"] == 1
+    assert queue.stats()["retries"] == 0
+
+
+@responses.activate
+def test_bot_api_error_body_is_not_retried(outbox):
+    responses.add(responses.POST, BOT_API, json={"ok": False, "error": "channel_not_found"}, status=200)
+    queue = _queue(outbox).start()
+    queue.enqueue_bot("C404", "hi")
+    assert queue.stop(timeout=5)
+    assert queue.stats()["failed"] == 1
+
+
+def test_undelivered_messages_survive_restart(outbox):
+    queue = _queue(outbox)
+    queue.enqueue_webhook("persist me")
+    queue.enqueue_bot("C1", "and me")
+
+    restarted = _queue(outbox)
+    assert restarted.pending() == 2
+
+    with responses.RequestsMock() as rsps:
+        rsps.add(responses.POST, WEBHOOK, body="ok", status=200)
+        rsps.add(responses.POST, BOT_API, json={"ok": True}, status=200)
+        restarted.start()
+        assert restarted.stop(timeout=5)
+        assert len(rsps.calls) == 2
+
+
+def test_requires_credentials(monkeypatch, outbox):
+    monkeypatch.delenv("SLACK_WEBHOOK_URL", raising=False)
+    monkeypatch.delenv("SLACK_BOT_TOKEN", raising=False)
+    with pytest.raises(ValueError):
+        DeliveryQueue(outbox_path=outbox)
+
+
+@responses.activate
+def test_webhook_blocks_are_sent_with_fallback_text(outbox):
+    responses.add(responses.POST, WEBHOOK, body="ok", status=200)
+    queue = _queue(outbox)
+    blocks = [{"type": "section", "text": {"type": "mrkdwn", "text": "*digest*"}}]
+
+    queue.enqueue_webhook("요약", blocks=blocks)
+    queue.start()
+    assert queue.stop(timeout=5)
+    assert json.loads(responses.calls[0].request.body) == {"text": "요약", "blocks": blocks}
@@ -0,0 +1,62 @@
+import json
+from datetime import datetime
+
+from core.models import NewsAlert, NewsAlertItem, Signal, SignalType
+from sender.formatters import (
+    format_cycle_digest,
+    format_news_alert_message,
+    format_signal_message,
+)
+
+
+def _make_signal(symbol="TEST", signal_type=SignalType.BUY, reasons=None):
+    return Signal(
+        symbol=symbol, signal_type=signal_type, confidence=0.8,
+        reasons=reasons or ["test"], price=100.0, timestamp=datetime.now(),
+    )
+
+
+def _make_alert(symbol="NEWS"):
+    return NewsAlert(
+        symbol=symbol, price=50.0,
+        news_items=[NewsAlertItem(title="Earnings beat", sentiment_score=0.6)],
+        composite_score=-0.4, indicator_scores={}, valuation="저평가", conclusion="매수 검토",
+    )
+
+
+def test_digest_reuses_item_formatters():
+    signal, alert = _make_signal(), _make_alert()
+    messages = format_cycle_digest([signal, _make_signal("DOWN", SignalType.SELL)], [alert])
+
+    assert len(messages) == 1
+    blocks = messages[0]["blocks"]
+    assert blocks[0]["type"] == "header"
+    assert messages[0]["text"] == "사이클 요약: 매수 1 · 매도 1 · 뉴스 알림 1"
+    assert blocks[1]["text"]["text"] == format_signal_message(signal)
+    assert blocks[3]["text"]["text"] == format_news_alert_message(alert)
+
+
+def test_digest_empty_cycle():
+    assert format_cycle_digest([], []) == []
+
+
+def test_digest_splits_on_block_limit():
+    signals = [_make_signal(f"S{i}") for i in range(120)]
+    messages = format_cycle_digest(signals, [])
+
+    assert len(messages) == 3
+    assert all(len(m["blocks"]) <= 50 for m in messages)
+    assert sum(len(m["blocks"]) - 1 for m in messages) == 120
+    assert messages[0]["text"].endswith("(1/3)")
+
+
+def test_digest_splits_on_size_and_truncates_sections():
+    long_reasons = ["x" * 1000 for _ in range(5)]
+    signals = [_make_signal(f"S{i}", reasons=long_reasons) for i in range(20)]
+    messages = format_cycle_digest(signals, [], max_chars=10_000)
+
+    assert len(messages) > 1
+    for message in messages:
+        sections = message["blocks"][1:]
+        assert all(len(b["text"]["text"]) <= 3000 for b in sections)
+        assert len(json.dumps(sections, ensure_ascii=False)) <= 10_000
@@ -0,0 +1,110 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from sender.translator import GPTTranslator, _chunk_by_tokens
+
+
+def _response(payload) -> MagicMock:
+    content = payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False)
+    response = MagicMock()
+    response.choices[0].message.content = content
+    return response
+
+
+def _request_titles(call) -> list[str]:
+    payload = json.loads(call.kwargs["messages"][1]["content"])
+    return [item["title"] for item in payload["items"]]
+
+
+@pytest.fixture
+def translator():
+    t = GPTTranslator(api_key="test-key")
+    t.client = MagicMock()
+    return t
+
+
+def _echo_batch(**kwargs):
+    titles = _request_titles(MagicMock(kwargs=kwargs))
+    return _response({"results": [
+        {"index": i, "translation": f"번역 {t}", "categories": ["기업실적"], "symbols": ["aapl"]}
+        for i, t in enumerate(titles)
+    ]})
+
+
+def test_batch_packs_titles_into_one_request(translator):
+    translator.client.chat.completions.create.side_effect = _echo_batch
+    titles = [f"Headline {i}" for i in range(12)]
+
+    translated, categories, symbols = translator.translate_and_categorize_batch(titles)
+
+    assert translator.client.chat.completions.create.call_count == 1
+    assert translated == [f"번역 {t}" for t in titles]
+    assert categories == [["기업실적"]] * 12
+    assert symbols == [["AAPL"]] * 12
+
+
+def test_batch_respects_item_limit(translator):
+    translator.client.chat.completions.create.side_effect = _echo_batch
+    titles = [f"Headline {i}" for i in range(45)]
+
+    translated, _, _ = translator.translate_and_categorize_batch(titles, max_items=20)
+
+    calls = translator.client.chat.completions.create.call_args_list
+    assert [len(_request_titles(c)) for c in calls] == [20, 20, 5]
+    assert translated == [f"번역 {t}" for t in titles]
+
+
+def test_malformed_entries_fall_back_per_item(translator):
+    batch = _response({"results": [
+        {"index": 0, "translation": "첫 번째", "categories": ["없는카테고리"], "symbols": []},
+        {"index": 2, "translation": "", "categories": [], "symbols": []},
+        {"index": 7, "translation": "범위 밖", "categories": [], "symbols": []},
+    ]})
+    single = _response({"translation": "개별 처리", "categories": ["기타"], "symbols": ["MSFT"]})
+    translator.client.chat.completions.create.side_effect = [batch, single, single]
+
+    translated, categories, symbols = translator.translate_and_categorize_batch(["A", "B", "C"])
+
+    assert translated == ["첫 번째", "개별 처리", "개별 처리"]
+    assert categories[0] == ["기타"]
+    assert symbols[1:] == [["MSFT"], ["MSFT"]]
+    assert translator.client.chat.completions.create.call_count == 3
+
+
+def test_invalid_json_falls_back_for_whole_chunk(translator):
+    single = _response({"translation": "개별", "categories": ["기타"], "symbols": []})
+    translator.client.chat.completions.create.side_effect = [_response("not json"), single, single]
+
+    translated, _, _ = translator.translate_and_categorize_batch(["A", "B"])
+
+    assert translated == ["개별", "개별"]
+
+
+def test_chunk_by_tokens_splits_on_output_budget():
+    long_title = "x" * 400  # 약 340 토큰 예상
+    chunks = _chunk_by_tokens([long_title] * 5, max_items=20, max_output_tokens=1000)
+
+    assert [len(c) for c in chunks] == [2, 2, 1]
+    assert _chunk_by_tokens([], max_items=20, max_output_tokens=1000) == []
+
+
+def test_batch_uses_cache_before_requesting(translator, tmp_path):
+    from storage.llm_cache import LLMCache
+
+    cache = LLMCache(db_path=str(tmp_path / "cache.duckdb"))
+    cache.init_schema()
+    translator.cache = cache
+    translator.client.chat.completions.create.side_effect = _echo_batch
+
+    translator.translate_and_categorize_batch(["A", "B"])
+    translated, _, symbols = translator.translate_and_categorize_batch(["B", "C", "A"])
+
+    calls = translator.client.chat.completions.create.call_args_list
+    assert [_request_titles(c) for c in calls] == [["A", "B"], ["C"]]
+    assert translated == ["번역 B", "번역 C", "번역 A"]
+    assert symbols == [["AAPL"]] * 3
+    assert translator.translate_and_categorize("A")[0] == "번역 A"
+    assert len(calls) == 2
+    cache.close()
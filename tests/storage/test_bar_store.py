@@ -0,0 +1,194 @@
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from providers.price.yfinance_provider import YFinancePriceProvider, _period_start
+from storage.bar_store import BarStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = BarStore(db_path=str(tmp_path / "test_bars.duckdb"))
+    s.init_schema()
+    yield s
+    s.close()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    YFinancePriceProvider._historical_cache.clear()
+    yield
+    YFinancePriceProvider._historical_cache.clear()
+
+
+def _bars(start, periods, base=100.0, tz="America/New_York"):
+    index = pd.date_range(start, periods=periods, freq="B", tz=tz)
+    close = [base + i for i in range(periods)]
+    return pd.DataFrame({
+        "Open": close, "High": close, "Low": close, "Close": close,
+        "Volume": [1_000_000] * periods,
+    }, index=index)
+
+
+def test_save_and_get_bars(store):
+    store.save_bars("AAPL", _bars("2024-01-01", 5), covered_from=date(2024, 1, 1))
+
+    df = store.get_bars("AAPL")
+    assert list(df.columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert len(df) == 5
+    assert df.index.tz is None
+    assert store.get_coverage("AAPL") == (date(2024, 1, 1), date(2024, 1, 5))
+
+
+def test_save_bars_upserts_existing_dates(store):
+    store.save_bars("AAPL", _bars("2024-01-01", 3), covered_from=date(2024, 1, 1))
+    store.save_bars("AAPL", _bars("2024-01-03", 2, base=200.0))
+
+    df = store.get_bars("AAPL")
+    assert len(df) == 4
+    assert df["Close"].iloc[2] == 200.0
+
+
+def test_replace_bars_swaps_history(store):
+    store.save_bars("AAPL", _bars("2024-01-01", 5), covered_from=date(2024, 1, 1))
+    store.replace_bars("AAPL", _bars("2024-01-03", 3, base=50.0), covered_from=date(2024, 1, 3))
+
+    assert store.get_bars("AAPL")["Close"].tolist() == [50.0, 51.0, 52.0]
+    assert store.get_coverage("AAPL") == (date(2024, 1, 3), date(2024, 1, 5))
+
+
+def test_replace_bars_keeps_old_history_on_failure(store):
+    store.save_bars("AAPL", _bars("2024-01-01", 5), covered_from=date(2024, 1, 1))
+
+    with patch.object(BarStore, "save_bars", side_effect=RuntimeError("disk full")):
+        with pytest.raises(RuntimeError):
+            store.replace_bars("AAPL", _bars("2024-01-03", 3, base=50.0), covered_from=date(2024, 1, 3))
+
+    assert store.get_bars("AAPL")["Close"].tolist() == [100.0, 101.0, 102.0, 103.0, 104.0]
+    assert store.get_coverage("AAPL") == (date(2024, 1, 1), date(2024, 1, 5))
+
+
+def test_coverage_missing_symbol(store):
+    assert store.get_coverage("NONE") == (None, None)
+
+
+def test_period_start():
+    assert _period_start("6mo", today=date(2024, 7, 15)) == date(2024, 1, 15)
+    assert _period_start("1y", today=date(2024, 7, 15)) == date(2023, 7, 15)
+    assert _period_start("ytd", today=date(2024, 7, 15)) == date(2024, 1, 1)
+    with pytest.raises(ValueError):
+        _period_start("forever")
+
+
+@patch("providers.price.yfinance_provider._create_ticker")
+def test_provider_fetches_only_delta_when_covered(mock_create, store):
+    start = _period_start("6mo")
+    history = _bars(start, 120)
+    prev_day = history.index[-2]
+
+    ticker = MagicMock()
+    ticker.history.return_value = history
+    mock_create.return_value = ticker
+
+    provider = YFinancePriceProvider(bar_store=store)
+    first = provider.get_historical("AAPL", period="6mo")
+    assert ticker.history.call_args.kwargs == {"period": "6mo"}
+
+    # 메모리 캐시를 비워 재시작 상황을 흉내 — 저장소 덕분에 직전 봉부터 증분만 요청
+    YFinancePriceProvider._historical_cache.clear()
+    delta = _bars(prev_day.date(), 3, base=500.0)
+    delta.iloc[0, delta.columns.get_loc("Close")] = history["Close"].iloc[-2]  # 직전 봉은 저장된 값 그대로
+    ticker.history.return_value = delta
+    second = provider.get_historical("AAPL", period="6mo")
+
+    assert ticker.history.call_args.kwargs == {"start": prev_day.date().isoformat()}
+    assert len(second) == len(first) + 1
+    assert second["Close"].iloc[-2] == 501.0  # 장중 미완성이던 마지막 저장 봉 갱신
+    assert second["Close"].iloc[-1] == 502.0
+
+
+@patch("providers.price.yfinance_provider._create_ticker")
+def test_provider_refetches_full_history_after_readjustment(mock_create, store):
+    start = _period_start("6mo")
+    history = _bars(start, 120)
+    store.save_bars("AAPL", history, covered_from=start)
+    prev_day = history.index[-2]
+
+    # 2:1 분할 — 직전 봉 종가가 절반으로 재조정되어 돌아옴
+    adjusted = history.copy()
+    adjusted[["Open", "High", "Low", "Close"]] /= 2
+    ticker = MagicMock()
+    ticker.history.side_effect = lambda **kwargs: adjusted.loc[prev_day:] if "start" in kwargs else adjusted
+    mock_create.return_value = ticker
+
+    df = YFinancePriceProvider(bar_store=store).get_historical("AAPL", period="6mo")
+
+    assert [c.kwargs for c in ticker.history.call_args_list] == [
+        {"start": prev_day.date().isoformat()}, {"period": "6mo"},
+    ]
+    assert df["Close"].tolist() == adjusted["Close"].tolist()
+    assert store.get_coverage("AAPL")[0] == start
+
+
+@patch("providers.price.yfinance_provider.yf.download")
+def test_get_historical_many_uses_delta_for_covered_symbols(mock_download, store):
+    start = _period_start("6mo")
+    store.save_bars("AAPL", _bars(start, 120), covered_from=start)
+    prev_day, prev_close = store.get_reference_close("AAPL")
+
+    def fake_download(tickers, **kwargs):
+        frames = {sym: _bars(prev_day, 3, base=prev_close, tz=None) for sym in tickers}
+        return pd.concat(frames, axis=1)
+
+    mock_download.side_effect = fake_download
+    provider = YFinancePriceProvider(bar_store=store)
+
+    frames, failures = provider.get_historical_many(["AAPL", "MSFT"], period="6mo")
+
+    kwargs_list = [call.kwargs for call in mock_download.call_args_list]
+    assert {"period": "6mo"}.items() <= kwargs_list[0].items()
+    assert kwargs_list[1]["start"] == prev_day.isoformat()
+    assert failures == {}
+    assert len(frames["AAPL"]) == 121
+    assert len(frames["MSFT"]) == 3
+
+
+@patch("providers.price.yfinance_provider.yf.download")
+def test_get_historical_many_groups_delta_by_start_and_refetches_readjusted(mock_download, store):
+    start = _period_start("6mo")
+    store.save_bars("AAPL", _bars(start, 120), covered_from=start)
+    store.save_bars("MSFT", _bars(start, 120), covered_from=start)
+    store.save_bars("OLD", _bars(start, 60), covered_from=start)  # 오래 갱신되지 않은 종목
+    references = {sym: store.get_reference_close(sym) for sym in ["AAPL", "MSFT", "OLD"]}
+    recent_day, old_day = references["AAPL"][0], references["OLD"][0]
+
+    def fake_download(tickers, **kwargs):
+        if "period" in kwargs:
+            frames = {sym: _bars(start, 120, base=50.0, tz=None) for sym in tickers}
+        else:
+            from_day = date.fromisoformat(kwargs["start"])
+            # MSFT는 분할로 직전 봉 종가가 달라짐
+            frames = {
+                sym: _bars(from_day, 3, base=references[sym][1] / (2 if sym == "MSFT" else 1), tz=None)
+                for sym in tickers
+            }
+        return pd.concat(frames, axis=1)
+
+    mock_download.side_effect = fake_download
+    frames, failures = YFinancePriceProvider(bar_store=store).get_historical_many(
+        ["AAPL", "MSFT", "OLD"], period="6mo",
+    )
+
+    calls = [
+        (call.args[0], call.kwargs.get("start"), call.kwargs.get("period"))
+        for call in mock_download.call_args_list
+    ]
+    assert (["OLD"], old_day.isoformat(), None) in calls
+    assert (["AAPL", "MSFT"], recent_day.isoformat(), None) in calls
+    assert calls[-1] == (["MSFT"], None, "6mo")
+    assert failures == {}
+    assert frames["MSFT"]["Close"].iloc[0] == 50.0
+    assert store.get_bars("MSFT")["Close"].iloc[0] == 50.0
+    assert frames["AAPL"]["Close"].iloc[0] == 100.0
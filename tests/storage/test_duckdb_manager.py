@@ -0,0 +1,117 @@
+import os
+import threading
+
+import duckdb
+import pytest
+
+from storage.duckdb_manager import DuckDBManager
+from storage.news_store import NewsStore
+from storage.stock_store import StockStore
+
+
+@pytest.fixture(autouse=True)
+def reset_settings():
+    yield
+    DuckDBManager.configure()
+
+
+def test_stores_share_one_connection(tmp_path):
+    db_path = str(tmp_path / "shared.duckdb")
+    news, stock = NewsStore(db_path=db_path), StockStore(db_path=db_path)
+    news.init_schema()
+    stock.init_schema()
+
+    assert news.db is stock.db
+    tables = {r[0] for r in news.conn.execute("SELECT table_name FROM information_schema.tables").fetchall()}
+    assert {"news", "stock_snapshots"} <= tables
+
+    news.close()
+    assert stock.conn.execute("SELECT COUNT(*) FROM stock_snapshots").fetchone()[0] == 0
+    stock.close()
+    assert os.path.realpath(db_path) not in DuckDBManager._registry
+
+
+def test_store_acquires_once_under_concurrent_first_access(tmp_path):
+    store = NewsStore(db_path=str(tmp_path / "race.duckdb"))
+    barrier = threading.Barrier(8)
+    seen = []
+
+    def worker():
+        barrier.wait()
+        seen.append(store.db)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len({id(db) for db in seen}) == 1
+    assert seen[0]._refs == 1
+    store.close()
+    assert os.path.realpath(store.db_path) not in DuckDBManager._registry
+
+
+def test_cursor_is_per_thread(tmp_path):
+    manager = DuckDBManager.acquire(str(tmp_path / "t.duckdb"))
+    main_cursor = manager.cursor()
+    seen = []
+
+    def worker():
+        seen.append(manager.cursor())
+        seen.append(manager.cursor())
+
+    t = threading.Thread(target=worker)
+    t.start()
+    t.join()
+
+    assert manager.cursor() is main_cursor
+    assert seen[0] is seen[1]
+    assert seen[0] is not main_cursor
+    manager.release()
+
+
+def test_concurrent_writers_are_serialized(tmp_path):
+    store = StockStore(db_path=str(tmp_path / "w.duckdb"))
+    store.init_schema()
+    store.conn.execute("CREATE TABLE counter (n INTEGER)")
+    store.conn.execute("INSERT INTO counter VALUES (0)")
+
+    def bump():
+        for _ in range(20):
+            with store.db.writer() as conn:
+                # 읽고-쓰기 사이에 다른 작성자가 끼면 DuckDB가 트랜잭션 충돌을 낸다
+                conn.execute("BEGIN TRANSACTION")
+                n = conn.execute("SELECT n FROM counter").fetchone()[0]
+                conn.execute("UPDATE counter SET n = ?", [n + 1])
+                conn.execute("COMMIT")
+
+    threads = [threading.Thread(target=bump) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert store.conn.execute("SELECT n FROM counter").fetchone()[0] == 80
+    store.close()
+
+
+def test_configure_applies_memory_limit_and_threads(tmp_path):
+    DuckDBManager.configure(memory_limit="256MB", threads=2)
+    manager = DuckDBManager.acquire(str(tmp_path / "c.duckdb"))
+    assert manager.settings()["threads"] == "2"
+    assert manager.settings()["memory_limit"].startswith("244")  # 256MB = 244.1 MiB
+
+    DuckDBManager.configure(memory_limit="512MB", threads=3)
+    assert manager.settings()["threads"] == "3"
+    manager.release()
+
+
+def test_read_write_after_read_only_is_rejected(tmp_path):
+    db_path = str(tmp_path / "ro.duckdb")
+    duckdb.connect(db_path).close()
+    reader = DuckDBManager.acquire(db_path, read_only=True)
+
+    with pytest.raises(duckdb.ConnectionException):
+        DuckDBManager.acquire(db_path)
+    reader.release()
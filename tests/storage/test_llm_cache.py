@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from engine.sentiment import SentimentAnalyzer
+from storage.llm_cache import LLMCache, make_key, prompt_version
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = LLMCache(db_path=str(tmp_path / "test.duckdb"), max_entries=3, max_age_days=7)
+    c.init_schema()
+    yield c
+    c.close()
+
+
+def test_put_and_get_structured_value(cache):
+    value = {"translation": "애플 실적 호조", "categories": ["기업실적"], "symbols": ["AAPL"]}
+    cache.put("categorize", "gpt-4o-mini", "v1", "Apple beats", value)
+
+    assert cache.get("categorize", "gpt-4o-mini", "v1", "Apple beats") == value
+    assert cache.get("categorize", "gpt-4o-mini", "v2", "Apple beats") is None
+    assert cache.get("categorize", "gpt-4o", "v1", "Apple beats") is None
+    assert cache.stats() == {"hits": 1, "misses": 2, "hit_rate": pytest.approx(1 / 3)}
+
+
+def test_get_many_returns_only_hits(cache):
+    cache.put_many("sentiment", "m", "v", {"a": 0.5, "b": -0.2})
+
+    assert cache.get_many("sentiment", "m", "v", ["a", "b", "c"]) == {"a": 0.5, "b": -0.2}
+
+
+def test_key_depends_on_every_component():
+    keys = {
+        make_key("m", "v", "k", "t"),
+        make_key("m2", "v", "k", "t"),
+        make_key("m", "v2", "k", "t"),
+        make_key("m", "v", "k2", "t"),
+        make_key("m", "v", "k", "t2"),
+    }
+    assert len(keys) == 5
+    assert prompt_version("a") != prompt_version("b")
+
+
+def test_evict_by_age_and_size(cache):
+    cache.put_many("sentiment", "m", "v", {str(i): float(i) for i in range(5)})
+    cache.conn.execute(
+        "UPDATE llm_cache SET created_at = ? WHERE key = ?",
+        [datetime.now() - timedelta(days=30), make_key("m", "v", "sentiment", "0")],
+    )
+
+    removed = cache.evict()
+
+    assert removed == 2
+    assert cache.conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] == 3
+    assert cache.get("sentiment", "m", "v", "0") is None
+
+
+def test_evict_if_due_runs_once_per_interval(cache):
+    cache.put_many("sentiment", "m", "v", {str(i): float(i) for i in range(5)})
+    assert cache.evict_if_due() == 2
+
+    cache.put_many("sentiment", "m", "v", {"x": 1.0, "y": 2.0})
+    assert cache.evict_if_due() == 0
+
+    cache._last_evicted -= cache.evict_interval
+    assert cache.evict_if_due() == 2
+
+
+def test_sentiment_batch_only_requests_uncached_headlines(cache):
+    analyzer = SentimentAnalyzer(api_key="test-key", cache=cache)
+    analyzer.client = MagicMock()
+    response = MagicMock()
+    response.choices[0].message.content = "[0.5, -0.5]"
+    analyzer.client.chat.completions.create.return_value = response
+
+    assert analyzer.analyze_batch(["up", "down"]) == [0.5, -0.5]
+
+    response.choices[0].message.content = "[0.9]"
+    assert analyzer.analyze_batch(["down", "new", "up"]) == [-0.5, 0.9, 0.5]
+
+    second_prompt = analyzer.client.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+    assert "new" in second_prompt and "down" not in second_prompt
+
+
+def test_sentiment_batch_count_mismatch_is_not_cached(cache):
+    analyzer = SentimentAnalyzer(api_key="test-key", cache=cache)
+    analyzer.client = MagicMock()
+    response = MagicMock()
+    response.choices[0].message.content = "[0.5, -0.5]"
+    analyzer.client.chat.completions.create.return_value = response
+
+    assert analyzer.analyze_batch(["a", "b", "c"]) == [0.0, 0.0, 0.0]
+    assert cache.conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] == 0
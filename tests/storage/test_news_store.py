@@ -133,3 +133,121 @@ def test_sentiment_history(store):
     history = store.get_sentiment_history(days=1)
     assert len(history) == 1
     assert history[0]["news_count"] == 2
+
+
+def test_get_news_for_clustering_includes_collected_at(store):
+    store.save_news(_make_record(embedding=[0.1, 0.2]))
+    store.save_news(_make_record(title="No embedding", translated="임베딩 없음"))
+
+    rows = store.get_news_for_clustering(days=1)
+
+    assert len(rows) == 1
+    assert rows[0]["embedding"] == pytest.approx([0.1, 0.2])
+    assert isinstance(rows[0]["collected_at"], datetime)
+
+
+def test_save_batch_skips_existing_and_in_batch_duplicates(store):
+    store.save_news(_make_record(title="Already stored"))
+    records = [
+        _make_record(title="Already stored"),
+        _make_record(title="Fed cuts rates", categories=["금리/통화정책"], sentiment_score=0.4),
+        _make_record(title="Fed cuts rates", categories=["기타"]),
+        _make_record(title="Oil spikes", categories=["에너지/원자재", "지정학/무역"], embedding=[0.1, 0.2]),
+        _make_record(title="No extras", related_symbols=None, published_at=None),
+    ]
+
+    assert store.save_news_batch(records) == 3
+
+    rows = store.conn.execute(
+        "SELECT title_original, sentiment_score, embedding, published_at FROM news ORDER BY id"
+    ).fetchall()
+    assert [r[0] for r in rows] == ["Already stored", "Fed cuts rates", "Oil spikes", "No extras"]
+    assert rows[1][1] == pytest.approx(0.4)
+    assert rows[2][1] is None
+    assert rows[2][2] == pytest.approx([0.1, 0.2])
+    assert rows[3][3] is None
+
+    fed = store.search_by_keyword("Fed cuts")[0]
+    assert fed.categories == ["금리/통화정책"]
+    oil = store.search_by_keyword("Oil")[0]
+    assert oil.categories == ["에너지/원자재", "지정학/무역"]
+
+
+def test_save_batch_uses_constant_statement_count(store, monkeypatch):
+    from unittest.mock import MagicMock
+
+    counts = []
+    for size in (2, 40):
+        spy = MagicMock(wraps=store.conn)
+        monkeypatch.setattr(store.db, "cursor", lambda: spy)
+        records = [
+            _make_record(title=f"Batch {size} item {i}", categories=["기타"]) for i in range(size)
+        ]
+        assert store.save_news_batch(records) == size
+        counts.append(spy.execute.call_count)
+        monkeypatch.undo()
+
+    assert counts[0] == counts[1]
+
+
+def test_search_by_category_uses_category_mask(store):
+    store.save_news(_make_record(title="Chip rally", categories=["반도체/AI", "기업실적"]))
+    store.save_news_batch([_make_record(title="Rate decision", categories=["금리/통화정책"])])
+
+    chips = store.search_by_category("반도체/AI")
+    assert [r.title_original for r in chips] == ["Chip rally"]
+    assert chips[0].categories == ["기업실적", "반도체/AI"]  # CATEGORIES 순서
+    assert store.search_by_category("없는 카테고리") == []
+
+    news_id = store.search_by_keyword("Rate decision")[0].id
+    store.update_categories(news_id, ["반도체/AI"])
+    assert {r.title_original for r in store.search_by_category("반도체/AI")} == {"Chip rally", "Rate decision"}
+    assert store.search_by_category("금리/통화정책") == []
+
+
+def test_init_schema_backfills_category_mask(tmp_path):
+    db_path = str(tmp_path / "legacy.duckdb")
+    legacy = NewsStore(db_path=db_path)
+    legacy.init_schema()
+    legacy.save_news(_make_record(title="Old categorized", categories=["기타", "IPO/M&A"]))
+    legacy.save_news(_make_record(title="Old uncategorized"))
+    legacy.conn.execute("UPDATE news SET category_mask = NULL")
+    legacy.close()
+
+    store = NewsStore(db_path=db_path)
+    store.init_schema()
+
+    assert store.search_by_category("IPO/M&A")[0].categories == ["IPO/M&A", "기타"]
+    assert [r.title_original for r in store.get_uncategorized_news()] == ["Old uncategorized"]
+    store.close()
+
+
+def test_category_sentiment_summary(store):
+    now = datetime.now()
+    for i in range(7):
+        store.save_news(_make_record(
+            title=f"Chip {i}", translated=f"반도체 {i}", sentiment_score=i / 10,
+            collected_at=now - timedelta(days=5 if i < 2 else 0), categories=["반도체/AI"],
+        ))
+    store.save_news(_make_record(
+        title="Rate hike", translated="금리 인상", sentiment_score=-0.5,
+        collected_at=now, categories=["금리/통화정책", "반도체/AI"],
+    ))
+    store.save_news(_make_record(title="Unscored", sentiment_score=None, categories=["금리/통화정책"]))
+
+    summary = store.get_category_sentiment_summary(days=7)
+
+    assert [s["category"] for s in summary] == ["반도체/AI", "금리/통화정책"]
+    chips, rates = summary
+    assert chips["news_count"] == 8
+    assert chips["avg_sentiment"] == pytest.approx((2.1 - 0.5) / 8)
+    assert chips["older_avg"] == pytest.approx(0.05)
+    assert chips["recent_avg"] == pytest.approx((2.0 - 0.5) / 6)
+    assert chips["top_headlines"] == [
+        ("반도체 6", pytest.approx(0.6)), ("반도체 5", pytest.approx(0.5)), ("반도체 4", pytest.approx(0.4)),
+        ("반도체 3", pytest.approx(0.3)), ("반도체 2", pytest.approx(0.2)),
+    ]
+    assert rates == {
+        "category": "금리/통화정책", "avg_sentiment": -0.5, "news_count": 1,
+        "recent_avg": -0.5, "older_avg": None, "top_headlines": [("금리 인상", -0.5)],
+    }
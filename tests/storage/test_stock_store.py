@@ -0,0 +1,95 @@
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from core.models import FundamentalData, IndicatorResult, StockQuote
+from storage.stock_store import StockStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = StockStore(db_path=str(tmp_path / "test_stock.duckdb"))
+    s.init_schema()
+    yield s
+    s.close()
+
+
+def _snapshot(symbol, price=100.0, when=None):
+    when = when or datetime.now()
+    return {
+        "symbol": symbol,
+        "date": when,
+        "quote": StockQuote(symbol=symbol, price=price, open=99.0, high=101.0, low=98.0, volume=1_000, timestamp=when),
+        "indicators": IndicatorResult(symbol=symbol, rsi=55.0, sma={20: 97.0, 50: 95.0}),
+        "fundamentals": FundamentalData(symbol=symbol, per=20.0, market_cap=2.5e12, sector="Technology"),
+    }
+
+
+def test_save_snapshots_batch_round_trip(store):
+    assert store.save_snapshots_batch([_snapshot("AAPL"), _snapshot("MSFT", price=400.0)]) == 2
+
+    snap = store.get_snapshots("AAPL")[0]
+    assert snap["date"] == date.today()
+    assert snap["close"] == 100.0
+    assert snap["volume"] == 1_000
+    assert snap["rsi"] == 55.0
+    assert snap["sma_20"] == 97.0
+    assert snap["sma_200"] is None
+    assert snap["market_cap"] == 2_500_000_000_000
+    assert snap["sector"] == "Technology"
+    assert store.get_snapshots("MSFT")[0]["close"] == 400.0
+
+
+def test_batch_upserts_existing_and_in_batch_duplicates(store):
+    store.save_snapshot("AAPL", datetime.now(), quote=_snapshot("AAPL")["quote"])
+
+    saved = store.save_snapshots_batch([_snapshot("AAPL", price=110.0), _snapshot("AAPL", price=120.0)])
+
+    assert saved == 1
+    rows = store.get_snapshots("AAPL")
+    assert len(rows) == 1
+    assert rows[0]["close"] == 120.0
+    assert rows[0]["per"] == 20.0
+
+
+def test_batch_uses_single_statement(store, monkeypatch):
+    spy = MagicMock(wraps=store.conn)
+    monkeypatch.setattr(store.db, "cursor", lambda: spy)
+
+    store.save_snapshots_batch([_snapshot(f"S{i}") for i in range(50)])
+
+    assert spy.execute.call_count == 1
+    assert store.conn.execute("SELECT COUNT(*) FROM stock_snapshots").fetchone()[0] == 50
+
+
+def test_save_snapshots_frame_fills_missing_columns(store):
+    frame = pd.DataFrame({
+        "symbol": ["AAPL", "MSFT"],
+        "date": [pd.Timestamp("2026-01-02"), date(2026, 1, 2)],
+        "close": [100.0, 400.0],
+        "rsi": [30.0, None],
+    })
+
+    assert store.save_snapshots_frame(frame) == 2
+    rows = store.conn.execute(
+        "SELECT symbol, date, close, rsi, per, collected_at IS NOT NULL FROM stock_snapshots ORDER BY symbol"
+    ).fetchall()
+    assert rows == [
+        ("AAPL", date(2026, 1, 2), 100.0, 30.0, None, True),
+        ("MSFT", date(2026, 1, 2), 400.0, None, None, True),
+    ]
+
+    with pytest.raises(ValueError):
+        store.save_snapshots_frame(pd.DataFrame({"symbol": ["AAPL"], "date": [date.today()], "bogus": [1]}))
+
+
+def test_batch_with_large_volume_late_in_batch(store):
+    snapshots = [_snapshot(f"S{i}") for i in range(3000)]
+    snapshots[-1]["quote"].volume = 5_000_000_000
+    snapshots[-2]["quote"] = None
+
+    assert store.save_snapshots_batch(snapshots) == 3000
+    assert store.get_snapshots("S2999")[0]["volume"] == 5_000_000_000
+    assert store.get_snapshots("S2998")[0]["close"] is None
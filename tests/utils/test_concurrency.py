@@ -0,0 +1,87 @@
+import threading
+import time
+
+from utils.concurrency import ProviderLimits, TokenBucket, map_ordered
+
+
+def test_map_ordered_preserves_input_order():
+    def slow_square(n):
+        # 앞쪽 항목일수록 늦게 끝나도록 지연
+        time.sleep(0.01 * (5 - n))
+        return n * n
+
+    assert map_ordered(slow_square, range(5), max_workers=5) == [0, 1, 4, 9, 16]
+
+
+def test_map_ordered_sequential_when_single_worker():
+    thread_ids = map_ordered(lambda _: threading.get_ident(), range(3), max_workers=1)
+    assert set(thread_ids) == {threading.get_ident()}
+
+
+def test_map_ordered_runs_concurrently():
+    started = time.monotonic()
+    map_ordered(lambda _: time.sleep(0.1), range(4), max_workers=4)
+    assert time.monotonic() - started < 0.3
+
+
+def test_provider_limits_caps_concurrency():
+    limits = ProviderLimits({"price": 2})
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def task(_):
+        nonlocal active, peak
+        with limits.limit("price"):
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+    map_ordered(task, range(8), max_workers=8)
+    assert peak == 2
+
+
+def test_provider_limits_default_for_unknown_name():
+    limits = ProviderLimits({}, default=3)
+    assert limits.call("unknown", lambda x: x + 1, 1) == 2
+
+
+def test_token_bucket_limits_rate_across_workers():
+    bucket = TokenBucket(rate=50, burst=1)
+    started = time.monotonic()
+    map_ordered(lambda _: bucket.acquire(), range(11), max_workers=4)
+    # 첫 토큰은 즉시, 나머지 10개는 초당 50개 → 약 0.2초
+    assert 0.18 <= time.monotonic() - started < 0.5
+
+
+def test_token_bucket_burst_is_immediate():
+    bucket = TokenBucket(rate=1, burst=3)
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+def test_token_bucket_pause_delays_next_acquire():
+    bucket = TokenBucket(rate=100, burst=5)
+    bucket.pause(0.1)
+    assert bucket.acquire() >= 0.09
+
+
+def test_token_bucket_pause_holds_workers_already_waiting():
+    bucket = TokenBucket(rate=10, burst=1)
+    bucket.acquire()
+    fired = []
+
+    def worker():
+        bucket.acquire()  # 0.1초 뒤 차례로 예약하고 대기
+        fired.append(time.monotonic())
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    time.sleep(0.02)
+    paused_at = time.monotonic()
+    bucket.pause(0.3)
+    thread.join()
+
+    assert fired[0] - paused_at >= 0.3
@@ -0,0 +1,190 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from utils.dup_check import (
+    DuplicateChecker,
+    EmbeddingWindow,
+    _cosine_similarity,
+    deduplicate_similar,
+    hash_title,
+    select_dissimilar,
+)
+
+
+def _pairwise_keep(vectors: list[list[float]], threshold: float) -> list[int]:
+    """기존 순수 파이썬 구현 (기준 결과)."""
+    removed: set[int] = set()
+    for i in range(len(vectors)):
+        if i in removed:
+            continue
+        for j in range(i + 1, len(vectors)):
+            if j not in removed and _cosine_similarity(vectors[i], vectors[j]) >= threshold:
+                removed.add(j)
+    return [i for i in range(len(vectors)) if i not in removed]
+
+
+def _clustered_vectors(n: int, dim: int = 32, seed: int = 0) -> list[list[float]]:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(1, n // 4), dim))
+    picks = rng.integers(0, len(centers), size=n)
+    noise = rng.normal(scale=rng.uniform(0.1, 1.0, size=(n, 1)), size=(n, dim))
+    return (centers[picks] + noise).tolist()
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 1024])
+@pytest.mark.parametrize("threshold", [0.5, 0.85])
+def test_select_dissimilar_matches_pairwise(block_size, threshold):
+    vectors = _clustered_vectors(120)
+    vectors[5] = [0.0] * 32  # 노름 0 벡터는 어떤 것과도 유사하지 않음
+
+    kept = select_dissimilar(vectors, threshold, block_size=block_size)
+
+    assert kept == _pairwise_keep(vectors, threshold)
+    assert 5 in kept
+
+
+def test_select_dissimilar_empty():
+    assert select_dissimilar(np.empty((0, 8)), 0.85) == []
+
+
+@patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
+def test_deduplicate_similar_attaches_embeddings():
+    vectors = [[1.0, 0.0], [0.99, 0.05], [0.0, 1.0]]
+    client = MagicMock()
+    client.embeddings.create.return_value.data = [MagicMock(embedding=v) for v in vectors]
+    items = [{"cleaned_title": t} for t in ("a", "a'", "b")]
+
+    with patch("openai.OpenAI", return_value=client):
+        kept = deduplicate_similar(items, threshold=0.9)
+
+    assert [k["cleaned_title"] for k in kept] == ["a", "b"]
+    assert kept[1]["embedding"] == [0.0, 1.0]
+
+
+def test_embedding_window_matches_recent_items_only():
+    window = EmbeddingWindow(hours=24, max_items=10)
+    window.add([[1.0, 0.0]], ["old story"], datetime.now() - timedelta(hours=30))
+    window.add([[0.0, 1.0], [0.6, 0.8]], ["fed story", "oil story"])
+
+    assert len(window) == 2  # 24시간 지난 항목은 제외
+    assert window.match([[0.01, 1.0], [1.0, 0.0]], threshold=0.95) == ["fed story", None]
+
+
+def test_embedding_window_caps_size():
+    window = EmbeddingWindow(hours=24, max_items=2)
+    window.add([[1.0, 0.0], [0.0, 1.0], [0.7, 0.7]], ["a", "b", "c"])
+
+    assert len(window) == 2
+    assert window.match([[1.0, 0.0]], threshold=0.99) == [None]
+
+
+def test_embedding_window_loads_from_store():
+    store = MagicMock()
+    store.get_news_for_clustering.return_value = [
+        {"title_original": "newer", "embedding": [0.0, 1.0], "collected_at": datetime.now()},
+        {"title_original": "older", "embedding": [1.0, 0.0], "collected_at": datetime.now() - timedelta(hours=2)},
+    ]
+    window = EmbeddingWindow(hours=6)
+
+    assert window.load(store) == 2
+    store.get_news_for_clustering.assert_called_once_with(days=1, limit=5000)
+    assert window.match([[1.0, 0.0]], threshold=0.9) == ["older"]
+
+
+def test_embedding_window_load_matches_incremental_add():
+    rng = np.random.default_rng(0)
+    now = datetime.now()
+    rows = [
+        {"title_original": f"t{i}", "embedding": list(rng.normal(size=8)), "collected_at": now - timedelta(minutes=i)}
+        for i in range(50)
+    ]
+    rows.append({"title_original": "expired", "embedding": [1.0] * 8, "collected_at": now - timedelta(hours=10)})
+    store = MagicMock()
+    store.get_news_for_clustering.return_value = rows
+
+    loaded = EmbeddingWindow(hours=6, max_items=40)
+    loaded.load(store)
+    added = EmbeddingWindow(hours=6, max_items=40)
+    for row in sorted(rows, key=lambda r: r["collected_at"]):
+        added.add([row["embedding"]], [row["title_original"]], row["collected_at"])
+
+    assert len(loaded) == len(added) == 40
+    assert loaded._titles == added._titles
+    np.testing.assert_array_equal(loaded._vectors, added._vectors)
+    np.testing.assert_array_equal(loaded._times, added._times)
+
+
+@patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
+def test_deduplicate_similar_checks_window_before_batch():
+    vectors = [[0.0, 1.0], [1.0, 0.0], [0.99, 0.05]]
+    client = MagicMock()
+    client.embeddings.create.return_value.data = [MagicMock(embedding=v) for v in vectors]
+    window = EmbeddingWindow()
+    window.add([[0.05, 0.99]], ["stored story"])
+    items = [{"cleaned_title": t} for t in ("reworded", "b", "b'")]
+
+    with patch("openai.OpenAI", return_value=client):
+        kept = deduplicate_similar(items, threshold=0.9, window=window)
+
+    assert [k["cleaned_title"] for k in kept] == ["b"]
+
+
+def test_duplicate_checker_marks_and_persists(tmp_path):
+    checker = DuplicateChecker(base_dir=str(tmp_path))
+    result = checker.check(["Fed holds rates", "Oil jumps"])
+    assert set(result["new"]) == {"Fed holds rates", "Oil jumps"}
+
+    checker.mark_seen(["Fed holds rates"])
+    assert checker.check(["Fed holds rates"])["duplicate"] == {"Fed holds rates": None}
+
+    reopened = DuplicateChecker(base_dir=str(tmp_path))
+    result = reopened.check(["Fed holds rates", "Oil jumps"])
+    assert list(result["duplicate"]) == ["Fed holds rates"]
+    assert list(result["new"]) == ["Oil jumps"]
+
+
+def test_duplicate_checker_signals(tmp_path):
+    checker = DuplicateChecker(base_dir=str(tmp_path))
+    assert not checker.check_signal_duplicate("AAPL", "BUY")
+
+    checker.mark_signal_sent("AAPL", "BUY")
+    checker.mark_signal_sent("AAPL", "BUY")
+
+    assert checker.check_signal_duplicate("AAPL", "BUY")
+    assert not checker.check_signal_duplicate("AAPL", "SELL")
+    assert (tmp_path / "dedup_journal.tsv").read_text().count("\n") == 1
+
+
+def test_duplicate_checker_expires_entries_older_than_yesterday(tmp_path):
+    old_day = (datetime.now() - timedelta(days=2)).strftime("%Y%m%d")
+    yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y%m%d")
+    (tmp_path / "dedup_journal.tsv").write_text(
+        f"{old_day}\t{hash_title('old')}\n{yesterday}\t{hash_title('recent')}\n"
+    )
+
+    checker = DuplicateChecker(base_dir=str(tmp_path))
+
+    result = checker.check(["old", "recent"])
+    assert list(result["new"]) == ["old"]
+    assert list(result["duplicate"]) == ["recent"]
+    assert hash_title("old") not in (tmp_path / "dedup_journal.tsv").read_text()
+
+
+def test_duplicate_checker_migrates_legacy_files(tmp_path):
+    today = datetime.now().strftime("%Y%m%d")
+    old_day = (datetime.now() - timedelta(days=5)).strftime("%Y%m%d")
+    for day, title in ((today, "today title"), (old_day, "old title")):
+        (tmp_path / day).mkdir()
+        (tmp_path / day / f"{hash_title(title)}.txt").write_text("번역된 제목")
+    (tmp_path / today / "notes.txt").write_text("keep me")
+    (tmp_path / "portfolio.json").write_text("{}")
+
+    checker = DuplicateChecker(base_dir=str(tmp_path))
+
+    assert list(checker.check(["today title", "old title"])["new"]) == ["old title"]
+    assert not (tmp_path / old_day).exists()
+    assert sorted(p.name for p in (tmp_path / today).iterdir()) == ["notes.txt"]
+    assert (tmp_path / "portfolio.json").exists()
@@ -0,0 +1,119 @@
+"""스레드 풀 기반 동시 실행 유틸리티."""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class ProviderLimits:
+    """프로바이더별 동시 호출 수 제한.
+
+    워커 수와 별개로 외부 API(yfinance, OpenAI)나 공유 자원(DuckDB 커넥션)의
+    동시 사용 수를 이름별 BoundedSemaphore로 제한한다.
+    설정에 없는 이름은 default 값을 사용한다.
+    """
+
+    def __init__(self, limits: dict[str, int] | None = None, default: int = 1):
+        self._limits = dict(limits or {})
+        self._default = default
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, name: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            sem = self._semaphores.get(name)
+            if sem is None:
+                size = max(1, int(self._limits.get(name, self._default)))
+                sem = threading.BoundedSemaphore(size)
+                self._semaphores[name] = sem
+            return sem
+
+    @contextmanager
+    def limit(self, name: str) -> Iterator[None]:
+        with self._semaphore(name):
+            yield
+
+    def call(self, name: str, fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        with self.limit(name):
+            return fn(*args, **kwargs)
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷.
+
+    동시 워커들이 acquire()로 토큰을 하나씩 가져가므로 워커 수와 상관없이 외부 API
+    요청 속도가 rate를 넘지 않는다. 토큰이 없으면 차례를 예약하고 그만큼 대기한다.
+    pause()는 예약해 두고 대기 중인 워커까지 멈춘다 — 깨어난 워커는 중단이 끝난 뒤
+    차례를 다시 예약한다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._pauses = 0  # pause() 횟수 — 대기 중 중단되면 예약을 무효로 보고 다시 예약
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + max(0.0, now - self._updated) * self.rate)
+        self._updated = max(self._updated, now)
+
+    def acquire(self) -> float:
+        """토큰 하나를 가져온다. 대기한 시간(초) 반환."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                pauses = self._pauses
+                if now < self._paused_until:
+                    wait, reserved = self._paused_until - now, False
+                else:
+                    self._refill(now)
+                    self._tokens -= 1
+                    wait, reserved = max(0.0, -self._tokens / self.rate), True
+            if wait > 0:
+                time.sleep(wait)
+                waited += wait
+            if reserved:
+                with self._lock:
+                    if self._pauses == pauses:
+                        return waited
+
+    def pause(self, seconds: float) -> None:
+        """seconds초 동안 발급 중단 (429 응답 시 전체 워커 감속). 대기 중인 예약도 무효가 되고,
+        중단이 끝나면 토큰 0개에서 다시 채워진다."""
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self._paused_until:
+                self._paused_until = until
+                self._tokens = 0.0
+                self._updated = until
+            self._pauses += 1
+
+
+def map_ordered(fn: Callable[[T], R], items: Iterable[T], max_workers: int = 1) -> list[R]:
+    """items 각각에 fn을 적용하고 입력 순서대로 결과를 반환.
+
+    max_workers가 1 이하이면 현재 스레드에서 순차 실행한다.
+    fn에서 발생한 예외는 그대로 전파되므로, 항목별 실패는 fn 내부에서 처리할 것.
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+
+    workers = min(max_workers, len(items))
+    logger.debug("Running %d tasks on %d workers", len(items), workers)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stock_up") as executor:
+        return list(executor.map(fn, items))
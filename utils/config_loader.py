@@ -49,6 +49,26 @@ def get_sector_trend_config(config: dict | None = None) -> dict:
     return config.get("sector_trend", {})
 
 
+def get_concurrency_config(config: dict | None = None) -> dict:
+    config = config or load_config()
+    return config.get("concurrency", {})
+
+
+def get_database_config(config: dict | None = None) -> dict:
+    config = config or load_config()
+    return config.get("database", {})
+
+
+def get_fundamentals_cache_config(config: dict | None = None) -> dict:
+    config = config or load_config()
+    return config.get("fundamentals_cache", {})
+
+
+def get_slack_delivery_config(config: dict | None = None) -> dict:
+    config = config or load_config()
+    return config.get("slack_delivery", {})
+
+
 def reload_config(path: str = "config.yaml") -> dict[str, Any]:
     global _config_cache
     _config_cache = None
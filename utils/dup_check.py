@@ -2,67 +2,157 @@
 import logging
 import math
 import os
-from typing import List, Dict
+import re
+import threading
+from typing import List, Dict, Sequence
 from datetime import datetime, timedelta
 import hashlib
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# 유사도 행렬 블록 크기 — 블록당 메모리는 _SIMILARITY_BLOCK² × 8 bytes (약 8MB)
+_SIMILARITY_BLOCK = 1024
+
+_JOURNAL_NAME = "dedup_journal.tsv"
+_DAY_DIR = re.compile(r"\d{8}")
+_SHA256_HEX = re.compile(r"[0-9a-f]{64}")
 
 
 def hash_title(title: str) -> str:
     """제목을 SHA-256 해시로 변환"""
     return hashlib.sha256(title.encode('utf-8')).hexdigest()
 
-class DuplicateChecker:
 
-    def __init__(self):
-        self.__base_dir = "./data"
+def _today() -> str:
+    return datetime.now().strftime("%Y%m%d")
 
-    def is_file_exist(self, file_name: str):
-        """이미 저장된 파일(제목)이 없으면 파일 저장 경로 리턴"""
-        today = datetime.now().strftime("%Y%m%d")
-        yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y%m%d")
 
-        today_file_path = os.path.join(self.__base_dir, today, file_name)
-        yesterday_file_path = os.path.join(self.__base_dir, yesterday, file_name)
+def _yesterday() -> str:
+    return (datetime.now() - timedelta(days=1)).strftime("%Y%m%d")
 
-        if os.path.exists(today_file_path) or os.path.exists(yesterday_file_path):
-            return None
-        else:
-            return today_file_path
 
+class DuplicateChecker:
+    """어제/오늘 수집한 제목과 전송한 시그널의 중복 여부 저장소.
+
+    해시 -> 마지막 기록일(YYYYMMDD)을 메모리 dict로 유지하고, 기록은 append-only
+    저널 파일 한 개(./data/dedup_journal.tsv)에 남긴다. 시작 시와 날짜가 바뀔 때
+    이틀이 지난 항목을 버리고 저널을 다시 쓴다. 예전의 ./data/YYYYMMDD/<sha256>.txt
+    파일은 저널이 없을 때 한 번만 가져오고 삭제한다.
+    """
+
+    def __init__(self, base_dir: str = "./data"):
+        self.__base_dir = base_dir
+        self._journal_path = os.path.join(base_dir, _JOURNAL_NAME)
+        self._seen: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._day = _today()
+
+        os.makedirs(base_dir, exist_ok=True)
+        if os.path.exists(self._journal_path):
+            self._load_journal()
+        else:
+            self._migrate_legacy_files()
+        self._compact()
+
+    def _is_live(self, day: str) -> bool:
+        return day >= _yesterday()
+
+    def _load_journal(self) -> None:
+        with open(self._journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                day, _, digest = line.rstrip("\n").partition("\t")
+                if digest and self._is_live(day):
+                    self._seen[digest] = max(day, self._seen.get(digest, day))
+        logger.info("[dedup] journal loaded: %d live entries", len(self._seen))
+
+    def _migrate_legacy_files(self) -> None:
+        """파일 기반 중복 기록(./data/YYYYMMDD/<sha256>.txt)을 저널로 옮기고 파일은 삭제."""
+        migrated = removed = 0
+        for day in sorted(os.listdir(self.__base_dir)):
+            day_dir = os.path.join(self.__base_dir, day)
+            if not (_DAY_DIR.fullmatch(day) and os.path.isdir(day_dir)):
+                continue
+            for file_name in os.listdir(day_dir):
+                digest = file_name.removesuffix(".txt")
+                if not (file_name.endswith(".txt") and _SHA256_HEX.fullmatch(digest)):
+                    continue
+                if self._is_live(day):
+                    self._seen[digest] = max(day, self._seen.get(digest, day))
+                    migrated += 1
+                os.remove(os.path.join(day_dir, file_name))
+                removed += 1
+            if not os.listdir(day_dir):
+                os.rmdir(day_dir)
+        if removed:
+            logger.info("[dedup] migrated %d live entries from %d legacy files", migrated, removed)
+
+    def _compact(self) -> None:
+        """만료 항목을 제외하고 저널을 다시 쓴다."""
+        self._seen = {digest: day for digest, day in self._seen.items() if self._is_live(day)}
+        tmp_path = f"{self._journal_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(f"{day}\t{digest}\n" for digest, day in self._seen.items())
+        os.replace(tmp_path, self._journal_path)
+
+    def _roll_day(self) -> None:
+        today = _today()
+        if today != self._day:
+            self._day = today
+            self._compact()
+
+    def _is_seen(self, digest: str) -> bool:
+        day = self._seen.get(digest)
+        return day is not None and self._is_live(day)
+
+    def _record(self, digests: list[str]) -> None:
+        today = _today()
+        with open(self._journal_path, "a", encoding="utf-8") as f:
+            for digest in digests:
+                self._seen[digest] = today
+                f.write(f"{today}\t{digest}\n")
 
     def check(self, title_list: List[str]) -> Dict:
-        """어제/오늘 동일한 제목이 수집되어 있는지 확인"""
-        result_dict = {"new": {}, "duplicate": {}}
-        for title in title_list:
-            file_name = f"{hash_title(title)}.txt"
-            file_path = self.is_file_exist(file_name)
+        """어제/오늘 동일한 제목이 수집되어 있는지 확인.
 
-            if file_path:
-                result_dict["new"][title] = file_path
-            else:
-                result_dict["duplicate"][title] = file_path
+        Returns:
+            {"new": {title: 제목 해시}, "duplicate": {title: None}}
+            신규 제목은 처리가 끝난 뒤 mark_seen()으로 기록한다.
+        """
+        result_dict = {"new": {}, "duplicate": {}}
+        with self._lock:
+            self._roll_day()
+            for title in title_list:
+                digest = hash_title(title)
+                if self._is_seen(digest):
+                    result_dict["duplicate"][title] = None
+                else:
+                    result_dict["new"][title] = digest
 
         return result_dict
 
+    def mark_seen(self, title_list: List[str]) -> None:
+        """처리한 제목을 기록 — 이후 check()에서 중복으로 판정된다."""
+        with self._lock:
+            self._roll_day()
+            self._record([hash_title(title) for title in title_list])
 
     def check_signal_duplicate(self, symbol: str, signal_type: str) -> bool:
         """같은 날 동일 종목+시그널이 이미 발생했는지 확인"""
         key = f"signal_{symbol}_{signal_type}"
-        file_name = f"{hash_title(key)}.txt"
-        return self.is_file_exist(file_name) is None
+        with self._lock:
+            self._roll_day()
+            return self._is_seen(hash_title(key))
 
     def mark_signal_sent(self, symbol: str, signal_type: str) -> None:
         """시그널 전송 기록"""
-        from utils.file_ctrl import save_file
-
         key = f"signal_{symbol}_{signal_type}"
-        file_name = f"{hash_title(key)}.txt"
-        file_path = self.is_file_exist(file_name)
-        if file_path:
-            save_file(file_path=file_path, title=key)
+        digest = hash_title(key)
+        with self._lock:
+            self._roll_day()
+            if not self._is_seen(digest):
+                self._record([digest])
 
 
 def _cosine_similarity(a: list[float], b: list[float]) -> float:
@@ -74,11 +164,138 @@ def _cosine_similarity(a: list[float], b: list[float]) -> float:
     return dot / (norm_a * norm_b)
 
 
-def deduplicate_similar(items: List[dict], threshold: float = 0.85) -> List[dict]:
+def _normalize_rows(vectors: Sequence[Sequence[float]] | np.ndarray) -> np.ndarray:
+    """행 단위 L2 정규화. 노름이 0인 벡터는 0 벡터로 두어 유사도가 0이 되게 한다."""
+    matrix = np.asarray(vectors, dtype=np.float64)
+    if matrix.ndim != 2:
+        matrix = matrix.reshape(len(matrix), -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def select_dissimilar(
+    vectors: Sequence[Sequence[float]] | np.ndarray,
+    threshold: float,
+    block_size: int = _SIMILARITY_BLOCK,
+) -> list[int]:
+    """앞에서부터 순서대로 살려 둔 아이템과 유사도가 threshold 미만인 아이템의 인덱스 반환.
+
+    이전의 쌍별 비교와 같은 규칙(먼저 남은 아이템이 뒤의 유사 아이템을 제거)을
+    정규화 행렬의 블록 단위 행렬곱으로 계산한다. 메모리는 block_size² 수준으로 제한된다.
+    """
+    if len(vectors) == 0:
+        return []
+    unit = _normalize_rows(vectors)
+    n = len(unit)
+    kept: list[int] = []
+
+    for start in range(0, n, block_size):
+        block = unit[start : start + block_size]
+        dropped = np.zeros(len(block), dtype=bool)
+
+        # 이전 블록에서 살아남은 아이템과 비교
+        for k in range(0, len(kept), block_size):
+            kept_vecs = unit[kept[k : k + block_size]]
+            dropped |= (block @ kept_vecs.T >= threshold).any(axis=1)
+
+        # 블록 내부는 순서대로 greedy 처리
+        within = block @ block.T >= threshold
+        for i in range(len(block)):
+            if dropped[i]:
+                continue
+            kept.append(start + i)
+            dropped[i + 1 :] |= within[i, i + 1 :]
+
+    return kept
+
+
+class EmbeddingWindow:
+    """최근 N시간 동안 저장된 뉴스 임베딩의 인메모리 인덱스 (사이클 간 의미적 중복 제거용).
+
+    시작 시 NewsStore.get_news_for_clustering()으로 채우고, 이후 저장된 뉴스를 add()로
+    덧붙인다. 벡터는 정규화된 float32 행렬로 보관하며 hours가 지난 항목과
+    max_items를 넘는 오래된 항목은 자동으로 빠진다.
+    """
+
+    def __init__(self, hours: int = 24, max_items: int = 5000):
+        self.hours = hours
+        self.max_items = max_items
+        self._vectors: np.ndarray | None = None
+        self._times: np.ndarray = np.empty(0, dtype="datetime64[us]")
+        self._titles: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def load(self, news_store) -> int:
+        """DB에 저장된 최근 임베딩으로 초기화. 로드한 건수 반환."""
+        days = max(1, math.ceil(self.hours / 24))
+        rows = news_store.get_news_for_clustering(days=days, limit=self.max_items)
+        rows.sort(key=lambda r: r["collected_at"])  # 오래된 순으로 보관
+        if rows:
+            # 임베딩 차원이 바뀐 경우(모델 변경) add()와 같이 마지막 차원의 연속 구간만 남긴다
+            dim = len(rows[-1]["embedding"])
+            start = max((i + 1 for i, r in enumerate(rows) if len(r["embedding"]) != dim), default=0)
+            rows = rows[start:]
+            # 행마다 add()하면 매번 전체 행렬을 vstack하므로 한 번에 쌓고 정규화한다
+            self._vectors = _normalize_rows([r["embedding"] for r in rows]).astype(np.float32)
+            self._times = np.array([np.datetime64(r["collected_at"], "us") for r in rows], dtype="datetime64[us]")
+            self._titles = [r["title_original"] for r in rows]
+            self._expire()
+        logger.info("[dedup] embedding window loaded: %d items (last %dh)", len(self), self.hours)
+        return len(self)
+
+    def add(self, vectors: Sequence[Sequence[float]], titles: Sequence[str], when: datetime | None = None) -> None:
+        if len(vectors) == 0:
+            return
+        unit = _normalize_rows(vectors).astype(np.float32)
+        stamps = np.full(len(unit), np.datetime64(when or datetime.now(), "us"))
+        if self._vectors is None or len(self._vectors) == 0 or self._vectors.shape[1] != unit.shape[1]:
+            self._vectors, self._times, self._titles = unit, stamps, list(titles)
+        else:
+            self._vectors = np.vstack([self._vectors, unit])
+            self._times = np.concatenate([self._times, stamps])
+            self._titles.extend(titles)
+        self._expire()
+
+    def _expire(self) -> None:
+        cutoff = np.datetime64(datetime.now() - timedelta(hours=self.hours), "us")
+        keep = self._times >= cutoff
+        if len(keep) > self.max_items:
+            keep[: len(keep) - self.max_items] = False
+        if not keep.all():
+            self._vectors = self._vectors[keep]
+            self._times = self._times[keep]
+            self._titles = [t for t, k in zip(self._titles, keep) if k]
+
+    def match(self, vectors: Sequence[Sequence[float]], threshold: float) -> list[str | None]:
+        """각 벡터와 유사도가 threshold 이상인 저장 뉴스 제목 (없으면 None)."""
+        self._expire()
+        if self._vectors is None or len(self._vectors) == 0 or len(vectors) == 0:
+            return [None] * len(vectors)
+        unit = _normalize_rows(vectors).astype(np.float32)
+        if unit.shape[1] != self._vectors.shape[1]:
+            return [None] * len(vectors)
+
+        matches: list[str | None] = []
+        for start in range(0, len(unit), _SIMILARITY_BLOCK):
+            sims = unit[start : start + _SIMILARITY_BLOCK] @ self._vectors.T
+            best = sims.argmax(axis=1)
+            for row, col in enumerate(best):
+                matches.append(self._titles[col] if sims[row, col] >= threshold else None)
+        return matches
+
+
+def deduplicate_similar(
+    items: List[dict],
+    threshold: float = 0.85,
+    window: EmbeddingWindow | None = None,
+) -> List[dict]:
     """Embedding 기반 의미적 중복 제거. items는 cleaned_title 키를 가진 dict 리스트.
 
     OpenAI text-embedding-3-small으로 제목을 벡터화한 뒤 코사인 유사도를 계산.
-    threshold 이상인 쌍에서 뒤쪽(나중에 수집된) 아이템을 제거한다.
+    window가 있으면 먼저 최근 저장된 뉴스와 비교해 threshold 이상인 아이템을 제거하고,
+    남은 아이템끼리는 threshold 이상인 쌍에서 뒤쪽(나중에 수집된) 아이템을 제거한다.
     살아남은 각 아이템 dict에 "embedding" 키로 벡터를 첨부하여 반환 — DB 저장에 재사용.
     OPENAI_API_KEY가 없으면 중복 제거 없이 원본 반환.
     """
@@ -104,22 +321,22 @@ def deduplicate_similar(items: List[dict], threshold: float = 0.85) -> List[dict
         logger.warning("[dedup] Embedding API error, skipping dedup: %s", e)
         return items
 
-    removed: set[int] = set()
-    for i in range(len(items)):
-        if i in removed:
-            continue
-        for j in range(i + 1, len(items)):
-            if j in removed:
-                continue
-            sim = _cosine_similarity(vectors[i], vectors[j])
-            if sim >= threshold:
-                removed.add(j)
+    candidates = list(range(len(items)))
+    if window is not None and len(window):
+        matches = window.match(vectors, threshold)
+        for idx, matched in enumerate(matches):
+            if matched is not None:
+                logger.debug("[dedup] %s ~ stored: %s", items[idx]["cleaned_title"][:60], matched[:60])
+        candidates = [idx for idx, matched in enumerate(matches) if matched is None]
+        if len(candidates) < len(items):
+            logger.info("[dedup] removed %d items similar to recent stored news", len(items) - len(candidates))
 
     kept = []
-    for idx, item in enumerate(items):
-        if idx not in removed:
-            item["embedding"] = vectors[idx]
-            kept.append(item)
+    for pos in select_dissimilar([vectors[i] for i in candidates], threshold):
+        idx = candidates[pos]
+        item = items[idx]
+        item["embedding"] = vectors[idx]
+        kept.append(item)
 
     n_removed = len(items) - len(kept)
     if n_removed: